@@ -0,0 +1,108 @@
+import unittest
+import sympy as sp
+from tsteno.kernel.kernel import Kernel
+from tsteno.kernel.kexts.optimizer import HoistedNode, LoopNode
+from tsteno.language.ast import Node
+
+kernel = Kernel()
+evaluation = kernel.get_kext('eval')
+optimizer = kernel.get_kext('optimizer')
+
+
+def optimize(code):
+    tokens = list(evaluation.tokenizer.get_tokens(code))
+    return optimizer.optimize(list(evaluation.parser.get_nodes(tokens)))
+
+
+class TestOptimizer(unittest.TestCase):
+    def tearDown(self):
+        evaluation.clear()
+        for option_name in optimizer.enabled_stages:
+            optimizer.set_stage_enabled(option_name, True)
+
+    def test_constantFolding(self):
+        nodes = optimize('2 Pi / 360')
+
+        self.assertEqual(nodes[0], sp.pi / 180)
+
+    def test_constantFoldingKeepsVariables(self):
+        nodes = optimize('x + Sin[2 Pi / 360]')
+
+        self.assertIsInstance(nodes[0], Node)
+        self.assertIn(sp.sin(sp.pi / 180), nodes[0].childrens)
+
+    def test_constantFoldingUserDefinitions(self):
+        # Redefined constants and modules can't be folded.
+        nodes = optimize('Pi = 3; 2 Pi')
+        self.assertIsInstance(nodes[1], Node)
+
+        evaluation.evaluate_code('Pi = 3;')
+        self.assertIsInstance(optimize('2 Pi')[0], Node)
+
+    def test_hashConsing(self):
+        nodes = optimize('{Sin[x] + 1, Sin[x] + 1}')
+        first, second = nodes[0].childrens
+
+        self.assertIs(first, second)
+
+    def test_loopInvariantHoisting(self):
+        nodes = optimize('Table[Sin[a] * i, {i, 1, 3}]')
+        table = nodes[0]
+
+        self.assertIsInstance(table, LoopNode)
+        self.assertEqual(len(table.hoisted), 1)
+        self.assertIsInstance(table.hoisted[0], HoistedNode)
+        self.assertEqual(table.hoisted[0].head, 'Sin')
+
+        a = sp.Symbol('a')
+        self.assertEqual(
+            evaluation.evaluate_code('Table[Sin[a] * i, {i, 1, 3}]'),
+            [sp.sin(a), 2 * sp.sin(a), 3 * sp.sin(a)]
+        )
+
+    def test_loopInvariantHoistingAssignments(self):
+        # `k` is modified by the loop, so `k + 1` is not invariant.
+        nodes = optimize('k = 0; While[k < 3, k = k + 1]')
+        self.assertNotIsInstance(nodes[1], LoopNode)
+
+        self.assertEqual(
+            evaluation.evaluate_code(
+                'k = 0; s = 0; While[k < 3, k++; s = s + 2 k]; Return[s]'),
+            12
+        )
+
+    def test_loopInvariantHoistingClear(self):
+        # `Clear` unbinds `y`, so `y + 1` is not invariant.
+        self.assertEqual(
+            evaluation.evaluate_code(
+                'y = 1; r = {}; Do[AppendTo[r, y + 1]; Clear[y], {i, 1, 2}]; '
+                'Return[r]'),
+            [2, sp.Symbol('y') + 1]
+        )
+
+    def test_loopInvariantHoistingIsReset(self):
+        self.assertEqual(
+            evaluation.evaluate_code(
+                'For[j = 1, j < 4, j++, '
+                'r = Table[2 j, {i, 1, 2}]]; Return[r]'),
+            [6, 6]
+        )
+
+    def test_toggleStages(self):
+        optimizer.set_stage_enabled('constant_folding', False)
+        self.assertIsInstance(optimize('2 Pi / 360')[0], Node)
+
+        optimizer.set_stage_enabled('loop_invariant_hoisting', False)
+        self.assertNotIsInstance(
+            optimize('Table[Sin[a] * i, {i, 1, 3}]')[0], LoopNode)
+
+        optimizer.set_stage_enabled('hash_consing', False)
+        first, second = optimize('{Sin[x] + 1, Sin[x] + 1}')[0].childrens
+        self.assertIsNot(first, second)
+
+        self.assertRaises(
+            Exception, optimizer.set_stage_enabled, 'unknown', False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -60,6 +60,42 @@ class TestTokenizer(unittest.TestCase):
         self.assertEqual(product.childrens[0], 2)
         self.assertEqual(product.childrens[1], 3)
 
+    def test_flattenAssociativeOps(self):
+        global tokenizer, parser
+        tokens = tokenizer.get_tokens("1+2*3*4+(5+6)")
+        nodes = list(parser.get_nodes(list(tokens)))
+        one_node = nodes[0]
+
+        self.assertEqual(one_node.head, 'Plus')
+        self.assertEqual(len(one_node.childrens), 4)
+        self.assertEqual(one_node.childrens[0], 1)
+        self.assertEqual(one_node.childrens[2], 5)
+        self.assertEqual(one_node.childrens[3], 6)
+
+        product = one_node.childrens[1]
+        self.assertEqual(product.head, 'Product')
+        self.assertEqual(list(product.childrens), [2, 3, 4])
+
+    def test_flattenLongChain(self):
+        global tokenizer, parser
+        code = "+".join("{} x^{}".format(k, k) for k in range(5000))
+        tokens = tokenizer.get_tokens(code)
+        nodes = list(parser.get_nodes(list(tokens)))
+        one_node = nodes[0]
+
+        self.assertEqual(one_node.head, 'Plus')
+        self.assertEqual(len(one_node.childrens), 5000)
+        self.assertEqual(one_node.childrens[10].head, 'Product')
+
+    def test_noFlattenMinus(self):
+        global tokenizer, parser
+        tokens = tokenizer.get_tokens("1-2-3")
+        nodes = list(parser.get_nodes(list(tokens)))
+        one_node = nodes[0]
+
+        self.assertEqual(one_node.head, 'Minus')
+        self.assertEqual(one_node.childrens[0].head, 'Minus')
+
     def test_parsePow(self):
         global tokenizer, parser
         tokens = tokenizer.get_tokens("1^2")
@@ -107,6 +143,40 @@ class TestTokenizer(unittest.TestCase):
         node_list = nodes[0]
         self.assertEqual(node_list.head, 'Set')
 
+    def test_replaceRepeated(self):
+        global tokenizer, parser
+
+        tokens = list(tokenizer.get_tokens("a //. a -> b"))
+        nodes = list(parser.get_nodes(tokens))
+
+        node = nodes[0]
+        self.assertEqual(node.head, 'ReplaceRepeated')
+        self.assertEqual(node.childrens[1].head, 'Rule')
+
+        tokens = list(tokenizer.get_tokens("a / b"))
+        nodes = list(parser.get_nodes(tokens))
+        self.assertEqual(nodes[0].head, 'Div')
+
+    def test_association(self):
+        global tokenizer, parser
+
+        tokens = list(tokenizer.get_tokens('<|"a" -> 1, b -> 2|>'))
+        nodes = list(parser.get_nodes(tokens))
+
+        node = nodes[0]
+        self.assertEqual(node.head, 'Association')
+        self.assertEqual(len(node.childrens), 2)
+        self.assertEqual(node.childrens[0].head, 'Rule')
+
+    def test_noArguments(self):
+        global tokenizer, parser
+
+        tokens = list(tokenizer.get_tokens("f[]"))
+        nodes = list(parser.get_nodes(tokens))
+
+        self.assertEqual(nodes[0].head, 'f')
+        self.assertEqual(len(nodes[0].childrens), 0)
+
     def test_doubleFn(self):
         global tokenizer, parser
 
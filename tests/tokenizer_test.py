@@ -81,6 +81,19 @@ class TestTokenizer(unittest.TestCase):
         self.assertEqual(tokens[0].get_type(), token_list.TOKEN_STRING)
         self.assertEqual(tokens[0].get_value(), 'Hola mundo, "Como estais"')
 
+    def test_parseAssociation(self):
+        tokens = list(tokenizer.get_tokens('<|a -> 1|> < 2'))
+
+        self.assertEqual(len(tokens), 8)
+
+        self.assertEqual(
+            tokens[0].get_type(), token_list.TOKEN_LEFTASSOCIATION)
+        self.assertEqual(
+            tokens[5].get_type(), token_list.TOKEN_RIGHTASSOCIATION)
+
+        self.assertEqual(tokens[6].get_type(), token_list.TOKEN_OP)
+        self.assertEqual(tokens[6].get_value(), '<')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,114 @@
+"""
+Contains arithmetic sequence atom.
+"""
+import math
+import numpy as np
+from .sequence import Sequence
+
+FLOAT_LENGTH_TOLERANCE = 1e-10
+""" Relative tolerance for inexact bounds, Range[0, 1, 0.1] ends at 1 """
+
+
+class ArithmeticSequence(Sequence):
+    """
+    Lazy list of numbers start, start + step, start + 2 step... Items are
+    computed when accessed, so length, item and slice access is O(1) and
+    memory use is constant.
+    """
+    __slots__ = ('start', 'step', 'length')
+
+    def __init__(self, start, step, length):
+        """
+        Parameters:
+            - ** start ** - First item.
+            - ** step ** - Difference between consecutive items.
+            - ** length ** - Number of items.
+        """
+        self.start = start
+        self.step = step
+        self.length = length
+
+    @classmethod
+    def from_bounds(cls, start, stop, step=1):
+        """
+        Return:
+            - Sequence from start to stop (both included, when reached).
+        """
+        if step == 0:
+            raise Exception('Range: step can\'t be zero')
+
+        inexact = any(isinstance(value, float) for value in (start, stop, step))
+
+        try:
+            if all(isinstance(value, int) for value in (start, stop, step)):
+                steps = (stop - start) // step
+            else:
+                steps = (stop - start) / step
+                if inexact:
+                    steps += FLOAT_LENGTH_TOLERANCE * max(1, abs(steps))
+
+            length = max(0, math.floor(steps) + 1)
+
+            if inexact:
+                # Items are inexact when any bound is (Range[3.] is {1., 2., 3.})
+                start, step = float(start), float(step)
+        except TypeError:
+            raise Exception('Range: `{}`, `{}` and `{}` are not numbers'.format(
+                start, stop, step))
+
+        return cls(start, step, length)
+
+    def item(self, index):
+        return self.start + index * self.step
+
+    def __array__(self, dtype=None, copy=None):
+        array = self.start + self.step * np.arange(self.length)
+        if dtype is not None:
+            return array.astype(dtype)
+        return array
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            indices = range(self.length)[index]
+            return ArithmeticSequence(
+                self.item(indices.start), self.step * indices.step,
+                len(indices))
+
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('Index {} out of range'.format(index))
+
+        return self.item(index)
+
+    def __iter__(self):
+        if type(self.start) is int and type(self.step) is int:
+            return iter(range(
+                self.start, self.start + self.step * self.length, self.step))
+
+        return (self.item(index) for index in range(self.length))
+
+    def __contains__(self, value):
+        try:
+            index = (value - self.start) / self.step
+        except TypeError:
+            return False
+
+        try:
+            return index == int(index) and 0 <= index < self.length
+        except TypeError:
+            # Symbolic value
+            return False
+
+    def __eq__(self, other):
+        if isinstance(other, ArithmeticSequence):
+            return self.length == other.length and (self.length == 0 or (
+                self.start == other.start and
+                (self.length == 1 or self.step == other.step)))
+
+        return super().__eq__(other)
+
+    __hash__ = None
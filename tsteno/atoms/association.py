@@ -0,0 +1,137 @@
+"""
+Contains association atom.
+"""
+from sympy import mathematica_code as mcode
+from .atoms import Atoms
+from .hashing import structural_key
+from .rule import RuleSet
+from .sequence import Sequence
+
+
+class Association(Atoms):
+    """
+    Map of keys to values, `<|key1 -> value1, key2 -> value2|>`. Items are
+    kept in insertion order, in a dictionary by structural key of their
+    keys, and values are counted by structural key too, so key and value
+    lookups are O(1).
+    """
+    __slots__ = ('entries', 'value_counts')
+
+    def __init__(self, items=()):
+        """
+        Parameters:
+            - **items** - Iterable of (key, value) pairs, last value of a
+            repeated key is kept.
+        """
+        self.entries = {}
+        """ (key, value) pairs by structural key of key """
+
+        self.value_counts = {}
+        """ Number of items by structural key of value """
+
+        for key, value in items:
+            self.set(key, value)
+
+    def set(self, key, value):
+        item_key = structural_key(key)
+        if item_key in self.entries:
+            self.forget_value(self.entries[item_key][1])
+
+        self.entries[item_key] = (key, value)
+
+        value_key = structural_key(value)
+        self.value_counts[value_key] = self.value_counts.get(value_key, 0) + 1
+
+    def update(self, rules):
+        """
+        Add rules (a rule, list of rules or association), replacing values
+        of existing keys.
+        """
+        if isinstance(rules, Association):
+            items = rules.entries.values()
+        elif isinstance(rules, RuleSet):
+            items = rules.items()
+        elif isinstance(rules, (list, Sequence)):
+            for rule in rules:
+                self.update(rule)
+            return
+        else:
+            raise Exception('`{}` is not a rule'.format(rules))
+
+        for key, value in items:
+            self.set(key, value)
+
+    def pop(self, key):
+        """
+        Remove key, if it exists.
+        """
+        item = self.entries.pop(structural_key(key), None)
+        if item is not None:
+            self.forget_value(item[1])
+
+    def forget_value(self, value):
+        value_key = structural_key(value)
+        count = self.value_counts[value_key] - 1
+
+        if count:
+            self.value_counts[value_key] = count
+        else:
+            del self.value_counts[value_key]
+
+    def get(self, key, default=None):
+        item = self.entries.get(structural_key(key))
+        return default if item is None else item[1]
+
+    def has_key(self, key):
+        return structural_key(key) in self.entries
+
+    def has_value(self, value):
+        return structural_key(value) in self.value_counts
+
+    def keys(self):
+        return [key for key, _ in self.entries.values()]
+
+    def values(self):
+        return [value for _, value in self.entries.values()]
+
+    def copy(self):
+        association = Association()
+        association.entries = dict(self.entries)
+        association.value_counts = dict(self.value_counts)
+        return association
+
+    def get_structural_key(self):
+        return ('Association', tuple(
+            (key, structural_key(value))
+            for key, (_, value) in self.entries.items()))
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        # Like Mathematica, associations behave as lists of their values
+        return (value for _, value in self.entries.values())
+
+    def __eq__(self, other):
+        if not isinstance(other, Association):
+            return NotImplemented
+
+        return self.get_structural_key() == other.get_structural_key()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '<|' + ', '.join(
+            '{} -> {}'.format(to_code(key), to_code(value))
+            for key, value in self.entries.values()
+        ) + '|>'
+
+
+def to_code(value):
+    if isinstance(value, str):
+        return '"{}"'.format(value)
+
+    if isinstance(value, Association):
+        return repr(value)
+
+    return str(mcode(value))
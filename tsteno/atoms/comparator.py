@@ -36,7 +36,7 @@ class Comparator(Atoms):
         """
         Shortcut to eval()
         """
-        return self.eval()
+        return bool(self.eval())
 
     def __repr__(self):
         return str(self.eval()).capitalize()
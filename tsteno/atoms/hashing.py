@@ -0,0 +1,56 @@
+"""
+Structural hashing of atoms.
+
+Sympy expressions are already hashed by structure, lists and other atoms
+are converted to hashable keys so two values with the same structure have
+the same key. Exact numbers, inexact numbers and booleans have different
+keys, even if they compare equal in Python (`1`, `1.0` and `True`).
+"""
+import numpy as np
+import sympy as sp
+from .rule import RuleSet
+from .sequence import Sequence
+
+BOOLEAN_TYPES = (bool, np.bool_)
+""" Native booleans, keyed apart from integers """
+
+INEXACT_TYPES = (float, complex, np.inexact, sp.Float)
+""" Inexact numbers, keyed apart from exact ones """
+
+
+def structural_key(value):
+    """
+    Return:
+        - Hashable key, equal for structurally equal values.
+    """
+    if isinstance(value, BOOLEAN_TYPES):
+        return ('Boolean', bool(value))
+
+    if isinstance(value, INEXACT_TYPES):
+        return ('Inexact', value)
+
+    if isinstance(value, (list, Sequence)):
+        return ('List', tuple(structural_key(item) for item in value))
+
+    if isinstance(value, np.ndarray):
+        # Same key as the equal list of native numbers
+        return structural_key(value.tolist())
+
+    if isinstance(value, RuleSet):
+        return ('Rule', tuple(
+            (key, structural_key(item))
+            for key, item in value.rules_dict.items()))
+
+    if hasattr(value, 'get_structural_key'):
+        return value.get_structural_key()
+
+    if hasattr(value, 'get_sympy'):
+        return value.get_sympy()
+
+    try:
+        hash(value)
+    except TypeError:
+        # Opaque values are only equal to themselves.
+        return ('Id', id(value))
+
+    return value
@@ -0,0 +1,71 @@
+"""
+Represent an approximate function built from samples (NDSolve solutions).
+"""
+import numpy as np
+
+
+class InterpolatingFunction:
+    """
+    Piecewise cubic Hermite interpolation of a function from its values and
+    derivatives on an ascending grid. Outside the grid domain the nearest
+    piece is extrapolated.
+    """
+    __slots__ = ('x', 'y', 'dy')
+
+    def __init__(self, x, y, dy):
+        """
+        Parameters:
+            - **x** - Ascending grid points.
+            - **y** - Function values on grid points.
+            - **dy** - Function derivatives on grid points.
+        """
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y)
+        self.dy = np.asarray(dy)
+
+    def get_domain(self):
+        return self.x[0], self.x[-1]
+
+    def sample(self, points):
+        """
+        Evaluate function in several points at once.
+
+        Parameters:
+            - **points** - Array of points.
+
+        Return:
+            - Numpy array of values.
+        """
+        points = np.asarray(points, dtype=float)
+
+        if len(self.x) == 1:
+            return np.full(points.shape, self.y[0])
+
+        index = np.clip(
+            np.searchsorted(self.x, points, side='right') - 1,
+            0, len(self.x) - 2
+        )
+
+        x0 = self.x[index]
+        h = self.x[index + 1] - x0
+        s = (points - x0) / h
+
+        s2 = s * s
+        s3 = s2 * s
+
+        h00 = 2 * s3 - 3 * s2 + 1
+        h10 = s3 - 2 * s2 + s
+        h01 = -2 * s3 + 3 * s2
+        h11 = s3 - s2
+
+        return h00 * self.y[index] + h10 * h * self.dy[index] + \
+            h01 * self.y[index + 1] + h11 * h * self.dy[index + 1]
+
+    def __call__(self, point):
+        value = self.sample(np.asarray([point]))[0]
+
+        return value.item() if isinstance(value, np.generic) else value
+
+    def __repr__(self):
+        x0, x1 = self.get_domain()
+        return 'InterpolatingFunction[{{{{{}, {}}}}}, <>]'.format(x0, x1)
@@ -2,7 +2,9 @@
 Represent basic Tungsteno Language modules representation
 """
 
+import numpy as np
 from .atoms import Atoms
+from .sequence import Sequence
 
 ARG_FLAG_OPTIONAL = 1 << 1
 """ Specify if given argument is optional """
@@ -22,6 +24,12 @@ ARG_FLAG_RETURN_VAR_NAME = 1 << 5
 ARG_FLAG_ALLOW_APPLY = 1 << 6
 """ If variable is a list, apply to all elements individually """
 
+ARG_FLAG_CONDITION = 1 << 7
+"""
+Specify if argument is a condition, it's evaluated directly to a boolean
+(numeric comparisons don't build a `Comparator`)
+"""
+
 
 class ModuleArg:
     """
@@ -111,7 +119,7 @@ class Module(Atoms):
                 continue
 
             if module_arg.get_flag() & ARG_FLAG_OPTIONAL != 0 and \
-                    i >= argssize:
+                    users_args_counter >= argssize:
                 break
 
             if module_arg.get_flag() & ARG_FLAG_ALL_NEXT != 0:
@@ -119,7 +127,7 @@ class Module(Atoms):
                     module_arg, arg, context), arguments[users_args_counter:]
                 ))
 
-            if i >= argssize:
+            if users_args_counter >= argssize:
                 raise Exception(
                     "Expected but {} arguments but {} given".format(
                         len(module_args), argssize
@@ -148,36 +156,87 @@ class Module(Atoms):
             - Return one pythonic parsed argument.
         """
 
-        eval = self.get_kernel().get_kext('eval')
+        flag = module_arg.get_flag()
 
-        if module_arg.get_flag() & ARG_FLAG_RETURN_VAR_NAME != 0:
+        if flag & ARG_FLAG_RETURN_VAR_NAME != 0:
             context.set_no_var_mode(1)
 
-        if module_arg.get_flag() & ARG_FLAG_NO_AUTO_EVAL == 0:
-            if isinstance(user_arg, list):
-                def eval_fn(args, context):
-                    return list(map(lambda arg: eval.evaluate_node(
-                        arg, context
-                    ), args))[-1]
-            else:
-                eval_fn = eval.evaluate_node
+        result = self.get_evaluator(flag, user_arg)(user_arg, context)
+
+        if flag & ARG_FLAG_RETURN_VAR_NAME != 0:
+            context.set_no_var_mode(0)
+
+        if flag & ARG_FLAG_ALLOW_APPLY != 0:
+            return self.to_multivalue(result)
+
+        return result
+
+    def get_evaluator(self, flag, user_arg):
+        """
+        Parameters:
+            - **flag** - Argument child class configuration flag.
+            - **user_arg** - Argument from user input, a node or a list of
+            nodes (compound expression).
+
+        Return:
+            - Function of the user argument and the context, that gives the
+            parsed argument.
+        """
+        eval = self.get_kernel().get_kext('eval')
+
+        if flag & ARG_FLAG_CONDITION != 0:
+            evaluate_node = eval.evaluate_condition
         else:
-            if isinstance(user_arg, list):
-                def eval_fn(args, context):
-                    return lambda ctx=context: list(
-                        map(lambda arg: eval.evaluate_node(arg, ctx), args))[-1]
-            else:
-                def eval_fn(args, context):
-                    return lambda ctx=context: eval.evaluate_node(
-                        args, ctx
-                    )
+            evaluate_node = eval.evaluate_node
 
-        result = eval_fn(user_arg, context)
+        if flag & ARG_FLAG_NO_AUTO_EVAL != 0:
+            return self.get_delayed_evaluator(evaluate_node, user_arg)
 
-        if module_arg.get_flag() & ARG_FLAG_RETURN_VAR_NAME != 0:
-            context.set_no_var_mode(0)
+        if not isinstance(user_arg, list):
+            return evaluate_node
+
+        def eval_fn(args, context):
+            for arg in args[:-1]:
+                eval.evaluate_node(arg, context)
+            return evaluate_node(args[-1], context)
+
+        return eval_fn
+
+    def get_delayed_evaluator(self, evaluate_node, user_arg):
+        """
+        Return:
+            - Function of the user argument and the context, that gives an
+            executable lambda function for `ARG_FLAG_NO_AUTO_EVAL`.
+        """
+        eval = self.get_kernel().get_kext('eval')
+
+        if isinstance(user_arg, list):
+            def eval_fn(args, context):
+                def evaluate_all(ctx=context):
+                    for arg in args[:-1]:
+                        eval.evaluate_node(arg, ctx)
+                    return evaluate_node(args[-1], ctx)
+                evaluate_all.node = args
+                return evaluate_all
+        else:
+            def eval_fn(args, context):
+                def evaluate_one(ctx=context):
+                    return evaluate_node(args, ctx)
+                # Unevaluated node, to analyze it (`is_pure_expression`)
+                evaluate_one.node = args
+                return evaluate_one
 
-        if module_arg.get_flag() & ARG_FLAG_ALLOW_APPLY != 0 and isinstance(result, list):
+        return eval_fn
+
+    def to_multivalue(self, result):
+        """
+        Return:
+            - Lists wrapped in `UserArgMultiValue` (`ARG_FLAG_ALLOW_APPLY`),
+            other results as they are.
+        """
+        if isinstance(result, (Sequence, np.ndarray)):
+            result = result.tolist()
+        if isinstance(result, list):
             return UserArgMultiValue(result)
 
         return result
@@ -198,6 +257,73 @@ class Module(Atoms):
 
         return prop_dict
 
+    def apply(self, values, context):
+        """
+        Run module with already evaluated values, skipping argument parsing.
+        Used to apply the same module many times (`Nest`, `Fold`...).
+
+        Parameters:
+            - **values** - List of evaluated arguments.
+            - **context** - Represent local context to execute function.
+
+        Return:
+            - Function execution result.
+        """
+        fargs, flags = self.apply_arguments(values, context)
+
+        for k, (farg, flag) in enumerate(zip(fargs, flags)):
+            if flag & ARG_FLAG_ALLOW_APPLY != 0 and \
+                    isinstance(farg, (list, Sequence, np.ndarray)):
+                fargs[k] = UserArgMultiValue(list(farg))
+                return self.run_multivalue(k, fargs)
+
+        return self.run(*fargs)
+
+    def apply_arguments(self, values, context):
+        """
+        Match evaluated values with module arguments.
+
+        Return:
+            - Tuple with the list of python arguments and the list of the
+            flags of each one.
+        """
+        fargs = []
+        flags = []
+        position = 0
+
+        for module_arg in self.get_arguments():
+            flag = module_arg.get_flag()
+
+            if flag == ARG_FLAG_SPECIAL_CONTEXT:
+                fargs.append(context)
+                flags.append(flag)
+                continue
+
+            if flag & ARG_FLAG_OPTIONAL != 0 and position >= len(values):
+                break
+
+            if flag & ARG_FLAG_ALL_NEXT != 0:
+                arguments = values[position:]
+            elif position < len(values):
+                arguments = values[position:position + 1]
+            else:
+                raise Exception(
+                    "Expected but {} arguments but {} given".format(
+                        len(self.get_arguments()), len(values)
+                    ))
+
+            for value in arguments:
+                if flag & ARG_FLAG_NO_AUTO_EVAL != 0:
+                    value = (lambda value: lambda ctx=None: value)(value)
+                fargs.append(value)
+                flags.append(flag)
+            position += len(arguments)
+
+            if flag & ARG_FLAG_ALL_NEXT != 0:
+                break
+
+        return fargs, flags
+
     def run_multivalue(self, idxmultivalue, fargs):
         results = []
         multivalue_array = fargs[idxmultivalue].get_multival()
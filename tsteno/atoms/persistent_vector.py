@@ -0,0 +1,90 @@
+"""
+Contains persistent vector atom.
+"""
+from itertools import islice
+from .sequence import Sequence
+
+
+class PersistentVector(Sequence):
+    """
+    Immutable list with amortized O(1) appends and prepends.
+
+    Items are kept in two growable buffers, front (reversed) and back,
+    shared between vectors. Each vector only sees the first `front_length`
+    and `back_length` items of them, so appending to the newest vector
+    grows the shared buffer in place, and appending to an older one copies
+    the visible part first.
+    """
+    __slots__ = ('front', 'front_length', 'back', 'back_length')
+
+    def __init__(self, items=()):
+        """
+        Parameters:
+            - ** items ** - Initial items (copied).
+        """
+        self.front = []
+        self.front_length = 0
+        self.back = list(items)
+        self.back_length = len(self.back)
+
+    @classmethod
+    def view(cls, front, front_length, back, back_length):
+        vector = cls.__new__(cls)
+        vector.front = front
+        vector.front_length = front_length
+        vector.back = back
+        vector.back_length = back_length
+        return vector
+
+    def append(self, item):
+        """
+        Return:
+            - New vector with item at the end.
+        """
+        back = self.back
+        if len(back) != self.back_length:
+            back = back[:self.back_length]
+        back.append(item)
+
+        return PersistentVector.view(
+            self.front, self.front_length, back, self.back_length + 1)
+
+    def prepend(self, item):
+        """
+        Return:
+            - New vector with item at the beginning.
+        """
+        front = self.front
+        if len(front) != self.front_length:
+            front = front[:self.front_length]
+        front.append(item)
+
+        return PersistentVector.view(
+            front, self.front_length + 1, self.back, self.back_length)
+
+    def tolist(self):
+        return self.front[:self.front_length][::-1] + \
+            self.back[:self.back_length]
+
+    def __len__(self):
+        return self.front_length + self.back_length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.tolist()[index]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Index {} out of range'.format(index))
+
+        if index < self.front_length:
+            return self.front[self.front_length - 1 - index]
+
+        return self.back[index - self.front_length]
+
+    def __iter__(self):
+        if self.front_length:
+            yield from self.front[self.front_length - 1::-1]
+
+        yield from islice(self.back, self.back_length)
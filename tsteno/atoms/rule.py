@@ -9,17 +9,31 @@ class RuleSet(Atoms):
     """
     Represent a set of rules
     """
-    __slots__ = ['__kernel', 'rules_dict']
+    __slots__ = ['__kernel', 'rules_dict', 'keys']
 
-    def __init__(self, kernel, rules_dict):
+    def __init__(self, kernel, rules_dict, keys=None):
         """
         Initialize a new RuleSet from kernel and dict.
         Parameters:
             - **kernel** - Represent Tungsteno kernel.
             - **rules_dict** - Represnet a dictionary with rules definition
+            - **keys** - Original keys by rules_dict key, if they aren't
+            strings (optional).
         """
         super().__init__(kernel)
         self.rules_dict = rules_dict
+        self.keys = keys
+
+    def items(self):
+        """
+        Return:
+            - List of rules, as (original key, value) pairs.
+        """
+        keys = self.keys or {}
+        return [
+            (keys.get(key, key), value)
+            for key, value in self.rules_dict.items()
+        ]
 
     def __getitem__(self, x):
         if not isinstance(x, str):
@@ -0,0 +1,35 @@
+"""
+Contains sequence super class.
+"""
+import numpy as np
+from .atoms import Atoms
+
+
+class Sequence(Atoms):
+    """
+    Sequence super class, used to abstract list atoms that aren't Python
+    lists (lazy or persistent lists). Builtins that need a real list
+    materialize them with `tolist`.
+    """
+    __slots__ = ()
+
+    def tolist(self):
+        """
+        Materialize all items in a list.
+        """
+        return list(self)
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.tolist(), dtype=dtype)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, Sequence)):
+            return len(self) == len(other) and all(
+                a == b for a, b in zip(self, other))
+
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.tolist())
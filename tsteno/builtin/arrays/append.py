@@ -2,20 +2,27 @@
 This file contains class definition for working with List.
 """
 from tsteno.atoms.module import Module, ModuleArg
+from tsteno.atoms.persistent_vector import PersistentVector
+from tsteno.kernel.packed import is_list
 
 
 class Append(Module):
     """
     **Append[list, item]**
     Add item to array
+
+    The result is a persistent vector sharing items with list, so appending
+    repeatedly (`lst = Append[lst, x]`) doesn't copy the list every time.
     """
 
     def run(self, take_from, item):
-        new_list = take_from[:]
+        if isinstance(take_from, PersistentVector):
+            return take_from.append(item)
 
-        new_list.append(item)
+        if not is_list(take_from):
+            raise Exception('Append: `{}` is not a list'.format(take_from))
 
-        return new_list
+        return PersistentVector(take_from).append(item)
 
     def get_arguments(self):
         return [
@@ -32,3 +39,17 @@ class Append(Module):
             evaluation.evaluate_code('Append[lista_prueba, 2]'), [
                 1, 2, 3, 4, 5, 6, 2]
         )
+
+        # Given list isn't modified
+        test.assertEqual(
+            evaluation.evaluate_code('lista_prueba'), [1, 2, 3, 4, 5, 6]
+        )
+
+        # Older lists keep their items
+        test.assertEqual(evaluation.evaluate_code(
+            'a1 = Append[{1}, 2]; a2 = Append[a1, 3]; a3 = Append[a1, 4]; '
+            '{a1, a2, a3}'), [[1, 2], [1, 2, 3], [1, 2, 4]])
+
+        test.assertEqual(evaluation.evaluate_code(
+            'lst = {}; For[i = 0, i < 1000, i++, lst = Append[lst, i]]; '
+            'Length[lst]'), 1000)
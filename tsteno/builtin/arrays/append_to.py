@@ -0,0 +1,73 @@
+"""
+This file contains class definition for working with List.
+"""
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_SPECIAL_CONTEXT
+from tsteno.atoms.module import ARG_FLAG_RETURN_VAR_NAME
+from tsteno.atoms.persistent_vector import PersistentVector
+from tsteno.kernel.packed import is_list
+from tsteno.language.ast import IdentifierToken
+
+
+class AppendTo(Module):
+    """
+    **AppendTo[s, item]**
+    Append item to the list stored in variable s, and store the result in s.
+
+    Appends are amortized O(1), so accumulation loops are linear. Other
+    variables holding the previous list aren't modified.
+
+    # Examples
+    **Input:**
+    ```
+    s = {1, 2}; AppendTo[s, 3]; s
+    ```
+    **Output:**
+    ```
+    {1, 2, 3}
+    ```
+    """
+
+    def run(self, var, item, context):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        if not isinstance(var, IdentifierToken):
+            raise Exception('AppendTo: `{}` is not a variable'.format(var))
+
+        current_value = evaluation.get_variable_definition(
+            var.get_value(), context)
+
+        if isinstance(current_value, PersistentVector):
+            new_value = current_value.append(item)
+        elif is_list(current_value):
+            new_value = PersistentVector(current_value).append(item)
+        else:
+            raise Exception('AppendTo: `{}` is not a variable with a list '
+                            'value'.format(var.get_value()))
+
+        evaluation.run_function('Set', [var, new_value], context)
+        return new_value
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_RETURN_VAR_NAME),
+            ModuleArg(),
+            ModuleArg(ARG_FLAG_SPECIAL_CONTEXT)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code(
+            'atl = {1, 2}; AppendTo[atl, 3]; atl'), [1, 2, 3])
+
+        # Copies aren't modified
+        test.assertEqual(evaluation.evaluate_code(
+            'atl = {1}; atl2 = atl; AppendTo[atl, 2]; {atl, atl2}'),
+            [[1, 2], [1]])
+
+        test.assertEqual(evaluation.evaluate_code(
+            'atl = {}; Do[AppendTo[atl, i^2], {i, 10^4}]; '
+            '{Length[atl], Last[atl]}'), [10 ** 4, 10 ** 8])
+
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'AppendTo[undefined_atl, 1]')
@@ -0,0 +1,55 @@
+import operator as op
+import numpy as np
+from tsteno.atoms.module import Module, ModuleArg
+from tsteno.kernel.packed import elementwise, equal, is_list, pack
+
+
+class Count(Module):
+    """
+    Gives the number of elements of list equal to value.
+    ```
+    Count[list, value]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    Count[{1, 2, 1, 1}, 1]
+    ```
+    **Output:**
+    ```
+    3
+    ```
+    """
+
+    def run(self, values, value):
+        if not is_list(values):
+            raise Exception('Count: `{}` is not a list'.format(values))
+
+        array = pack(values)
+        if array is not None and array.ndim == 1 and not is_list(value):
+            mask = elementwise(array, value, op.eq)
+            if mask is not None:
+                return int(np.count_nonzero(mask))
+
+        return sum(1 for item in values if equal(item, value))
+
+    def get_arguments(self):
+        return [
+            ModuleArg(),
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code('Count[{1, 2, 1, 1}, 1]'), 3)
+        test.assertEqual(evaluation.evaluate_code('Count[{a, b, a}, a]'), 2)
+        test.assertEqual(
+            evaluation.evaluate_code('Count[{{1, 2}, {3}, {1, 2}}, {1, 2}]'), 2)
+
+        # Masks are counted with Numpy
+        test.assertEqual(evaluation.evaluate_code(
+            'Count[Range[10^6] > 10, True]'), 10 ** 6 - 10)
+        test.assertEqual(evaluation.evaluate_code(
+            'Count[{1, 2, 3} > 1, False]'), 1)
@@ -11,16 +11,17 @@ class Drop(Module):
     """
 
     def run(self, take_from, take):
-        new_list = take_from[:]
-
         if isinstance(take, list):
-            del new_list[take[0] - 1:take[1]]
-        elif take < 0:
-            del new_list[take:]
-        else:
-            del new_list[:take]
-
-        return new_list
+            head, tail = take_from[:take[0] - 1], take_from[take[1]:]
+            if not tail:
+                return head
+            if not head:
+                return tail
+            return list(head) + list(tail)
+        if take < 0:
+            return take_from[:take]
+
+        return take_from[take:]
 
     def get_arguments(self):
         return [
@@ -1,6 +1,8 @@
 """
 This file contains class definition for working with List.
 """
+import numpy as np
+from tsteno.atoms.sequence import Sequence
 from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_OPTIONAL
 
 
@@ -15,7 +17,7 @@ class Flatten(Module):
 
     def flatten(self, lst, current_lvl=0, lvl=None):
         for i in lst:
-            if isinstance(i, (list, tuple)) and (
+            if isinstance(i, (list, tuple, Sequence, np.ndarray)) and (
                     lvl is None or current_lvl < lvl):
                 for j in self.flatten(i, current_lvl + 1, lvl):
                     yield j
@@ -1,16 +1,25 @@
 """
 This file contains class definition for working with List.
 """
+from tsteno.atoms.association import Association
 from tsteno.atoms.module import Module, ModuleArg
+from tsteno.kernel.packed import equal, is_list
 
 
 class MemberQ(Module):
     """
     **MemberQ[list, item]**
-    Check if item is in list
+    Check if item is in list (or is a value of an association, in O(1))
     """
 
     def run(self, lst, item):
+        if isinstance(lst, Association):
+            return lst.has_value(item)
+
+        if is_list(item) or isinstance(lst, list):
+            # Lists (and packed rows) are compared as a whole
+            return any(equal(element, item) for element in lst)
+
         return item in lst
 
     def get_arguments(self):
@@ -31,3 +40,16 @@ class MemberQ(Module):
         test.assertEqual(
             evaluation.evaluate_code('MemberQ[lista_prueba, 1]'), True
         )
+
+        evaluation.evaluate_code('asoc_prueba = <|1 -> "a", 2 -> {3}|>;')
+        test.assertEqual(
+            evaluation.evaluate_code('MemberQ[asoc_prueba, {3}]'), True)
+        test.assertEqual(
+            evaluation.evaluate_code('MemberQ[asoc_prueba, 1]'), False)
+        test.assertEqual(
+            evaluation.evaluate_code('MemberQ[<|1 -> 2.0|>, 2]'), False)
+
+        test.assertEqual(evaluation.evaluate_code(
+            'MemberQ[{Table[ii * 1., {ii, 300}]}, Range[300]]'), True)
+        test.assertEqual(
+            evaluation.evaluate_code('MemberQ[{{1, 2}}, {1, 2}]'), True)
@@ -2,6 +2,7 @@
 This file contains class definition for accessing list elements
 """
 import sympy
+from tsteno.kernel.packed import is_list
 from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_ALL_NEXT
 
 
@@ -41,7 +42,7 @@ class Part(Module):
         return output
 
     def get_element(self, expr, index):
-        if isinstance(expr, list):
+        if is_list(expr):
             return expr[index]
         elif isinstance(expr, sympy.Expr):
             return expr.args[index]
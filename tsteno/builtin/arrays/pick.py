@@ -0,0 +1,70 @@
+import operator as op
+import numpy as np
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_OPTIONAL
+from tsteno.kernel.packed import elementwise, equal, is_list, to_mask, select
+
+
+class Pick(Module):
+    """
+    Picks out the elements of list for which the corresponding element of
+    sel is True (or equal to patt).
+    ```
+    Pick[list, sel]
+    Pick[list, sel, patt]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    data = {1, 5, 2, 8};
+    Pick[data, data > 3]
+    ```
+    **Output:**
+    ```
+    {5, 8}
+    ```
+    """
+
+    def run(self, values, sel, patt=None):
+        if not is_list(values):
+            raise Exception('Pick: `{}` is not a list'.format(values))
+
+        if patt is not None:
+            mask = elementwise(sel, patt, op.eq)
+            if mask is None:
+                mask = [equal(item, patt) for item in sel]
+            sel = mask
+
+        return select(values, to_mask(sel, len(values), 'Pick'))
+
+    def get_arguments(self):
+        return [
+            ModuleArg(),
+            ModuleArg(),
+            ModuleArg(ARG_FLAG_OPTIONAL)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        evaluation.evaluate_code('data = {1, 5, 2, 8};')
+        test.assertEqual(
+            evaluation.evaluate_code('Pick[data, data > 3]'), [5, 8])
+        test.assertEqual(evaluation.evaluate_code(
+            'Pick[{a, b, c}, {True, False, True}]'),
+            evaluation.evaluate_code('{a, c}'))
+        test.assertEqual(evaluation.evaluate_code(
+            'Pick[{a, b, c}, {1, 0, 1}, 1]'),
+            evaluation.evaluate_code('{a, c}'))
+        test.assertEqual(evaluation.evaluate_code(
+            'Pick[{a, b, c}, {x, y, x}, x]'),
+            evaluation.evaluate_code('{a, c}'))
+
+        # Packed lists stay packed
+        result = evaluation.evaluate_code(
+            'Pick[{1.5, 2.5} > 2, {1.5, 2.5} > 2]')
+        test.assertIsInstance(result, np.ndarray)
+        test.assertEqual(result.tolist(), [True])
+
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'Pick[{1, 2}, {True}]')
@@ -0,0 +1,69 @@
+import operator as op
+import numpy as np
+from tsteno.atoms.module import Module, ModuleArg
+from tsteno.kernel.packed import elementwise, equal, is_list, pack
+
+
+class Position(Module):
+    """
+    Gives a list of the positions at which value appears in list. Nested
+    lists give one index per level.
+    ```
+    Position[list, value]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    Position[{1, 2, 1, 3}, 1]
+    ```
+    **Output:**
+    ```
+    {{1}, {3}}
+    ```
+    """
+
+    def run(self, values, value):
+        if not is_list(values):
+            raise Exception('Position: `{}` is not a list'.format(values))
+
+        array = pack(values)
+        if array is not None and not is_list(value):
+            mask = elementwise(array, value, op.eq)
+            if mask is not None:
+                return (np.argwhere(mask) + 1).tolist()
+
+        return list(self.positions(values, value, []))
+
+    def positions(self, values, value, prefix):
+        for index, item in enumerate(values, 1):
+            if equal(item, value):
+                yield prefix + [index]
+            elif is_list(item):
+                yield from self.positions(item, value, prefix + [index])
+
+    def get_arguments(self):
+        return [
+            ModuleArg(),
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(
+            evaluation.evaluate_code('Position[{1, 2, 1, 3}, 1]'), [[1], [3]])
+        test.assertEqual(
+            evaluation.evaluate_code('Position[{{1, 2}, {2, 1}}, 2]'),
+            [[1, 2], [2, 1]])
+        test.assertEqual(
+            evaluation.evaluate_code('Position[{a, {b, a}}, a]'),
+            [[1], [2, 2]])
+        test.assertEqual(
+            evaluation.evaluate_code('Position[{{1, 2}, 3, {1, 2}}, {1, 2}]'),
+            [[1], [3]])
+        test.assertEqual(evaluation.evaluate_code('Position[{1, 2}, 5]'), [])
+
+        # Masks are searched with Numpy
+        test.assertEqual(evaluation.evaluate_code(
+            'Position[Range[10^6] > 10^6 - 2, True]'), [[10 ** 6 - 1], [10 ** 6]])
@@ -0,0 +1,41 @@
+"""
+This file contains class definition for working with List.
+"""
+from tsteno.atoms.module import Module, ModuleArg
+from tsteno.atoms.persistent_vector import PersistentVector
+from tsteno.kernel.packed import is_list
+
+
+class Prepend(Module):
+    """
+    **Prepend[list, item]**
+    Add item at the beginning of array
+
+    The result is a persistent vector sharing items with list.
+    """
+
+    def run(self, take_from, item):
+        if isinstance(take_from, PersistentVector):
+            return take_from.prepend(item)
+
+        if not is_list(take_from):
+            raise Exception('Prepend: `{}` is not a list'.format(take_from))
+
+        return PersistentVector(take_from).prepend(item)
+
+    def get_arguments(self):
+        return [
+            ModuleArg(),
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        evaluation.evaluate_code('lista_prueba={1,2,3};')
+
+        test.assertEqual(
+            evaluation.evaluate_code('Prepend[lista_prueba, 0]'), [0, 1, 2, 3]
+        )
+        test.assertEqual(evaluation.evaluate_code(
+            'Append[Prepend[Prepend[{2}, 1], 0], 3]'), [0, 1, 2, 3])
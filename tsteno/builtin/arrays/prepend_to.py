@@ -0,0 +1,66 @@
+"""
+This file contains class definition for working with List.
+"""
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_SPECIAL_CONTEXT
+from tsteno.atoms.module import ARG_FLAG_RETURN_VAR_NAME
+from tsteno.atoms.persistent_vector import PersistentVector
+from tsteno.kernel.packed import is_list
+from tsteno.language.ast import IdentifierToken
+
+
+class PrependTo(Module):
+    """
+    **PrependTo[s, item]**
+    Prepend item to the list stored in variable s, and store the result in
+    s.
+
+    Prepends are amortized O(1). Other variables holding the previous list
+    aren't modified.
+
+    # Examples
+    **Input:**
+    ```
+    s = {1, 2}; PrependTo[s, 0]; s
+    ```
+    **Output:**
+    ```
+    {0, 1, 2}
+    ```
+    """
+
+    def run(self, var, item, context):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        if not isinstance(var, IdentifierToken):
+            raise Exception('PrependTo: `{}` is not a variable'.format(var))
+
+        current_value = evaluation.get_variable_definition(
+            var.get_value(), context)
+
+        if isinstance(current_value, PersistentVector):
+            new_value = current_value.prepend(item)
+        elif is_list(current_value):
+            new_value = PersistentVector(current_value).prepend(item)
+        else:
+            raise Exception('PrependTo: `{}` is not a variable with a list '
+                            'value'.format(var.get_value()))
+
+        evaluation.run_function('Set', [var, new_value], context)
+        return new_value
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_RETURN_VAR_NAME),
+            ModuleArg(),
+            ModuleArg(ARG_FLAG_SPECIAL_CONTEXT)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code(
+            'ptl = {1, 2}; PrependTo[ptl, 0]; ptl'), [0, 1, 2])
+
+        test.assertEqual(evaluation.evaluate_code(
+            'ptl = {}; Do[PrependTo[ptl, i], {i, 5}]; AppendTo[ptl, 0]; ptl'),
+            [5, 4, 3, 2, 1, 0])
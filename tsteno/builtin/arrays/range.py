@@ -1,13 +1,35 @@
-import numpy as np
+from tsteno.atoms.arithmetic_sequence import ArithmeticSequence
 from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_OPTIONAL
 
 
 class Range(Module):
+    """
+    Generates the list of numbers from imin (default 1) to imax, with step
+    di (default 1).
+    ```
+    Range[imax]
+    Range[imin, imax]
+    Range[imin, imax, di]
+    ```
+
+    Items are computed when needed, so `Length`, `Part`, `Take`, `Drop`,
+    `First` and `Last` don't depend on the size of the range.
+
+    # Examples
+    **Input:**
+    ```
+    Range[2, 10, 3]
+    ```
+    **Output:**
+    ```
+    {2, 5, 8}
+    ```
+    """
 
     def run(self, a, b=None, di=1):
         if b is None:
-            return list(np.arange(1, a + di, di))
-        return list(np.arange(a, b + di, di))
+            return ArithmeticSequence.from_bounds(1, a, di)
+        return ArithmeticSequence.from_bounds(a, b, di)
 
     def get_arguments(self):
         return [
@@ -27,3 +49,32 @@ class Range(Module):
 
         test.assertEqual(list(evaluation.evaluate_code('Range[1, 5, 0.5]')), [
                          1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0])
+
+        test.assertEqual(list(evaluation.evaluate_code('Range[5, 1, -2]')), [
+                         5, 3, 1])
+        test.assertEqual(list(evaluation.evaluate_code('Range[0]')), [])
+        test.assertEqual(
+            len(evaluation.evaluate_code('Range[0, 1, 0.1]')), 11)
+        test.assertEqual(list(evaluation.evaluate_code('Range[1/2, 2]')),
+                         evaluation.evaluate_code('{1/2, 3/2}'))
+
+        # Inexact bounds give inexact items
+        for code, items in (('Range[3.]', [1.0, 2.0, 3.0]),
+                            ('Range[0, 2.]', [0.0, 1.0, 2.0])):
+            values = list(evaluation.evaluate_code(code))
+            test.assertEqual(values, items)
+            test.assertTrue(all(type(value) is float for value in values))
+
+        # Huge ranges aren't materialized
+        test.assertEqual(evaluation.evaluate_code('Length[Range[10^15]]'),
+                         10 ** 15)
+        test.assertEqual(evaluation.evaluate_code(
+            'Part[Range[10^15], 10^14]'), 10 ** 14)
+        test.assertEqual(evaluation.evaluate_code('Last[Range[10^15]]'),
+                         10 ** 15)
+        test.assertEqual(list(evaluation.evaluate_code(
+            'Take[Drop[Range[10^15], 10], 2]')), [11, 12])
+        test.assertTrue(evaluation.evaluate_code('MemberQ[Range[10^15], 7]'))
+
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'Range[1, 5, 0]')
@@ -0,0 +1,144 @@
+import numpy as np
+from tsteno.atoms.module import Module, ModuleArg
+from tsteno.atoms.module import ARG_FLAG_OPTIONAL, ARG_FLAG_SPECIAL_CONTEXT
+from tsteno.kernel.packed import is_list, is_true, pack, select
+
+
+class Select(Module):
+    """
+    Picks out all elements of list for which crit gives True (optionally,
+    the first n of them).
+    ```
+    Select[list, crit]
+    Select[list, crit, n]
+    ```
+
+    Numeric lists are given at once to crits without side effects (pure
+    builtins, or user functions that only compute and compare), so
+    comparisons inside crit are evaluated elementwise with Numpy.
+
+    # Examples
+    **Input:**
+    ```
+    Set[big[x_], Module[{}, x > 2]];
+    Select[{1, 2, 3, 4}, big]
+    ```
+    **Output:**
+    ```
+    {3, 4}
+    ```
+    """
+
+    def run(self, context, values, crit, n=None):
+        if not is_list(values):
+            raise Exception('Select: `{}` is not a list'.format(values))
+
+        if n is not None and (int(n) != n or n < 0):
+            raise Exception(
+                'Select: `{}` is not a non negative integer'.format(n))
+
+        apply = self.get_kernel().get_kext('eval').bind_function(
+            crit, context)
+
+        mask = None
+        if self.is_pure_criterion(crit, context):
+            mask = self.vectorized_mask(apply, values)
+        if mask is None:
+            mask = np.fromiter(
+                (is_true(apply(item)) for item in values), bool, len(values))
+
+        if n is not None:
+            mask[np.flatnonzero(mask)[int(n):]] = False
+
+        return select(values, mask)
+
+    def is_pure_criterion(self, crit, context):
+        """
+        Check if crit has no side effects, so it can be applied to the whole
+        list, and then to each item if it doesn't give a mask.
+        """
+        optimizer = self.get_kernel().get_kext('optimizer')
+
+        if isinstance(crit, Module):
+            definition = crit
+        else:
+            name = str(crit)
+            if optimizer.is_builtin(name):
+                return optimizer.is_pure(name)
+
+            definition = self.get_kernel().get_kext(
+                'eval').get_module_definition(name, [], context)
+
+        is_pure = getattr(definition, 'is_pure', None)
+        return is_pure is not None and is_pure(optimizer.is_pure_expression)
+
+    def vectorized_mask(self, apply, values):
+        """
+        Return:
+            - Mask given by crit applied to the whole packed list, or None if
+            crit doesn't give a mask.
+        """
+        array = pack(values)
+        if array is None or array.ndim != 1:
+            return None
+
+        try:
+            mask = apply(array)
+        except Exception:
+            # crit can't operate packed arrays, e.g. uses If or Which.
+            return None
+
+        if not isinstance(mask, np.ndarray) or mask.dtype.kind != 'b' or \
+                mask.shape != array.shape:
+            return None
+
+        return mask.copy()
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_SPECIAL_CONTEXT),
+            ModuleArg(),
+            ModuleArg(),
+            ModuleArg(ARG_FLAG_OPTIONAL)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        evaluation.evaluate_code('Set[big[x_], Module[{}, x > 2]];')
+        test.assertEqual(
+            evaluation.evaluate_code('Select[{1, 2, 3, 4}, big]'), [3, 4])
+        test.assertEqual(
+            evaluation.evaluate_code('Select[{1, 2, 3, 4}, big, 1]'), [3])
+        test.assertEqual(
+            evaluation.evaluate_code('Select[{1, 2}, big]'), [])
+
+        # Exact items are kept
+        result = evaluation.evaluate_code('Select[{1, 2.5, 3}, big]')
+        test.assertEqual(result, [2.5, 3])
+        test.assertIs(type(result[1]), int)
+
+        # Symbolic items are tested one by one, undecidable ones are dropped
+        test.assertEqual(
+            evaluation.evaluate_code('Select[{1, x, 4}, big]'), [4])
+
+        evaluation.evaluate_code(
+            'Set[small[x_], Module[{}, If[x < 2, True, False]]];')
+        test.assertEqual(
+            evaluation.evaluate_code('Select[{1, 2, 3}, small]'), [1])
+
+        # Packed lists are filtered by a single mask
+        evaluation.evaluate_code('data = Range[10^6];')
+        test.assertEqual(len(evaluation.evaluate_code(
+            'Select[data, big]')), 10 ** 6 - 2)
+        evaluation.evaluate_code('large[x_] := x > 2;')
+        test.assertEqual(len(evaluation.evaluate_code(
+            'Select[data, large]')), 10 ** 6 - 2)
+
+        # Crits with side effects are applied once to each item
+        evaluation.evaluate_code(
+            'seen = {}; seeing[x_] := Last[AppendTo[seen, x]] > 2;')
+        test.assertEqual(
+            evaluation.evaluate_code('Select[Range[5], seeing]').tolist(),
+            [3, 4, 5])
+        test.assertEqual(evaluation.evaluate_code('seen'), [1, 2, 3, 4, 5])
@@ -1,6 +1,7 @@
 """
 This file contains class definition for working with List.
 """
+import numpy as np
 import sympy as sp
 from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_ALL_NEXT
 
@@ -41,6 +42,11 @@ class Subdivide(Module):
     """
 
     def run(self, *arguments):
+        # Packed arrays are given as the lists they stand for
+        arguments = [
+            argument.tolist() if isinstance(argument, np.ndarray) else argument
+            for argument in arguments
+        ]
         start = 0
         stop = 1
         num = 0
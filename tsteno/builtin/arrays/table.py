@@ -2,19 +2,42 @@
 This file contains class definition for working with List.
 """
 import numpy as np
+import sympy as sp
 from sympy import sin
 from sympy.abc import x
+from tsteno.atoms.arithmetic_sequence import ArithmeticSequence
+from tsteno.atoms.sequence import Sequence
 from tsteno.atoms.module import ARG_FLAG_NO_AUTO_EVAL, ARG_FLAG_SPECIAL_CONTEXT
 from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_ALL_NEXT
-from itertools import product
+from tsteno.kernel.kexts.numerical import NATIVE_NUMBER_TYPES, Numerical
+from tsteno.language.ast import IdentifierToken, Node
+
+PACKING_THRESHOLD = 250
+""" Minimum number of numeric items of a table given as a packed array """
+
+INEXACT_TYPES = (float, complex, np.inexact)
+""" Items that make a numeric table packed """
 
 
 class Table(Module):
     """
-    Generates a list of n copies of expr.
+    Generates a list of the values of expr, for each value of the iterators
+    (the first one is the outermost).
+    ```
+    Table[expr, n]
+    Table[expr, {n}]
+    Table[expr, {i, imax}]
+    Table[expr, {i, imin, imax, di}]
+    Table[expr, {i, {i1, i2, ...}}]
+    Table[expr, {i, imin, imax}, {j, jmin, jmax}, ...]
+    ```
+
+    Inner iterator bounds can depend on outer iterators. Tables with at
+    least 250 native numbers, some of them inexact, are given as packed
+    arrays. Integer tables stay lists of exact integers.
 
     # Examples
-    Basic list of 4 elements.
+    Basic list of 10 elements.
 
     **Input:**
     ```
@@ -23,86 +46,178 @@ class Table(Module):
 
     **Output:**
     ```
-    [1, 4, 9, 16, 25, 36, 49, 64, 81, 100]
+    {1, 4, 9, 16, 25, 36, 49, 64, 81, 100}
     ```
+    ---
+    Triangular table.
 
     **Input:**
     ```
-    Table[10 i + j, {i, 4}, {j, 3}]
+    Table[10 * i + j, {i, 3}, {j, i}]
     ```
 
     **Output:**
     ```
-     [[11, 12, 13],
-             [21, 22, 23],
-             [31, 32, 33],
-             [41, 42, 43]]
+    {{11}, {21, 22}, {31, 32, 33}}
     ```
     """
 
-    def run(self, context, fn, *var_values_sets):
+    def run(self, context, fn, *iterators):
         """
         gives a nested list. The list associated with i is outermost.
         Parameters:
             - **expr**: One expression
-            - **indexes**: A list of indexes
+            - **iterators**: Iterators
         """
-        var_values_sets = list(var_values_sets)
+        iterators = [
+            self.get_iterator(self.evaluate_iterator(iterator, context))
+            for iterator in iterators
+        ]
 
-        if len(var_values_sets) == 1 and isinstance(var_values_sets[0], int):
-            return self.evaluate_one(fn, var_values_sets[0])
+        # Only iterators are local, other definitions go to the global store
+        function_frame = context.function_frame
+        context.set_local_context(True)
+        context.function_frame = True
 
-        var_references = {}
+        try:
+            leaf_types = set()
+            output = self.fill(context, fn, iterators, {}, leaf_types)
+        finally:
+            context.set_local_context(False)
+            context.function_frame = function_frame
 
-        for var_values in var_values_sets:
-            var, values = self.calculate_evaluator(var_values, context)
-            var_references[str(var)] = values
+        return self.pack(output, leaf_types)
 
-        context.set_local_context(True)
+    def evaluate_iterator(self, iterator, context):
+        """
+        Evaluate an unevaluated iterator specification, except its variable,
+        so variables with a global value can be iterators too.
+        """
+        node = iterator.node
+        if not isinstance(node, Node) or node.head != 'List' or \
+                not node.childrens or \
+                not isinstance(node.childrens[0], IdentifierToken):
+            return iterator()
 
-        output = self.evaluate_table(context, fn, var_references)
+        evaluation = self.get_kernel().get_kext('eval')
 
-        context.set_local_context(False)
+        return [sp.Symbol(node.childrens[0].get_value())] + [
+            evaluation.evaluate_node(child, context)
+            for child in node.childrens[1:]
+        ]
 
-        return output
+    def get_iterator(self, iterator):
+        """
+        Return:
+            - Tuple with variable (None for repetitions), values (list or
+            sequence) and bounds that depend on outer iterators (None if
+            values are already known).
+        """
+        if not isinstance(iterator, list):
+            return None, ArithmeticSequence.from_bounds(1, iterator), None
 
-    def evaluate_table(self, context, fn, var_references):
-        output = []
+        if not 1 <= len(iterator) <= 4:
+            raise Exception(
+                'Table: `{}` is not a valid iterator'.format(iterator))
 
-        variables = var_references.keys()
-        values = var_references.values()
-        combinations = product(*values)
+        if len(iterator) == 1:
+            return None, ArithmeticSequence.from_bounds(1, iterator[0]), None
 
-        shapes = map(len, values)
+        variable = iterator[0]
+        if not isinstance(variable, sp.Symbol):
+            raise Exception(
+                'Table: `{}` is not a valid iterator variable'.format(
+                    variable))
 
-        for one_combi in combinations:
-            for one_var, one_value in zip(variables, one_combi):
-                context.set_user_variable(one_var, one_value)
+        if len(iterator) == 2 and isinstance(
+                iterator[1], (list, np.ndarray, Sequence)):
+            return variable, iterator[1], None
 
-            output.append(fn(context))
+        bounds = iterator[1:]
+        if len(bounds) == 1:
+            bounds = [1] + bounds
 
-        return np.array(output).reshape(*shapes).tolist()
+        if any(isinstance(bound, sp.Basic) and bound.free_symbols
+               for bound in bounds):
+            return variable, None, bounds
 
-    def calculate_evaluator(self, var_values, context):
-        evaluation = self.get_kernel().get_kext('eval')
+        return variable, ArithmeticSequence.from_bounds(*bounds), None
+
+    def fill(self, context, fn, iterators, outer, leaf_types):
+        """
+        Fill a list with first iterator values, evaluating expr (innermost
+        iterator) or next iterators recursively.
+
+        Parameters:
+            - **outer** - Current values of outer iterators, by variable.
+            - **leaf_types** - Set updated with types of expr values.
+        """
+        variable, values, bounds = iterators[0]
+
+        if bounds is not None:
+            values = ArithmeticSequence.from_bounds(*[
+                Numerical.demote(bound.xreplace(outer))
+                if isinstance(bound, sp.Basic) else bound
+                for bound in bounds
+            ])
+
+        output = [None] * len(values)
+        variables = context.user_variables
+        name = None if variable is None else str(variable)
 
-        var = var_values[0]
-        var_values = var_values[1:]
-        var_values_size = len(var_values)
+        if len(iterators) == 1:
+            for index, value in enumerate(values):
+                if name is not None:
+                    variables[name] = value
+                output[index] = item = fn(context)
+                leaf_types.add(type(item))
+            return output
 
-        if var_values_size >= 1 and var_values_size <= 3:
-            return var, evaluation.run_function('Range', var_values, context)
+        for index, value in enumerate(values):
+            if name is not None:
+                variables[name] = value
+                outer[variable] = value
+            output[index] = self.fill(
+                context, fn, iterators[1:], outer, leaf_types)
 
-        return var, var_values[0]
+        return output
+
+    def pack(self, output, leaf_types):
+        """
+        Return:
+            - Packed array if output has enough native numbers, some of them
+            inexact, and is rectangular, output otherwise.
+        """
+        if not leaf_types or not leaf_types <= NATIVE_NUMBER_TYPES:
+            return output
+
+        if not any(issubclass(leaf_type, INEXACT_TYPES)
+                   for leaf_type in leaf_types):
+            # Integer arrays would overflow (int64), exact integers are kept
+            return output
+
+        size = len(output)
+        item = output
+        while size < PACKING_THRESHOLD and item and isinstance(item[0], list):
+            item = item[0]
+            size *= len(item)
+
+        if size < PACKING_THRESHOLD:
+            return output
 
-    def evaluate_one(self, fn, times):
-        return [fn()] * times
+        try:
+            array = np.array(output)
+        except ValueError:
+            # Ragged table, from dependent iterators
+            return output
+
+        return array if array.dtype.kind in 'fc' else output
 
     def get_arguments(self):
         return [
             ModuleArg(ARG_FLAG_SPECIAL_CONTEXT),
             ModuleArg(ARG_FLAG_NO_AUTO_EVAL),
-            ModuleArg(ARG_FLAG_ALL_NEXT)
+            ModuleArg(ARG_FLAG_ALL_NEXT | ARG_FLAG_NO_AUTO_EVAL)
         ]
 
     def run_test(self, test):
@@ -127,3 +242,57 @@ class Table(Module):
              [31, 32, 33],
              [41, 42, 43]]
         )
+
+        test.assertEqual(evaluation.evaluate_code(
+            'Table[ii, {ii, 2, 10, 4}]'), [2, 6, 10])
+        test.assertEqual(evaluation.evaluate_code(
+            'Table[ii^2, {ii, {3, 1}}]'), [9, 1])
+        test.assertEqual(evaluation.evaluate_code('Table[7, {3}]'), [7, 7, 7])
+        test.assertEqual(evaluation.evaluate_code('Table[ii, {ii, 0}]'), [])
+
+        # Expression is evaluated once per item
+        test.assertEqual(evaluation.evaluate_code(
+            'n = 0; Table[n = n + 1; n, 3]'), [1, 2, 3])
+
+        # Iterator variables are localized before evaluating them
+        test.assertEqual(evaluation.evaluate_code(
+            'ii = 5; Table[ii, {ii, 3}]'), [1, 2, 3])
+        test.assertEqual(evaluation.evaluate_code('ii'), 5)
+        evaluation.evaluate_code('Clear[ii]')
+
+        # Only iterators are local, definitions are kept
+        test.assertEqual(evaluation.evaluate_code(
+            'Table[tf[ii] = ii^2, {ii, 3}]; tf[2]'), 4)
+
+        # Dependent iterators
+        test.assertEqual(evaluation.evaluate_code(
+            'Table[10 * ii + jj, {ii, 3}, {jj, ii}]'),
+            [[11], [21, 22], [31, 32, 33]])
+        test.assertEqual(evaluation.evaluate_code(
+            'Table[jj, {ii, 3}, {jj, ii, 3}]'), [[1, 2, 3], [2, 3], [3]])
+
+        # Big numeric tables are packed, symbolic ones aren't
+        result = evaluation.evaluate_code('Table[ii / 2.0, {ii, 1000}]')
+        test.assertIsInstance(result, np.ndarray)
+        test.assertEqual(result.shape, (1000, ))
+        test.assertEqual(result[-1], 500.0)
+
+        result = evaluation.evaluate_code(
+            'Table[ii * jj * 1., {ii, 100}, {jj, 100}]')
+        test.assertIsInstance(result, np.ndarray)
+        test.assertEqual(result.shape, (100, 100))
+
+        # Packed arrays are operated as lists
+        with test.assertRaises(TypeError):
+            evaluation.evaluate_code('Table[ii / 2.0, {ii, 1000}] + 1')
+
+        # Integers aren't packed, they don't overflow
+        test.assertIsInstance(evaluation.evaluate_code(
+            'Table[ii * jj, {ii, 100}, {jj, 100}]'), list)
+        test.assertEqual(evaluation.evaluate_code(
+            'Last[Table[ii, {ii, 300}]] * 10^18'), 300 * 10 ** 18)
+
+        test.assertIsInstance(
+            evaluation.evaluate_code('Table[ii / 2, {ii, 1000}]'), list)
+        test.assertIsInstance(
+            evaluation.evaluate_code('Table[ii, {ii, 10}]'), list)
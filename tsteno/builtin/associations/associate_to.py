@@ -0,0 +1,73 @@
+"""
+This file contains class definition for working with Association.
+"""
+from tsteno.atoms.association import Association
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_SPECIAL_CONTEXT
+from tsteno.atoms.module import ARG_FLAG_RETURN_VAR_NAME
+from tsteno.language.ast import IdentifierToken
+
+
+class AssociateTo(Module):
+    """
+    Adds rules to the association stored in variable a, replacing values of
+    existing keys.
+    ```
+    AssociateTo[a, key -> value]
+    AssociateTo[a, {key1 -> value1, ...}]
+    ```
+
+    The association is modified in place, in O(1) per rule. Other variables
+    holding the association aren't modified.
+
+    # Examples
+    **Input:**
+    ```
+    a = <|"x" -> 1|>; AssociateTo[a, "y" -> 2]; a
+    ```
+    **Output:**
+    ```
+    <|"x" -> 1, "y" -> 2|>
+    ```
+    """
+
+    def run(self, var, rules, context):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        if not isinstance(var, IdentifierToken):
+            raise Exception('AssociateTo: `{}` is not a variable'.format(var))
+
+        association = evaluation.get_variable_definition(
+            var.get_value(), context)
+
+        if not isinstance(association, Association):
+            raise Exception('AssociateTo: `{}` is not a variable with an '
+                            'association value'.format(var.get_value()))
+
+        association.update(rules)
+        return association
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_RETURN_VAR_NAME),
+            ModuleArg(),
+            ModuleArg(ARG_FLAG_SPECIAL_CONTEXT)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code(
+            'ata = <|"x" -> 1|>; AssociateTo[ata, {"y" -> 2, "x" -> 3}]; '
+            'Values[ata]'), [3, 2])
+
+        # Copies aren't modified
+        test.assertEqual(evaluation.evaluate_code(
+            'ata = <||>; ata2 = ata; AssociateTo[ata, 1 -> 2]; '
+            '{Length[ata], Length[ata2]}'), [1, 0])
+
+        test.assertEqual(evaluation.evaluate_code(
+            'ata = <||>; Do[AssociateTo[ata, i -> i^2], {i, 10^4}]; '
+            'Lookup[ata, 100]'), 10 ** 4)
+
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'ata = {}; AssociateTo[ata, 1 -> 2]')
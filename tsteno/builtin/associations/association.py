@@ -0,0 +1,62 @@
+"""
+This file contains class definition for working with Association.
+"""
+from tsteno.atoms.association import Association as AssociationAtom
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_ALL_NEXT
+
+
+class Association(Module):
+    """
+    Map of keys to values, with O(1) lookups. Keys can be any expression,
+    and are kept in insertion order.
+    ```
+    <|key1 -> value1, key2 -> value2, ...|>
+    Association[key1 -> value1, key2 -> value2, ...]
+    Association[{key1 -> value1, ...}]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    <|"a" -> 1, 2 -> x, "a" -> 3|>
+    ```
+
+    **Output:**
+    ```
+    <|"a" -> 3, 2 -> x|>
+    ```
+    """
+
+    def run(self, *rules):
+        association = AssociationAtom()
+        association.update(list(rules))
+        return association
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_ALL_NEXT)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        association = evaluation.evaluate_code('<|"a" -> 1, 2 -> x, "a" -> 3|>')
+        test.assertEqual(association.keys(), ['a', 2])
+        test.assertEqual(association.get('a'), 3)
+        test.assertEqual(repr(association), '<|"a" -> 3, 2 -> x|>')
+
+        # Strings and symbols are different keys
+        test.assertEqual(
+            len(evaluation.evaluate_code('<|"x" -> 1, x -> 2|>')), 2)
+
+        # Exact and inexact numbers are different keys
+        test.assertEqual(
+            len(evaluation.evaluate_code('<|1 -> 1, 1.0 -> 2|>')), 2)
+
+        test.assertEqual(
+            evaluation.evaluate_code('Association[{1 -> 2}, <|3 -> 4|>]'),
+            evaluation.evaluate_code('<|1 -> 2, 3 -> 4|>'))
+        test.assertEqual(len(evaluation.evaluate_code('<||>')), 0)
+
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'Association[1]')
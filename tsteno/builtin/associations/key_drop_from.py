@@ -0,0 +1,59 @@
+"""
+This file contains class definition for working with Association.
+"""
+from tsteno.atoms.association import Association
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_SPECIAL_CONTEXT
+from tsteno.atoms.module import ARG_FLAG_RETURN_VAR_NAME
+from tsteno.kernel.packed import is_list
+from tsteno.language.ast import IdentifierToken
+
+
+class KeyDropFrom(Module):
+    """
+    Removes keys from the association stored in variable a, missing keys are
+    ignored.
+    ```
+    KeyDropFrom[a, key]
+    KeyDropFrom[a, {key1, key2, ...}]
+    ```
+
+    The association is modified in place, in O(1) per key.
+    """
+
+    def run(self, var, keys, context):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        if not isinstance(var, IdentifierToken):
+            raise Exception('KeyDropFrom: `{}` is not a variable'.format(var))
+
+        association = evaluation.get_variable_definition(
+            var.get_value(), context)
+
+        if not isinstance(association, Association):
+            raise Exception('KeyDropFrom: `{}` is not a variable with an '
+                            'association value'.format(var.get_value()))
+
+        for key in keys if is_list(keys) else [keys]:
+            association.pop(key)
+
+        return association
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_RETURN_VAR_NAME),
+            ModuleArg(),
+            ModuleArg(ARG_FLAG_SPECIAL_CONTEXT)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code(
+            'kdf = <|1 -> a, 2 -> b, 3 -> c|>; KeyDropFrom[kdf, {1, 4}]; '
+            'KeyDropFrom[kdf, 3]; Keys[kdf]'), [2])
+
+        # Values of dropped keys aren't members anymore
+        test.assertEqual(
+            evaluation.evaluate_code('MemberQ[kdf, a]'), False)
+        test.assertEqual(
+            evaluation.evaluate_code('MemberQ[kdf, b]'), True)
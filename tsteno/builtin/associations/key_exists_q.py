@@ -0,0 +1,42 @@
+"""
+This file contains class definition for working with Association.
+"""
+from tsteno.atoms.association import Association
+from tsteno.atoms.module import Module, ModuleArg
+
+
+class KeyExistsQ(Module):
+    """
+    Check if key is in an association, in O(1).
+    ```
+    KeyExistsQ[assoc, key]
+    ```
+    """
+
+    def run(self, association, key):
+        if not isinstance(association, Association):
+            raise Exception(
+                'KeyExistsQ: `{}` is not an association'.format(association))
+
+        return association.has_key(key)
+
+    def get_arguments(self):
+        return [
+            ModuleArg(),
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        evaluation.evaluate_code('keq = <|"a" -> 1, x -> 2|>')
+        test.assertEqual(evaluation.evaluate_code('KeyExistsQ[keq, x]'), True)
+        test.assertEqual(
+            evaluation.evaluate_code('KeyExistsQ[keq, "x"]'), False)
+        test.assertEqual(evaluation.evaluate_code('KeyExistsQ[keq, 1]'), False)
+
+        # Packed arrays are the same key as equal lists
+        floats = '{' + ', '.join('{}.'.format(i) for i in range(1, 301)) + '}'
+        test.assertEqual(evaluation.evaluate_code(
+            'KeyExistsQ[<|Table[ii * 1., {ii, 300}] -> 5|>, ' + floats + ']'),
+            True)
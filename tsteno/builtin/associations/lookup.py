@@ -0,0 +1,85 @@
+"""
+This file contains class definition for working with Association.
+"""
+from tsteno.atoms.association import Association
+from tsteno.atoms.module import Module, ModuleArg
+from tsteno.atoms.module import ARG_FLAG_NO_AUTO_EVAL, ARG_FLAG_OPTIONAL
+from tsteno.kernel.packed import is_list
+
+
+class Lookup(Module):
+    """
+    Gives the value of key in an association, or default if key is missing
+    (`Missing["KeyAbsent", key]` if no default is given). Default is only
+    evaluated when needed.
+    ```
+    Lookup[assoc, key]
+    Lookup[assoc, key, default]
+    Lookup[assoc, {key1, key2, ...}]
+    Lookup[{assoc1, assoc2, ...}, key]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    Lookup[<|"a" -> 1, "b" -> 2|>, {"b", "c"}, 0]
+    ```
+
+    **Output:**
+    ```
+    {2, 0}
+    ```
+    """
+
+    def run(self, association, key, default=None):
+        if is_list(association):
+            return [self.run(item, key, default) for item in association]
+
+        if not isinstance(association, Association):
+            raise Exception(
+                'Lookup: `{}` is not an association'.format(association))
+
+        if is_list(key):
+            return [self.lookup(association, item, default) for item in key]
+
+        return self.lookup(association, key, default)
+
+    def lookup(self, association, key, default):
+        if association.has_key(key):
+            return association.get(key)
+
+        if default is not None:
+            return default()
+
+        evaluation = self.get_kernel().get_kext('eval')
+        arguments = ['KeyAbsent', key]
+        return evaluation.builtin_modules['Unknown'].proxy(
+            'Missing', arguments).run(*arguments)
+
+    def get_arguments(self):
+        return [
+            ModuleArg(),
+            ModuleArg(),
+            ModuleArg(ARG_FLAG_NO_AUTO_EVAL | ARG_FLAG_OPTIONAL)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        evaluation.evaluate_code('lka = <|"a" -> 1, "b" -> 2, {1, 2} -> 3|>')
+        test.assertEqual(evaluation.evaluate_code('Lookup[lka, "b"]'), 2)
+        test.assertEqual(
+            evaluation.evaluate_code('Lookup[lka, {"b", "c"}, 0]'), [2, 0])
+        test.assertEqual(evaluation.evaluate_code(
+            'Lookup[{lka, <|"a" -> 5|>}, "a"]'), [1, 5])
+        test.assertEqual(
+            str(evaluation.evaluate_code('Lookup[lka, "c"]')),
+            'Missing[KeyAbsent, c]')
+
+        # Lists are keys too, when given in a list
+        test.assertEqual(
+            evaluation.evaluate_code('Lookup[lka, {{1, 2}}]'), [3])
+
+        # Default is only evaluated if key is missing
+        test.assertEqual(evaluation.evaluate_code(
+            'lkn = 0; Lookup[lka, "a", lkn = 1]; lkn'), 0)
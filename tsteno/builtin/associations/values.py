@@ -0,0 +1,32 @@
+"""
+This file contains class definition for working with Association.
+"""
+from tsteno.atoms.association import Association
+from tsteno.atoms.module import Module, ModuleArg
+
+
+class Values(Module):
+    """
+    Gives a list of the values of an association, in insertion order.
+    ```
+    Values[assoc]
+    ```
+    """
+
+    def run(self, association):
+        if not isinstance(association, Association):
+            raise Exception(
+                'Values: `{}` is not an association'.format(association))
+
+        return association.values()
+
+    def get_arguments(self):
+        return [
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code(
+            'Values[<|"b" -> 1, "a" -> 2, "b" -> 3|>]'), [3, 2])
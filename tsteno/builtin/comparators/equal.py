@@ -3,7 +3,7 @@ This file contains class definition for creating a equal comparator.
 """
 import operator as op
 
-from tsteno.atoms.comparator import Comparator
+from tsteno.kernel.packed import compare
 from tsteno.atoms.module import Module, ModuleArg
 
 
@@ -38,6 +38,9 @@ class Equal(Module):
     ```
     """
 
+    operator = op.eq
+    """ Comparison operator, used directly by conditions """
+
     def run(self, left, right):
         """
         Represent an equal operator.
@@ -45,7 +48,7 @@ class Equal(Module):
             - **left**: Left element to be compared.
             - **right**: Right element to be compared.
         """
-        return Comparator(left, right, op.eq)
+        return compare(left, right, self.operator)
 
     def get_arguments(self):
         return [
@@ -59,3 +62,14 @@ class Equal(Module):
         test.assertFalse(evaluation.evaluate_code('x+1==x').eval())
 
         test.assertEqual(str(evaluation.evaluate_code('1==1')), 'True')
+
+        test.assertEqual(evaluation.evaluate_code(
+            '{1, 2, 3} == 2').tolist(), [False, True, False])
+
+        # Lists are compared as a whole
+        test.assertIs(evaluation.evaluate_code('{1, 2} == {1, 2}'), True)
+        test.assertIs(evaluation.evaluate_code('{1, 2} == {1, 3}'), False)
+        test.assertIs(evaluation.evaluate_code(
+            'Table[ii / 2., {ii, 300}] == Range[1/2, 150, 1/2]'), True)
+        test.assertEqual(
+            evaluation.evaluate_code('If[{1, 2} == {1, 2}, 1, 0]'), 1)
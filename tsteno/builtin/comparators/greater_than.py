@@ -3,7 +3,7 @@ This file contains class definition for creating a greater comparator.
 """
 import operator as op
 
-from tsteno.atoms.comparator import Comparator
+from tsteno.kernel.packed import compare
 from tsteno.atoms.module import Module, ModuleArg
 
 
@@ -38,6 +38,9 @@ class GreaterThan(Module):
     ```
     """
 
+    operator = op.gt
+    """ Comparison operator, used directly by conditions """
+
     def run(self, left, right):
         """
         Represent an greater operator.
@@ -45,7 +48,7 @@ class GreaterThan(Module):
             - **left**: Left element to be compared.
             - **right**: Right element to be compared.
         """
-        return Comparator(left, right, op.gt)
+        return compare(left, right, self.operator)
 
     def get_arguments(self):
         return [
@@ -57,3 +60,15 @@ class GreaterThan(Module):
 
         test.assertTrue(evaluation.evaluate_code('2>1').eval())
         test.assertFalse(evaluation.evaluate_code('1>2').eval())
+
+        # Numeric lists are compared elementwise to packed boolean masks
+        test.assertEqual(evaluation.evaluate_code(
+            '{1, 2, 3, 4} > 2').tolist(), [False, False, True, True])
+        test.assertEqual(evaluation.evaluate_code(
+            '{1, 5} > {2, 4.5}').tolist(), [False, True])
+
+        # Symbolic lists aren't
+        test.assertFalse(isinstance(
+            evaluation.evaluate_code('{1, x} > 2'), list))
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, '{1, 2} > {1, 2, 3}')
@@ -4,7 +4,7 @@ This file contains class definition for creating a less or equal comparator.
 
 import operator as op
 
-from tsteno.atoms.comparator import Comparator
+from tsteno.kernel.packed import compare
 from tsteno.atoms.module import Module, ModuleArg
 
 
@@ -39,6 +39,9 @@ class LessEqual(Module):
     ```
     """
 
+    operator = op.le
+    """ Comparison operator, used directly by conditions """
+
     def run(self, left, right):
         """
         Represent an greater operator.
@@ -46,7 +49,7 @@ class LessEqual(Module):
             - **left**: Left element to be compared.
             - **right**: Right element to be compared.
         """
-        return Comparator(left, right, op.le)
+        return compare(left, right, self.operator)
 
     def get_arguments(self):
         return [
@@ -3,7 +3,7 @@ This file contains class definition for creating a less or equal comparator.
 """
 import operator as op
 
-from tsteno.atoms.comparator import Comparator
+from tsteno.kernel.packed import compare
 from tsteno.atoms.module import Module, ModuleArg
 
 
@@ -38,6 +38,9 @@ class LessThan(Module):
     ```
     """
 
+    operator = op.lt
+    """ Comparison operator, used directly by conditions """
+
     def run(self, left, right):
         """
         Represent a less operator.
@@ -45,7 +48,7 @@ class LessThan(Module):
             - **left**: Left element to be compared.
             - **right**: Right element to be compared.
         """
-        return Comparator(left, right, op.lt)
+        return compare(left, right, self.operator)
 
     def get_arguments(self):
         return [
@@ -3,7 +3,7 @@ This file contains class definition for creating a less or equal comparator.
 """
 import operator as op
 
-from tsteno.atoms.comparator import Comparator
+from tsteno.kernel.packed import compare
 from tsteno.atoms.module import Module, ModuleArg
 
 
@@ -25,6 +25,9 @@ class NotEqual(Module):
     ```
     """
 
+    operator = op.ne
+    """ Comparison operator, used directly by conditions """
+
     def run(self, left, right):
         """
         Represent a not equal operator.
@@ -32,7 +35,7 @@ class NotEqual(Module):
             - **left**: Left element to be compared.
             - **right**: Right element to be compared.
         """
-        return Comparator(left, right, op.ne)
+        return compare(left, right, self.operator)
 
     def get_arguments(self):
         return [
@@ -44,3 +47,7 @@ class NotEqual(Module):
 
         test.assertTrue(evaluation.evaluate_code('x+1!=2+x').eval())
         test.assertFalse(evaluation.evaluate_code('x+1!=x+1').eval())
+
+        test.assertIs(evaluation.evaluate_code('{1, 2} != {1, 2}'), False)
+        test.assertEqual(
+            evaluation.evaluate_code('If[{1, 2} != {2}, 1, 0]'), 1)
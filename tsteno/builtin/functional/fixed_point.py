@@ -0,0 +1,60 @@
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_SPECIAL_CONTEXT
+from tsteno.atoms.module import ARG_FLAG_OPTIONAL
+
+
+class FixedPoint(Module):
+    """
+    Starting with expr, applies f repeatedly until the result no longer
+    changes (or at most n times).
+    ```
+    FixedPoint[f, expr]
+    FixedPoint[f, expr, n]
+    ```
+
+    # Examples
+    Newton iteration for `Sqrt[2]`.
+
+    **Input:**
+    ```
+    Set[newton[x_], Module[{}, (x + 2 / x) / 2]]; FixedPoint[newton, 1.0]
+    ```
+    **Output:**
+    ```
+    1.414213562373095
+    ```
+    """
+
+    def run(self, context, f, expr, n=None):
+        apply = self.get_kernel().get_kext('eval').bind_function(f, context)
+        iterations = 0
+
+        while n is None or iterations < n:
+            result = apply(expr)
+            iterations += 1
+
+            if result == expr:
+                break
+            expr = result
+
+        return expr
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_SPECIAL_CONTEXT),
+            ModuleArg(),
+            ModuleArg(),
+            ModuleArg(ARG_FLAG_OPTIONAL)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code(
+            'Set[newton[x_], Module[{}, (x + 2 / x) / 2]]; '
+            'FixedPoint[newton, 1.0]'), 1.414213562373095)
+
+        test.assertEqual(evaluation.evaluate_code(
+            'FixedPoint[newton, 1.0, 2]'), 1.4166666666666665)
+
+        test.assertAlmostEqual(evaluation.evaluate_code(
+            'FixedPoint[Cos, 1.0]'), 0.739085133215161)
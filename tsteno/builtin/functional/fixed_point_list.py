@@ -0,0 +1,61 @@
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_SPECIAL_CONTEXT
+from tsteno.atoms.module import ARG_FLAG_OPTIONAL
+
+
+class FixedPointList(Module):
+    """
+    Generates a list giving the results of applying f repeatedly, starting
+    with expr, until the results no longer change (or at most n times).
+    ```
+    FixedPointList[f, expr]
+    FixedPointList[f, expr, n]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    Set[newton[x_], Module[{}, (x + 2 / x) / 2]];
+    FixedPointList[newton, 1, 3]
+    ```
+    **Output:**
+    ```
+    {1, 3/2, 17/12, 577/408}
+    ```
+    """
+
+    def run(self, context, f, expr, n=None):
+        apply = self.get_kernel().get_kext('eval').bind_function(f, context)
+        results = [expr]
+
+        while n is None or len(results) <= n:
+            result = apply(expr)
+            results.append(result)
+
+            if result == expr:
+                break
+            expr = result
+
+        return results
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_SPECIAL_CONTEXT),
+            ModuleArg(),
+            ModuleArg(),
+            ModuleArg(ARG_FLAG_OPTIONAL)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        evaluation.evaluate_code(
+            'Set[newton[x_], Module[{}, (x + 2 / x) / 2]];')
+
+        test.assertEqual(
+            evaluation.evaluate_code('FixedPointList[newton, 1, 3]'),
+            evaluation.evaluate_code('{1, 3/2, 17/12, 577/408}'))
+
+        # Last two results are equal
+        results = evaluation.evaluate_code('FixedPointList[newton, 1.0]')
+        test.assertEqual(results[-1], results[-2])
+        test.assertEqual(results[-1], 1.414213562373095)
@@ -0,0 +1,64 @@
+import numpy as np
+from tsteno.atoms.sequence import Sequence
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_SPECIAL_CONTEXT
+from tsteno.atoms.module import ARG_FLAG_OPTIONAL
+
+
+class Fold(Module):
+    """
+    Gives the last element of `FoldList[f, x, list]`.
+    ```
+    Fold[f, x, list]
+    Fold[f, list]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    Fold[f, x, {a, b, c}]
+    ```
+    **Output:**
+    ```
+    f(f(f(x, a), b), c)
+    ```
+    """
+
+    def run(self, context, f, x, lst=None):
+        if lst is None:
+            if not isinstance(x, (list, Sequence, np.ndarray)) or not x:
+                raise Exception('Fold: `{}` is not a non empty list'.format(x))
+            x, lst = x[0], x[1:]
+
+        if not isinstance(lst, (list, Sequence, np.ndarray)):
+            raise Exception('Fold: `{}` is not a list'.format(lst))
+
+        apply = self.get_kernel().get_kext('eval').bind_function(f, context)
+
+        for item in lst:
+            x = apply(x, item)
+
+        return x
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_SPECIAL_CONTEXT),
+            ModuleArg(),
+            ModuleArg(),
+            ModuleArg(ARG_FLAG_OPTIONAL)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(
+            evaluation.evaluate_code('Fold[f, x, {a, b, c}]'),
+            evaluation.evaluate_code('f[f[f[x, a], b], c]').get_sympy())
+        test.assertEqual(
+            evaluation.evaluate_code('Fold[Plus, 0, {1, 2, 3, 4}]'), 10)
+        test.assertEqual(
+            evaluation.evaluate_code('Fold[Product, {1, 2, 3, 4}]'), 24)
+
+        # Horner's rule with a user defined function
+        test.assertEqual(evaluation.evaluate_code(
+            'Set[horner[acc_, c_], Module[{}, 10 * acc + c]]; '
+            'Fold[horner, 0, {1, 2, 3}]'), 123)
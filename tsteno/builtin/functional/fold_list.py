@@ -0,0 +1,64 @@
+import numpy as np
+from tsteno.atoms.sequence import Sequence
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_SPECIAL_CONTEXT
+from tsteno.atoms.module import ARG_FLAG_OPTIONAL
+
+
+class FoldList(Module):
+    """
+    Gives `{x, f[x, a], f[f[x, a], b], ...}`.
+    ```
+    FoldList[f, x, {a, b, ...}]
+    FoldList[f, {x, a, b, ...}]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    FoldList[Plus, 0, {1, 2, 3}]
+    ```
+    **Output:**
+    ```
+    {0, 1, 3, 6}
+    ```
+    """
+
+    def run(self, context, f, x, lst=None):
+        if lst is None:
+            if not isinstance(x, (list, Sequence, np.ndarray)) or not x:
+                raise Exception(
+                    'FoldList: `{}` is not a non empty list'.format(x))
+            x, lst = x[0], x[1:]
+
+        if not isinstance(lst, (list, Sequence, np.ndarray)):
+            raise Exception('FoldList: `{}` is not a list'.format(lst))
+
+        apply = self.get_kernel().get_kext('eval').bind_function(f, context)
+
+        results = [None] * (len(lst) + 1)
+        results[0] = x
+
+        for i, item in enumerate(lst):
+            results[i + 1] = apply(results[i], item)
+
+        return results
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_SPECIAL_CONTEXT),
+            ModuleArg(),
+            ModuleArg(),
+            ModuleArg(ARG_FLAG_OPTIONAL)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(
+            evaluation.evaluate_code('FoldList[Plus, 0, {1, 2, 3}]'),
+            [0, 1, 3, 6])
+        test.assertEqual(
+            evaluation.evaluate_code('FoldList[Product, {1, 2, 3, 4}]'),
+            [1, 2, 6, 24])
+        test.assertEqual(
+            evaluation.evaluate_code('FoldList[Plus, 0, {}]'), [0])
@@ -0,0 +1,56 @@
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_SPECIAL_CONTEXT
+
+
+class Nest(Module):
+    """
+    Gives an expression with f applied n times to expr.
+    ```
+    Nest[f, expr, n]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    Nest[f, x, 3]
+    ```
+    **Output:**
+    ```
+    f(f(f(x)))
+    ```
+    """
+
+    def run(self, context, f, expr, n):
+        if int(n) != n or n < 0:
+            raise Exception(
+                'Nest: `{}` is not a non negative integer'.format(n))
+
+        apply = self.get_kernel().get_kext('eval').bind_function(f, context)
+
+        for _ in range(int(n)):
+            expr = apply(expr)
+
+        return expr
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_SPECIAL_CONTEXT),
+            ModuleArg(),
+            ModuleArg(),
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(
+            evaluation.evaluate_code('Nest[f, x, 3]'),
+            evaluation.evaluate_code('f[f[f[x]]]').get_sympy())
+        test.assertEqual(evaluation.evaluate_code('Nest[Sqrt, 256, 3]'), 2)
+        test.assertEqual(evaluation.evaluate_code('Nest[Sqrt, 256, 0]'), 256)
+
+        # User defined functions
+        test.assertEqual(evaluation.evaluate_code(
+            'Set[twice[x_], Module[{}, 2 * x]]; Nest[twice, 1, 10]'), 1024)
+
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'Nest[f, x, -1]')
@@ -0,0 +1,55 @@
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_SPECIAL_CONTEXT
+
+
+class NestList(Module):
+    """
+    Gives a list of the results of applying f to expr 0 through n times.
+    ```
+    NestList[f, expr, n]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    NestList[f, x, 2]
+    ```
+    **Output:**
+    ```
+    {x, f(x), f(f(x))}
+    ```
+    """
+
+    def run(self, context, f, expr, n):
+        if int(n) != n or n < 0:
+            raise Exception(
+                'NestList: `{}` is not a non negative integer'.format(n))
+
+        apply = self.get_kernel().get_kext('eval').bind_function(f, context)
+
+        results = [None] * (int(n) + 1)
+        results[0] = expr
+
+        for i in range(1, len(results)):
+            results[i] = apply(results[i - 1])
+
+        return results
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_SPECIAL_CONTEXT),
+            ModuleArg(),
+            ModuleArg(),
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(
+            evaluation.evaluate_code('NestList[Sqrt, 256, 3]'),
+            [256, 16, 4, 2])
+
+        # Recurrences
+        test.assertEqual(evaluation.evaluate_code(
+            'Set[step[x_], Module[{}, 3 * x + 1]]; NestList[step, 0, 4]'),
+            [0, 1, 4, 13, 40])
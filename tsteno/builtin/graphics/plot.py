@@ -3,6 +3,7 @@ from tsteno.atoms.module import Module, ModuleArg
 from tsteno.atoms.module import ARG_FLAG_NO_AUTO_EVAL
 from tsteno.atoms.module import ARG_FLAG_SPECIAL_CONTEXT
 from tsteno.atoms.plot import Plot as Plt
+from tsteno.atoms.interpolating_function import InterpolatingFunction
 import math
 
 
@@ -28,8 +29,15 @@ class Plot(Module):
             100, min(1000, math.ceil(2 * 100 * abs(xmax - x0))))
 
         x_points = np.linspace(x0, xmax, plot_accuracy)
-        y_points = np.array([self.evaluate_f(f, x, xi, context)
-                             for xi in x_points])
+        y_first = self.evaluate_f(f, x, x_points[0], context)
+
+        if isinstance(y_first, InterpolatingFunction):
+            # Sample function directly (all points at once)
+            return Plt(list(x_points), y_first.sample(x_points).tolist())
+
+        y_points = np.array([y_first] + [
+            self.evaluate_f(f, x, xi, context) for xi in x_points[1:]
+        ])
 
         return Plt(list(x_points), list(y_points))
 
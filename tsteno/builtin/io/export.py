@@ -0,0 +1,77 @@
+"""
+This file contains class definition for writing data files.
+"""
+import os
+import tempfile
+import numpy as np
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_OPTIONAL
+from tsteno.kernel.files import get_format, write
+
+
+class Export(Module):
+    """
+    Writes an expression to a file, and gives the file path. Format is
+    given by file extension (`.csv`, `.tsv`, `.npy`) unless it's given
+    explicitly.
+    ```
+    Export[path, expr]
+    Export[path, expr, format]
+    ```
+
+    Arrays of numbers are written in chunks of rows. Lists are written as
+    one column, and NPY files only contain arrays of numbers.
+
+    # Examples
+    **Input:**
+    ```
+    Export["squares.csv", Table[{i, i^2}, {i, 1, 3}]]
+    ```
+
+    **Output:**
+    ```
+    squares.csv
+    ```
+    """
+
+    def run(self, path, value, file_format=None):
+        full_path = os.path.expanduser(str(path))
+        write(full_path, value, get_format(full_path, file_format, 'Export'))
+        return path
+
+    def get_arguments(self):
+        return [
+            ModuleArg(),
+            ModuleArg(),
+            ModuleArg(ARG_FLAG_OPTIONAL)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        with tempfile.TemporaryDirectory() as directory:
+            def path(name):
+                return os.path.join(directory, name).replace('\\', '/')
+
+            test.assertEqual(evaluation.evaluate_code(
+                'Export["{}", Range[5]]'.format(path('a.npy'))),
+                path('a.npy'))
+            test.assertEqual(np.load(path('a.npy')).tolist(), [1, 2, 3, 4, 5])
+
+            evaluation.evaluate_code(
+                'Export["{}", {{{{1, 2.5}}, {{3, 4}}}}]'.format(path('b.csv')))
+            with open(path('b.csv')) as file:
+                test.assertEqual(file.read(), '1.0,2.5\n3.0,4.0\n')
+
+            # Round trip
+            test.assertEqual(evaluation.evaluate_code(
+                'Import[Export["{}", Table[{{i, i^2}}, {{i, 1, 3}}]]]'.format(
+                    path('c.tsv'))).tolist(), [[1, 1], [2, 4], [3, 9]])
+
+            # Symbolic values are written as code
+            evaluation.evaluate_code(
+                'Export["{}", {{{{x, 1}}}}, "CSV"]'.format(path('d.txt')))
+            with open(path('d.txt')) as file:
+                test.assertEqual(file.read(), 'x,1\n')
+
+            test.assertRaises(Exception, evaluation.evaluate_code,
+                              'Export["{}", {{x}}]'.format(path('e.npy')))
@@ -0,0 +1,87 @@
+"""
+This file contains class definition for reading data files.
+"""
+import os
+import tempfile
+import numpy as np
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_OPTIONAL
+from tsteno.kernel.files import get_format, read
+
+
+class Import(Module):
+    """
+    Reads data from a file. Format is given by file extension (`.csv`,
+    `.tsv`, `.npy`) unless it's given explicitly.
+    ```
+    Import[path]
+    Import[path, format]
+    ```
+
+    Numbers are read with Numpy as packed arrays, without parsing them as
+    code. NPY files are memory-mapped, so only the parts that are used are
+    read from disk. CSV and TSV files are parsed in chunks; tables with
+    fields that aren't numbers are read as lists of rows.
+
+    # Examples
+    **Input:**
+    ```
+    Export["data.npy", Range[5]]; Total[Import["data.npy"]]
+    ```
+
+    **Output:**
+    ```
+    15
+    ```
+    """
+
+    def run(self, path, file_format=None):
+        path = os.path.expanduser(str(path))
+        return read(path, get_format(path, file_format, 'Import'))
+
+    def get_arguments(self):
+        return [
+            ModuleArg(),
+            ModuleArg(ARG_FLAG_OPTIONAL)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        with tempfile.TemporaryDirectory() as directory:
+            def path(name):
+                return os.path.join(directory, name).replace('\\', '/')
+
+            np.save(path('a.npy'), np.arange(12).reshape(3, 4))
+            result = evaluation.evaluate_code(
+                'Import["{}"]'.format(path('a.npy')))
+            test.assertIsInstance(result, np.memmap)
+            test.assertEqual(result.tolist(), np.arange(12).reshape(
+                3, 4).tolist())
+
+            with open(path('b.csv'), 'w') as file:
+                file.write('1,2\n3,4\n')
+            result = evaluation.evaluate_code(
+                'Import["{}"]'.format(path('b.csv')))
+            test.assertEqual(result.dtype.kind, 'i')
+            test.assertEqual(result.tolist(), [[1, 2], [3, 4]])
+
+            with open(path('c.txt'), 'w') as file:
+                file.write('0.5\t1e3\n-inf\t2\n')
+            test.assertEqual(evaluation.evaluate_code(
+                'Import["{}", "TSV"]'.format(path('c.txt'))).tolist(),
+                [[0.5, 1000.0], [-np.inf, 2.0]])
+
+            # Mixed tables are read as lists
+            with open(path('d.csv'), 'w') as file:
+                file.write('name,value\nx,1.5\ny,2\n')
+            test.assertEqual(evaluation.evaluate_code(
+                'Import["{}"]'.format(path('d.csv'))),
+                [['name', 'value'], ['x', 1.5], ['y', 2]])
+
+            with open(path('e.csv'), 'w'):
+                pass
+            test.assertEqual(evaluation.evaluate_code(
+                'Import["{}"]'.format(path('e.csv'))), [])
+
+            test.assertRaises(Exception, evaluation.evaluate_code,
+                              'Import["{}"]'.format(path('f.json')))
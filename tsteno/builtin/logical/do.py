@@ -0,0 +1,115 @@
+from itertools import product
+from tsteno.atoms.module import ARG_FLAG_NO_AUTO_EVAL, ARG_FLAG_SPECIAL_CONTEXT
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_ALL_NEXT
+
+
+class Do(Module):
+    """
+    Evaluates expr n times, or once for each value of the iterators
+    (innermost iterator is the last one).
+    ```
+    Do[expr, n]
+    Do[expr, {i, imax}]
+    Do[expr, {i, imin, imax, di}]
+    Do[expr, {i, {i1, i2, ...}}]
+    Do[expr, {i, imin, imax}, {j, jmin, jmax}, ...]
+    ```
+
+    Iterator variables are restored after the loop.
+
+    # Examples
+    **Input:**
+    ```
+    s = 0; Do[s = s + i, {i, 1, 10}]; s
+    ```
+    **Output:**
+    ```
+    55
+    ```
+    """
+
+    def run(self, context, body, *iterators):
+        if len(iterators) == 1 and not isinstance(iterators[0], list):
+            for _ in range(int(iterators[0])):
+                body()
+            return None
+
+        evaluation = self.get_kernel().get_kext('eval')
+
+        names = []
+        ranges = []
+        for iterator in iterators:
+            name, values = self.get_iterator(iterator, context)
+            names.append(name)
+            ranges.append(values)
+
+        if context.get_local_context():
+            variables = context.user_variables
+        else:
+            variables = evaluation.user_variables
+
+        missing = object()
+        previous = {name: variables.get(name, missing) for name in names}
+
+        try:
+            if len(names) == 1:
+                name = names[0]
+                for value in ranges[0]:
+                    variables[name] = value
+                    body()
+            else:
+                for values in product(*ranges):
+                    variables.update(zip(names, values))
+                    body()
+        finally:
+            for name, value in previous.items():
+                if value is missing:
+                    variables.pop(name, None)
+                else:
+                    variables[name] = value
+
+        return None
+
+    def get_iterator(self, iterator, context):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        if not isinstance(iterator, list) or not 2 <= len(iterator) <= 4:
+            raise Exception('Do: `{}` is not a valid iterator'.format(
+                iterator))
+
+        name = str(iterator[0])
+
+        if len(iterator) == 2 and isinstance(iterator[1], list):
+            return name, iterator[1]
+
+        return name, evaluation.run_function('Range', iterator[1:], context)
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_SPECIAL_CONTEXT),
+            ModuleArg(ARG_FLAG_NO_AUTO_EVAL),
+            ModuleArg(ARG_FLAG_ALL_NEXT)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code(
+            's = 0; Do[s = s + i, {i, 1, 10}]; s'), 55)
+        test.assertEqual(evaluation.evaluate_code(
+            's = 0; Do[s = s + 2, 5]; s'), 10)
+        test.assertEqual(evaluation.evaluate_code(
+            's = 0; Do[s = s + i, {i, 1, 10, 3}]; s'), 22)
+        test.assertEqual(evaluation.evaluate_code(
+            's = 0; Do[s = s + i, {i, {2, 3, 5}}]; s'), 10)
+        test.assertEqual(evaluation.evaluate_code(
+            's = 0; Do[s = s + i * j, {i, 1, 3}, {j, 1, 2}]; s'), 18)
+
+        # Iterator variable is restored
+        test.assertEqual(evaluation.evaluate_code(
+            'k = 7; Do[k, {k, 1, 3}]; k'), 7)
+
+        # Nested in user modules
+        test.assertEqual(evaluation.evaluate_code(
+            'Set[total[n_], Module[{s = 0}, Do[s = s + i, {i, 1, n}]; s]]; '
+            'total[4]'), 10)
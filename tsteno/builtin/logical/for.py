@@ -1,4 +1,5 @@
 from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_NO_AUTO_EVAL
+from tsteno.atoms.module import ARG_FLAG_CONDITION
 
 
 class For(Module):
@@ -26,13 +27,14 @@ class For(Module):
     def run(self, initial, condition, final, f):
         initial()
 
-        while bool(condition()):
+        while condition():
             f()
             final()
 
     def get_arguments(self):
         return [
-            ModuleArg(ARG_FLAG_NO_AUTO_EVAL), ModuleArg(ARG_FLAG_NO_AUTO_EVAL),
+            ModuleArg(ARG_FLAG_NO_AUTO_EVAL),
+            ModuleArg(ARG_FLAG_NO_AUTO_EVAL | ARG_FLAG_CONDITION),
             ModuleArg(ARG_FLAG_NO_AUTO_EVAL), ModuleArg(ARG_FLAG_NO_AUTO_EVAL)
         ]
 
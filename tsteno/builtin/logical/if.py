@@ -1,4 +1,6 @@
 from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_NO_AUTO_EVAL
+from tsteno.atoms.module import ARG_FLAG_CONDITION
+from tsteno.kernel.kexts.evaluation import Context
 
 
 class If(Module):
@@ -17,7 +19,7 @@ class If(Module):
 
     def get_arguments(self):
         return [
-            ModuleArg(), ModuleArg(ARG_FLAG_NO_AUTO_EVAL),
+            ModuleArg(ARG_FLAG_CONDITION), ModuleArg(ARG_FLAG_NO_AUTO_EVAL),
             ModuleArg(ARG_FLAG_NO_AUTO_EVAL)
         ]
 
@@ -32,3 +34,14 @@ class If(Module):
 
         test.assertEqual(evaluation.evaluate_code(
             'If[1 < 2, i = 0; i = i + 1; i = i * 3.14; Return[i], Return[1]]'), 3.14)
+
+        # Exact and symbolic operands are compared by comparator modules
+        test.assertEqual(evaluation.evaluate_code(
+            'If[1/3 < 1/2, Return[2], Return[3]]'), 2)
+        test.assertEqual(evaluation.evaluate_code(
+            'If[x + 1 == 1 + x, Return[2], Return[3]]'), 2)
+
+        # Numeric conditions are native booleans
+        tokens = list(evaluation.tokenizer.get_tokens('2 < 3'))
+        node = next(evaluation.parser.get_nodes(tokens))
+        test.assertIs(evaluation.evaluate_condition(node, Context()), True)
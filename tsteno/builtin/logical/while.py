@@ -1,4 +1,5 @@
 from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_NO_AUTO_EVAL
+from tsteno.atoms.module import ARG_FLAG_CONDITION
 
 
 class While(Module):
@@ -10,12 +11,13 @@ class While(Module):
     """
 
     def run(self, test, body):
-        while test().eval():
+        while test():
             body()
 
     def get_arguments(self):
         return [
-            ModuleArg(ARG_FLAG_NO_AUTO_EVAL), ModuleArg(ARG_FLAG_NO_AUTO_EVAL),
+            ModuleArg(ARG_FLAG_NO_AUTO_EVAL | ARG_FLAG_CONDITION),
+            ModuleArg(ARG_FLAG_NO_AUTO_EVAL),
         ]
 
     def run_test(self, test):
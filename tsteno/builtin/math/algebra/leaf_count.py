@@ -0,0 +1,50 @@
+import sympy as sp
+from tsteno.atoms.module import ModuleArg, Module
+
+
+def leaf_count(expr):
+    if isinstance(expr, (list, tuple)):
+        return 1 + sum(leaf_count(item) for item in expr)
+
+    if not isinstance(expr, sp.Basic):
+        return 1
+
+    if isinstance(expr, sp.Rational) and not expr.is_Integer:
+        # Same as Rational[p, q]
+        return 3
+
+    return 1 + sum(leaf_count(arg) for arg in expr.args) if expr.args else 1
+
+
+class LeafCount(Module):
+    """
+    Gives the total number of indivisible subexpressions in expr.
+    ```
+    LeafCount[expr]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    LeafCount[1 + a + b^2]
+    ```
+    **Output:**
+    ```
+    6
+    ```
+    """
+
+    def run(self, expr):
+        return leaf_count(expr)
+
+    def get_arguments(self):
+        return [
+            ModuleArg(),
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code('LeafCount[1 + a + b^2]'), 6)
+        test.assertEqual(evaluation.evaluate_code('LeafCount[x]'), 1)
+        test.assertEqual(evaluation.evaluate_code('LeafCount[{1, 2}]'), 3)
@@ -1,9 +1,36 @@
+import time
+from collections import OrderedDict
 import sympy as sp
 from tsteno.atoms.module import ModuleArg, Module
+from tsteno.atoms.module import ARG_FLAG_OPTIONAL, ARG_FLAG_ALL_NEXT
+from tsteno.kernel.kexts.evaluation import Context
+from tsteno.kernel.portfolio import Portfolio, PortfolioFailed
 
-SIMPLIFY_FUNCTIONS = [
-    sp.simplify, sp.factor
+CHEAP_SIMPLIFY_FUNCTIONS = [
+    sp.cancel, sp.factor_terms, sp.together, sp.powsimp, sp.trigsimp
 ]
+""" Fast transformations, applied repeatedly while expression improves """
+
+EXPENSIVE_SIMPLIFY_FUNCTIONS = [
+    sp.factor, sp.simplify
+]
+""" Slow transformations, applied within remaining time budget """
+
+WORKER_MIN_OPS = 50
+"""
+Expressions with at least this number of operations are given to expensive
+transformations in worker processes
+"""
+
+DEFAULT_MEASURE = sp.count_ops
+""" Measure of expressions when no `ComplexityFunction` is given """
+
+DEFAULT_TIME_CONSTRAINT = 10
+""" Default maximum seconds spent simplifying """
+
+
+def is_expression(result):
+    return isinstance(result, sp.Basic)
 
 
 class Simplify(Module):
@@ -13,17 +40,148 @@ class Simplify(Module):
     Simplify[expr]
     ```
 
+    Options:
+        - **TimeConstraint** - Maximum seconds spent on transformations
+        (default 10), best form found so far is returned when exceeded.
+        - **ComplexityFunction** - Module used to measure expressions (by
+        default, number of operations).
+
+    Cheap transformations run in-process, and are not started once the time
+    constraint is exceeded. Expensive transformations of large expressions
+    run in a worker process (see `Portfolio`), killed when the time
+    constraint is exceeded, so an interrupted Sympy transformation can't
+    leave the kernel caches inconsistent.
+
+    With the default measure, the simplest form is factored, `Simplify[x^2-1]`
+    gives `(x - 1)*(x + 1)`.
+
+    # Examples
+    **Input:**
+    ```
+    Simplify[Sin[x]^2 + Cos[x]^2, ComplexityFunction -> LeafCount]
+    ```
+    **Output:**
+    ```
+    1
+    ```
     """
 
-    def run(self, f):
-        for fn in SIMPLIFY_FUNCTIONS:
-            f = fn(f)
+    def __init__(self, kernel):
+        super().__init__(kernel)
+        self.portfolios = {
+            fn: Portfolio(OrderedDict(((fn.__name__, fn), )), is_expression)
+            for fn in EXPENSIVE_SIMPLIFY_FUNCTIONS
+        }
+        """ Single transformation portfolios, by expensive transformation """
+
+    def run(self, f, *options):
+        options = self.configuration_list2dict(options)
+
+        time_constraint = float(options.get(
+            'TimeConstraint', DEFAULT_TIME_CONSTRAINT))
+        measure = self.get_measure(options.get('ComplexityFunction'))
+
+        if isinstance(f, list):
+            deadline = time.monotonic() + time_constraint
+            return [
+                self.simplify(item, measure, deadline - time.monotonic())
+                for item in f
+            ]
+
+        return self.simplify(f, measure, time_constraint)
+
+    def get_measure(self, complexity_function):
+        if complexity_function is None:
+            return DEFAULT_MEASURE
+
+        evaluation = self.get_kernel().get_kext('eval')
+        module = str(complexity_function)
+
+        return lambda expr: evaluation.run_function(module, [expr], Context())
 
-        return f
+    def simplify(self, f, measure, time_constraint):
+        if not isinstance(f, sp.Basic):
+            return f
+
+        deadline = time.monotonic() + time_constraint
+        best = self.improve(f, measure, deadline)
+
+        if measure is DEFAULT_MEASURE and best.args:
+            factored = self.transform(sp.factor, best, deadline)
+            if factored is not None:
+                best = factored
+
+        return best
+
+    def improve(self, f, measure, deadline):
+        """
+        Return:
+            - Simplest form of f (by measure) found by transformations
+            before deadline.
+        """
+        best = f
+        best_measure = self.measure(measure, f)
+
+        def apply(fn):
+            nonlocal best, best_measure
+
+            candidate = self.transform(fn, best, deadline)
+            if candidate is None:
+                return False
+
+            candidate_measure = self.measure(measure, candidate)
+            if candidate_measure < best_measure:
+                best, best_measure = candidate, candidate_measure
+                return True
+
+            return False
+
+        # Cheap transformations until expression stops improving.
+        improved = True
+        while improved and best.args:
+            improved = False
+            for fn in CHEAP_SIMPLIFY_FUNCTIONS:
+                improved = apply(fn) or improved
+
+        for fn in EXPENSIVE_SIMPLIFY_FUNCTIONS:
+            if not best.args:
+                break
+            apply(fn)
+
+        return best
+
+    def transform(self, fn, f, deadline):
+        """
+        Return:
+            - Result of transformation, or None if it fails or deadline is
+            exceeded.
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+
+        if fn not in self.portfolios or sp.count_ops(f) < WORKER_MIN_OPS:
+            try:
+                return fn(f)
+            except Exception:
+                return None
+
+        try:
+            return self.portfolios[fn].solve(
+                fn.__name__, (f, ), timeout=remaining)[1]
+        except PortfolioFailed:
+            return None
+
+    def measure(self, measure, f):
+        try:
+            return measure(f)
+        except Exception:
+            return float('inf')
 
     def get_arguments(self):
         return [
             ModuleArg(),
+            ModuleArg(ARG_FLAG_OPTIONAL | ARG_FLAG_ALL_NEXT)
         ]
 
     def run_test(self, test):
@@ -32,5 +190,23 @@ class Simplify(Module):
         test.assertEqual(evaluation.evaluate_code(
             'Simplify[x^2-1]'), sp.parse_expr('(x - 1)*(x + 1)'))
 
+        test.assertEqual(evaluation.evaluate_code(
+            'Simplify[(x^2-1)/(x-1)]'), sp.parse_expr('x + 1'))
+
         test.assertEqual(evaluation.evaluate_code(
             'Simplify[Sin[x]^2+Cos[x]^2]'), 1)
+
+        test.assertEqual(evaluation.evaluate_code(
+            'Simplify[Sin[x]^2+Cos[x]^2, ComplexityFunction -> LeafCount]'),
+            1)
+
+        test.assertEqual(evaluation.evaluate_code(
+            'Simplify[{x^2 + 2 x + 1 - (x + 1)^2, (x^2-1)/(x-1)}]'),
+            [0, sp.parse_expr('x + 1')])
+
+        # Big expression, best form found within time constraint.
+        t0 = time.monotonic()
+        evaluation.evaluate_code(
+            'Simplify[Expand[(x + y + Sin[z])^12] / (x + y), '
+            'TimeConstraint -> 1]')
+        test.assertLess(time.monotonic() - t0, 3)
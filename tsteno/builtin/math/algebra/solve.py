@@ -1,8 +1,16 @@
 import operator
-from sympy import solve, Symbol
+import numpy as np
+import sympy as sp
+from sympy import solve, linsolve, Symbol
 from tsteno.atoms.module import ModuleArg, Module
 from tsteno.atoms.rule import RuleSet
 
+DENSE_MAX_VARIABLES = 2000
+"""
+Floating point linear systems with more variables are solved with sparse
+elimination instead of LAPACK (dense matrices would be too big).
+"""
+
 
 class Solve(Module):
     """
@@ -10,6 +18,9 @@ class Solve(Module):
     ```
     Solve[expr,vars]
     ```
+
+    Linear systems are solved with a sparse exact elimination, or with LAPACK
+    if coefficients are floating point numbers.
     """
 
     def run(self, expressions, variables):
@@ -19,9 +30,12 @@ class Solve(Module):
         fmt_expr = []
 
         for expression in expressions:
-            fmt_expr.append(Solve.calculate_one_expr(expression))
+            fmt_expr.append(sp.sympify(Solve.calculate_one_expr(expression)))
+
+        solutions = self.solve_linear(fmt_expr, variables)
+        if solutions is None:
+            solutions = solve(fmt_expr, variables, dict=True)
 
-        solutions = solve(fmt_expr, variables, dict=True)
         solutions = list(map(lambda d: RuleSet(
             self.get_kernel(),
             {str(k): v for k, v in d.items()}
@@ -32,6 +46,112 @@ class Solve(Module):
 
         return solutions
 
+    def solve_linear(self, expressions, variables):
+        """
+        Solve a linear system.
+
+        Return:
+            - List of solution dicts, or None if system isn't linear.
+        """
+        if not isinstance(variables, list):
+            variables = [variables]
+
+        if not variables or \
+                not all(isinstance(var, Symbol) for var in variables):
+            return None
+
+        system = Solve.linear_coefficients(expressions, variables)
+        if system is None:
+            return None
+
+        rows, constants, is_float = system
+
+        if is_float and len(rows) == len(variables) and \
+                len(variables) <= DENSE_MAX_VARIABLES:
+            solution = Solve.solve_dense(rows, constants, len(variables))
+            if solution is not None:
+                return [dict(zip(variables, solution))]
+
+        solutions = linsolve(expressions, variables)
+        if solutions is sp.EmptySet:
+            return []
+
+        return [
+            {var: val for var, val in zip(variables, solution) if var != val}
+            for solution in solutions
+        ]
+
+    @staticmethod
+    def linear_coefficients(expressions, variables):
+        """
+        Extract a sparse coefficient matrix from linear expressions (`= 0`).
+
+        Return:
+            - Tuple with rows (list of dicts variable index to coefficient),
+            constants and if any coefficient is a floating point number, or
+            None if any expression isn't linear.
+        """
+        index = {var: i for i, var in enumerate(variables)}
+        rows = []
+        constants = []
+        is_float = False
+        is_numeric = True
+
+        for expression in expressions:
+            row = {}
+            constant = 0
+
+            for term in sp.Add.make_args(sp.expand(expression)):
+                coefficient, dependent = term.as_independent(
+                    *variables, as_Add=False)
+
+                if dependent == 1:
+                    constant -= coefficient
+                elif dependent in index:
+                    position = index[dependent]
+                    row[position] = row.get(position, 0) + coefficient
+                else:
+                    return None
+
+                if not coefficient.is_number:
+                    is_numeric = False
+                elif coefficient.has(sp.Float):
+                    is_float = True
+
+            rows.append(row)
+            constants.append(constant)
+
+        return rows, constants, is_float and is_numeric
+
+    @staticmethod
+    def solve_dense(rows, constants, size):
+        """
+        Solve a square floating point system with LAPACK.
+
+        Return:
+            - List of values, or None if system is singular.
+        """
+        try:
+            matrix = np.zeros((len(rows), size), dtype=complex)
+            for i, row in enumerate(rows):
+                for j, coefficient in row.items():
+                    matrix[i, j] = complex(coefficient)
+
+            vector = np.array([complex(value) for value in constants])
+        except TypeError:
+            return None
+
+        if not matrix.imag.any() and not vector.imag.any():
+            matrix = matrix.real
+            vector = vector.real
+
+        try:
+            solution = np.linalg.solve(matrix, vector)
+        except np.linalg.LinAlgError:
+            return None
+
+        return [value.item() for value in solution]
+
     @staticmethod
     def calculate_one_expr(expr):
         if expr.op == operator.eq:
@@ -64,3 +184,32 @@ class Solve(Module):
         test.assertEqual(evaluation.evaluate_code(
             'zzz = Solve[x+1==0, x]; x /. zzz'
         ), -1)
+
+        # Floating point linear system (LAPACK)
+        eq_sols = evaluation.evaluate_code(
+            'Solve[{x+y==4.0, 2*x+y==5}, {x, y}]'
+        )
+        test.assertIsInstance(eq_sols['x'], float)
+        test.assertAlmostEqual(eq_sols['x'], 1)
+        test.assertAlmostEqual(eq_sols['y'], 3)
+
+        # Underdetermined, inconsistent and parametric linear systems
+        test.assertEqual(evaluation.evaluate_code(
+            'Solve[x+y==4, {x, y}]')['x'], sp.parse_expr('4 - y'))
+        test.assertEqual(evaluation.evaluate_code(
+            'Solve[{x+y==4, x+y==5}, {x, y}]'), [])
+        test.assertEqual(evaluation.evaluate_code(
+            'Solve[a*x==b, x]')['x'], sp.parse_expr('b/a'))
+
+        # Non linear systems
+        test.assertEqual(
+            len(evaluation.evaluate_code('Solve[x^2==4, x]')), 2)
+
+        # Big sparse system
+        xs = sp.symbols('x0:500')
+        equations = [2 * xs[0] - xs[1]] + [
+            -xs[i - 1] + 2 * xs[i] - xs[i + 1] for i in range(1, 499)
+        ] + [-xs[498] + 2 * xs[499] - 501]
+        solution = self.solve_linear(equations, list(xs))[0]
+        test.assertEqual(solution[xs[0]], 1)
+        test.assertEqual(solution[xs[499]], 500)
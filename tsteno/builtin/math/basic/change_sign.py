@@ -1,10 +1,16 @@
 from tsteno.atoms.module import Module, ModuleArg
+from tsteno.kernel.kexts.numerical import NATIVE_NUMBER_TYPES
 
 
 class ChangeSign(Module):
 
     def run(self, a):
-        return -a
+        numerical = self.get_kernel().get_kext('numerical')
+
+        if numerical.native_arithmetic and type(a) in NATIVE_NUMBER_TYPES:
+            return -a
+
+        return numerical.demote(-numerical.numericize(a))
 
     def get_arguments(self):
         return [
@@ -1,16 +1,43 @@
-from sympy import Rational
+from sympy import Rational, zoo, nan
 from tsteno.atoms.module import ModuleArg, Module
+from tsteno.kernel.kexts.numerical import NATIVE_NUMBER_TYPES
+from tsteno.kernel.kexts.numerical import NATIVE_INTEGER_TYPES
 from sympy.parsing.sympy_parser import parse_expr
 
 
 class Div(Module):
 
     def run(self, a, b):
+        numerical = self.get_kernel().get_kext('numerical')
 
-        if isinstance(a, int) and isinstance(b, int):
-            return Rational(a, b)
+        if numerical.is_machine():
+            a = numerical.to_machine(a)
+            b = numerical.to_machine(b)
 
-        return a / b
+            try:
+                return a / b
+            except ZeroDivisionError:
+                return zoo if a != 0 else nan
+
+        if numerical.native_arithmetic and \
+                type(a) in NATIVE_NUMBER_TYPES and \
+                type(b) in NATIVE_NUMBER_TYPES:
+            if isinstance(a, NATIVE_INTEGER_TYPES) and \
+                    isinstance(b, NATIVE_INTEGER_TYPES):
+                # Exact division keeps native integers, otherwise a rational.
+                if b != 0 and a % b == 0:
+                    return int(a) // int(b)
+
+                return Rational(int(a), int(b))
+
+            try:
+                return a / b
+            except ZeroDivisionError:
+                return zoo if a != 0 else nan
+
+        return numerical.demote(
+            numerical.numericize(a) / numerical.numericize(b)
+        )
 
     def get_arguments(self):
         return [
@@ -25,3 +52,7 @@ class Div(Module):
 
         # Test symbolic division.
         test.assertEqual(evaluation.evaluate_code('1/2'), parse_expr("1/2"))
+
+        # Exact integer division stays native.
+        test.assertIs(type(evaluation.evaluate_code('6/3')), int)
+        test.assertEqual(evaluation.evaluate_code('x/2'), parse_expr("x/2"))
@@ -1,11 +1,21 @@
 from tsteno.atoms.module import ModuleArg, Module
+from tsteno.kernel.kexts.numerical import NATIVE_NUMBER_TYPES
 from sympy.parsing.sympy_parser import parse_expr
 
 
 class Minus(Module):
 
     def run(self, a, b):
-        return a - b
+        numerical = self.get_kernel().get_kext('numerical')
+
+        if numerical.native_arithmetic and \
+                type(a) in NATIVE_NUMBER_TYPES and \
+                type(b) in NATIVE_NUMBER_TYPES:
+            return a - b
+
+        return numerical.demote(
+            numerical.numericize(a) - numerical.numericize(b)
+        )
 
     def get_arguments(self):
         return [
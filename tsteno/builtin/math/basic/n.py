@@ -0,0 +1,73 @@
+import math
+import sympy as sp
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_OPTIONAL
+from tsteno.kernel.kexts.numerical import NUMERICAL_MODE_MACHINE
+
+
+class N(Module):
+    """
+    Gives the numerical value of expr.
+    ```
+    N[expr]
+    ```
+    Machine precision is used by default, values are native floats.
+
+    ```
+    N[expr, n]
+    ```
+    Attempts to give a result with n-digit precision (using mpmath).
+
+    # Examples
+    **Input:**
+    ```
+    N[Pi, 20]
+    ```
+    **Output:**
+    ```
+    3.1415926535897932385
+    ```
+    """
+
+    def run(self, expr, digits=None):
+        numerical = self.get_kernel().get_kext('numerical')
+
+        if digits is None:
+            return numerical.to_machine(expr)
+
+        return numerical.to_precission(expr, int(digits))
+
+    def get_arguments(self):
+        return [
+            ModuleArg(),
+            ModuleArg(ARG_FLAG_OPTIONAL)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+        numerical = self.get_kernel().get_kext('numerical')
+
+        test.assertEqual(evaluation.evaluate_code('N[1/4]'), 0.25)
+        test.assertIsInstance(evaluation.evaluate_code('N[Pi]'), float)
+        test.assertEqual(evaluation.evaluate_code('N[{1/2, 2}]'), [0.5, 2])
+
+        test.assertEqual(
+            str(evaluation.evaluate_code('N[Pi, 20]')),
+            '3.1415926535897932385'
+        )
+
+        # Kernel-wide machine mode, every value is a native number.
+        previous_mode = numerical.get_mode()
+        numerical.set_mode(NUMERICAL_MODE_MACHINE)
+
+        try:
+            test.assertEqual(evaluation.evaluate_code('1/4 + 1/4'), 0.5)
+            test.assertIsInstance(
+                evaluation.evaluate_code('2 Pi / 360'), float)
+            test.assertEqual(evaluation.evaluate_code('Sin[0]'), 0.0)
+            test.assertEqual(evaluation.evaluate_code('Sqrt[-4]'), 2j)
+            test.assertEqual(
+                evaluation.evaluate_code('Exp[1]'), math.exp(1))
+            test.assertEqual(evaluation.evaluate_code('x + 1/2'),
+                             sp.Symbol('x') + 0.5)
+        finally:
+            numerical.set_mode(previous_mode)
@@ -5,7 +5,7 @@ from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_ALL_NEXT
 class Plus(Module):
 
     def run(self, *arguments):
-        return sum(arguments)
+        return self.get_kernel().get_kext('numerical').add(arguments)
 
     def get_arguments(self):
         return [
@@ -31,3 +31,16 @@ class Plus(Module):
         test.assertEqual(evaluation.evaluate_code(
             '1/2+1/3'), parse_expr("5/6")
         )
+
+        # Native numbers are kept native.
+        test.assertIs(type(evaluation.evaluate_code('1/2+1/2')), int)
+        test.assertIs(type(evaluation.evaluate_code('Plus[1, 2.5, 3]')), float)
+
+        test.assertEqual(evaluation.evaluate_code(
+            'Plus[x, 1, y, 2, x]'), parse_expr("2*x + y + 3")
+        )
+
+        # Long chains are evaluated as one n-ary sum.
+        polynomial = evaluation.evaluate_code(
+            "+".join("x^{}".format(k) for k in range(1, 3001)))
+        test.assertEqual(len(polynomial.args), 3000)
@@ -1,11 +1,53 @@
+from sympy import zoo, Pow as SympyPow, Rational
 from sympy.parsing.sympy_parser import parse_expr
 from tsteno.atoms.module import Module, ModuleArg
+from tsteno.kernel.kexts.numerical import NATIVE_NUMBER_TYPES
+from tsteno.kernel.kexts.numerical import NATIVE_INTEGER_TYPES
+
+
+def native_power(a, b):
+    try:
+        return a**b
+    except ZeroDivisionError:
+        return zoo
+    except OverflowError:
+        return float('inf')
 
 
 class Pow(Module):
 
     def run(self, a, b):
-        return a**b
+        numerical = self.get_kernel().get_kext('numerical')
+
+        if numerical.is_machine():
+            a = numerical.to_machine(a)
+            b = numerical.to_machine(b)
+
+            return native_power(a, b)
+
+        if numerical.native_arithmetic and \
+                type(a) in NATIVE_NUMBER_TYPES and \
+                type(b) in NATIVE_NUMBER_TYPES:
+            if isinstance(a, NATIVE_INTEGER_TYPES) and \
+                    isinstance(b, NATIVE_INTEGER_TYPES):
+                a = int(a)
+                b = int(b)
+
+                if b < 0:
+                    # Keep exact result for negative integer powers.
+                    return Rational(1, a**-b)
+
+            try:
+                return a**b
+            except ZeroDivisionError:
+                return zoo
+            except OverflowError:
+                # Too big for a machine float, given as a Sympy float
+                return SympyPow(a, b)
+
+        return numerical.demote(
+            numerical.numericize(a)**numerical.numericize(b)
+        )
 
     def get_arguments(self):
         return [
@@ -22,3 +64,11 @@ class Pow(Module):
         test.assertEqual(evaluation.evaluate_code(
             '2^10'), 2**10
         )
+
+        test.assertEqual(evaluation.evaluate_code(
+            '2^-2'), parse_expr("1/4")
+        )
+
+        test.assertEqual(evaluation.evaluate_code('4^0.5'), 2.0)
+        test.assertEqual(evaluation.evaluate_code('10^400.0'),
+                         parse_expr('1.0e400'))
@@ -1,13 +1,12 @@
-import operator
+import sympy as sp
 from sympy.parsing.sympy_parser import parse_expr
-from functools import reduce
 from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_ALL_NEXT
 
 
 class Product(Module):
 
     def run(self, *arguments):
-        return reduce(operator.mul, arguments)
+        return self.get_kernel().get_kext('numerical').multiply(arguments)
 
     def get_arguments(self):
         return [
@@ -30,3 +29,14 @@ class Product(Module):
         test.assertEqual(evaluation.evaluate_code(
             '6/3*3/6'), 1
         )
+
+        test.assertIs(type(evaluation.evaluate_code('6/3*3/6')), int)
+
+        test.assertEqual(evaluation.evaluate_code(
+            'Product[2, x, 3, y]'), parse_expr("6*x*y")
+        )
+
+        # Inexact coefficients are kept, not dropped as a unit
+        test.assertEqual(str(evaluation.evaluate_code('1.0*x')), '1.0*x')
+        test.assertIs(type(evaluation.evaluate_code('1.0*x /. x -> 3')),
+                      sp.Float)
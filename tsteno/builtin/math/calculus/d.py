@@ -1,4 +1,4 @@
-from sympy import parse_expr
+from sympy import parse_expr, Derivative, Dummy, Subs
 from tsteno.atoms.module import ModuleArg, Module
 from tsteno.atoms.module import ARG_FLAG_ALL_NEXT
 
@@ -13,7 +13,21 @@ class D(Module):
 
     def run(self, f, *variables):
         if hasattr(f, 'get_sympy'):
-            return f.get_sympy().diff()
+            f = f.get_sympy()
+
+            if not variables and len(f.args) == 1 and \
+                    not f.args[0].is_Symbol:
+                # Derivative at a point (`f'[0]`)
+                x = Dummy('x')
+                return Subs(Derivative(f.func(x), x), x, f.args[0])
+
+            return f.diff()
+
+        if not variables and isinstance(f, Subs) and \
+                isinstance(f.expr, Derivative):
+            x = f.variables[0]
+            return Subs(f.expr.diff(x), x, f.point[0])
+
         return f.diff(*variables)
 
     def get_arguments(self):
@@ -27,3 +41,8 @@ class D(Module):
 
         test.assertEqual(evaluation.evaluate_code(
             'D[x^4 * y^2, {x, 3}, {y, 1}]'), parse_expr('48*x*y'))
+
+        derivative = evaluation.evaluate_code("f''[0]")
+        test.assertIsInstance(derivative, Subs)
+        test.assertEqual(derivative.expr.derivative_count, 2)
+        test.assertEqual(derivative.point, (0, ))
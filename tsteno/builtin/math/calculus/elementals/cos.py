@@ -1,5 +1,6 @@
+import math
+import cmath
 import sympy as sp
-import numpy as np
 from tsteno.atoms.module import ModuleArg, Module, ARG_FLAG_ALLOW_APPLY
 
 
@@ -12,10 +13,9 @@ class Cos(Module):
     """
 
     def run(self, x):
-        if isinstance(x, float):
-            return np.cos(x)
+        numerical = self.get_kernel().get_kext('numerical')
 
-        return sp.cos(x)
+        return numerical.elemental(x, math.cos, cmath.cos, sp.cos)
 
     def get_arguments(self):
         return [
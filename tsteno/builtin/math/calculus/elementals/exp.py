@@ -1,5 +1,6 @@
+import math
+import cmath
 import sympy as sp
-import numpy as np
 from tsteno.atoms.module import ModuleArg, Module, ARG_FLAG_ALLOW_APPLY
 
 
@@ -12,10 +13,9 @@ class Exp(Module):
     """
 
     def run(self, x):
-        if isinstance(x, float):
-            return np.exp(x)
+        numerical = self.get_kernel().get_kext('numerical')
 
-        return sp.exp(x)
+        return numerical.elemental(x, math.exp, cmath.exp, sp.exp)
 
     def get_arguments(self):
         return [
@@ -1,8 +1,14 @@
+import math
+import cmath
 import sympy as sp
-import numpy as np
 from tsteno.atoms.module import ModuleArg, Module, ARG_FLAG_ALLOW_APPLY
 
 
+def machine_log(x):
+    # Limit at zero, as Numpy gives it
+    return math.log(x) if x else float('-inf')
+
+
 class Log(Module):
     """
     Gives the natural logarithm of z (logarithm to base ).
@@ -12,10 +18,9 @@ class Log(Module):
     """
 
     def run(self, x):
-        if isinstance(x, float):
-            return np.log(x)
+        numerical = self.get_kernel().get_kext('numerical')
 
-        return sp.log(x)
+        return numerical.elemental(x, machine_log, cmath.log, sp.log)
 
     def get_arguments(self):
         return [
@@ -30,3 +35,4 @@ class Log(Module):
 
         test.assertEqual(evaluation.evaluate_code(
             'Log[Exp[0]]'), 0)
+        test.assertEqual(evaluation.evaluate_code('Log[0.0]'), float('-inf'))
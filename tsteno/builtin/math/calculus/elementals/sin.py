@@ -1,5 +1,6 @@
+import math
+import cmath
 import sympy as sp
-import numpy as np
 from tsteno.atoms.module import ModuleArg, Module, ARG_FLAG_ALLOW_APPLY
 
 
@@ -12,10 +13,9 @@ class Sin(Module):
     """
 
     def run(self, x):
-        if isinstance(x, float):
-            return np.sin(x)
+        numerical = self.get_kernel().get_kext('numerical')
 
-        return sp.sin(x)
+        return numerical.elemental(x, math.sin, cmath.sin, sp.sin)
 
     def get_arguments(self):
         return [
@@ -1,5 +1,6 @@
+import math
+import cmath
 import sympy as sp
-import numpy as np
 from tsteno.atoms.module import ModuleArg, Module, ARG_FLAG_ALLOW_APPLY
 
 
@@ -12,10 +13,9 @@ class Tan(Module):
     """
 
     def run(self, x):
-        if isinstance(x, float):
-            return np.tan(x)
+        numerical = self.get_kernel().get_kext('numerical')
 
-        return sp.tan(x)
+        return numerical.elemental(x, math.tan, cmath.tan, sp.tan)
 
     def get_arguments(self):
         return [
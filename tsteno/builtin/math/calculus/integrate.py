@@ -1,6 +1,48 @@
-from sympy import integrate, parse_expr
+from collections import OrderedDict
+from sympy import integrate, parse_expr, Basic, Integral
+from sympy.core.cache import clear_cache
 from tsteno.atoms.module import ModuleArg, Module
 from tsteno.atoms.module import ARG_FLAG_OPTIONAL, ARG_FLAG_ALL_NEXT
+from tsteno.kernel.portfolio import Portfolio, PortfolioFailed
+
+
+def integrate_with(**hints):
+    def strategy(f, *variables):
+        return integrate(f, *variables, **hints)
+    return strategy
+
+
+INTEGRATION_STRATEGIES = OrderedDict((
+    ('default', integrate_with()),
+    ('manual', integrate_with(manual=True)),
+    ('heurisch', integrate_with(heurisch=True)),
+    ('risch', integrate_with(risch=True)),
+    ('meijerg', integrate_with(meijerg=True)),
+))
+""" Sympy integration algorithms raced by Integrate """
+
+INLINE_TIME_CONSTRAINT = 0.2
+""" Seconds given to the default algorithm in-process, before racing """
+
+
+def is_antiderivative(result):
+    return result is not None and \
+        not (isinstance(result, Basic) and result.has(Integral))
+
+
+def shape(expr):
+    """
+    Return:
+        - Expression tree with symbols and numbers abstracted.
+    """
+    if not isinstance(expr, Basic):
+        return type(expr).__name__
+    if expr.is_Symbol:
+        return 'Symbol'
+    if expr.is_Number:
+        return 'Number'
+
+    return (expr.func.__name__, ) + tuple(shape(arg) for arg in expr.args)
 
 
 class Integrate(Module):
@@ -9,10 +51,61 @@ class Integrate(Module):
     ```
     Integrate[f, x]
     ```
+
+    Gives the definite integral.
+    ```
+    Integrate[f, {x, xmin, xmax}]
+    ```
+
+    The default algorithm is tried in-process first, with a short time
+    budget. When it fails or runs out of time, several integration
+    algorithms are raced in worker processes, the algorithm that wins is
+    tried first for similar integrands (without the in-process attempt if
+    it isn't the default one).
     """
+    def __init__(self, kernel):
+        super().__init__(kernel)
+        self.portfolio = Portfolio(INTEGRATION_STRATEGIES, is_antiderivative)
 
     def run(self, f, *variables):
-        return integrate(f, *variables)
+        key = (shape(f), tuple(
+            len(variable) if isinstance(variable, list) else 1
+            for variable in variables
+        ))
+
+        if self.portfolio.winners.get(key, ('default', ))[0] == 'default':
+            result = self.integrate_inline(f, variables)
+            if is_antiderivative(result):
+                return result
+
+        try:
+            return self.portfolio.solve(key, (f, ) + variables)[1]
+        except PortfolioFailed as err:
+            result = err.results.get('default')
+            if isinstance(result, Basic):
+                return result
+
+        return Integral(f, *variables)
+
+    def integrate_inline(self, f, variables):
+        """
+        Return:
+            - Result of the default algorithm, or None if it fails or
+            exceeds `INLINE_TIME_CONSTRAINT`.
+        """
+        evaluation = self.get_kernel().get_kext('eval')
+
+        def exceeded(err):
+            # Interrupted algorithms can leave partial results in caches
+            clear_cache()
+            return None
+
+        try:
+            return evaluation.constrained(
+                lambda: integrate(f, *variables),
+                time_constraint=INLINE_TIME_CONSTRAINT, on_exceeded=exceeded)
+        except Exception:
+            return None
 
     def get_arguments(self):
         return [
@@ -36,3 +129,13 @@ class Integrate(Module):
         test.assertEqual(
             evaluation.evaluate_code('Integrate[1/(x^3 + 1), {x, 0, 1}]'),
             parse_expr('log(2)/3 + sqrt(3)*pi/9'))
+
+        # Default algorithm is slow here, other algorithms are raced.
+        result = evaluation.evaluate_code('Integrate[Sin[x]^7 * Exp[x], x]')
+        test.assertEqual(
+            (result.diff(parse_expr('x')) - parse_expr('sin(x)**7*exp(x)')
+             ).rewrite(parse_expr('exp')).simplify(), 0)
+
+        # Non elementary integrals stay unevaluated.
+        test.assertIsInstance(
+            evaluation.evaluate_code('Integrate[Sin[Sin[x]], x]'), Integral)
@@ -0,0 +1,602 @@
+import math
+import numpy as np
+import sympy as sp
+from sympy.core.function import AppliedUndef
+from tsteno.atoms.module import ModuleArg, Module
+from tsteno.atoms.module import ARG_FLAG_OPTIONAL, ARG_FLAG_ALL_NEXT
+from tsteno.atoms.rule import RuleSet
+from tsteno.atoms.interpolating_function import InterpolatingFunction
+
+DEFAULT_GOAL = 8
+""" Default accuracy and precision goals (digits) """
+
+DEFAULT_MAX_STEPS = 10000
+""" Default maximum number of steps """
+
+ODE_METHODS = {
+    'Automatic': 'StiffnessSwitching',
+    'StiffnessSwitching': 'StiffnessSwitching',
+    'ExplicitRungeKutta': 'ExplicitRungeKutta',
+    'DormandPrince': 'ExplicitRungeKutta',
+    'Rosenbrock': 'Rosenbrock',
+    'BDF': 'Rosenbrock',
+}
+""" Method option values, some of them are aliases """
+
+# Dormand-Prince 5(4) coefficients
+DP_C = (0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1)
+DP_A = (
+    (),
+    (1 / 5, ),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+)
+DP_B = (35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84)
+DP_E = (
+    71 / 57600, 0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525,
+    -1 / 40
+)
+
+STIFFNESS_THRESHOLD = 3.25
+""" Stiffness is suspected when |h * lambda| is above this value """
+
+STIFFNESS_STEPS = 15
+""" Stiff steps before switching to a stiff method """
+
+NON_STIFF_STEPS = 6
+""" Consecutive non stiff steps that reset the stiff steps count """
+
+# Rosenbrock 2(3) coefficients (Shampine & Reichelt, ode23s)
+ROSENBROCK_D = 1 / (2 + math.sqrt(2))
+ROSENBROCK_E32 = 6 + math.sqrt(2)
+
+
+class OdeSystem:
+    """
+    First order system y' = f(x, y), with its jacobian.
+    """
+    __slots__ = ('f', 'jacobian', 'dfdx', 'size')
+
+    def __init__(self, x, state, rhs):
+        matrix = sp.Matrix(rhs)
+        f = sp.lambdify((x, state), rhs, 'numpy', cse=True)
+        jacobian = sp.lambdify(
+            (x, state), matrix.jacobian(state), 'numpy', cse=True)
+        dfdx = sp.lambdify((x, state), list(matrix.diff(x)), 'numpy')
+
+        self.f = lambda t, y: np.array(f(t, y), dtype=float)
+        self.jacobian = lambda t, y: np.array(jacobian(t, y), dtype=float)
+        self.dfdx = lambda t, y: np.array(dfdx(t, y), dtype=float)
+        self.size = len(state)
+
+
+def error_norm(error, y, y_new, atol, rtol):
+    scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+    return np.sqrt(np.mean((error / scale) ** 2))
+
+
+def initial_step(system, t0, y0, f0, t1, atol, rtol):
+    scale = atol + rtol * np.abs(y0)
+    d0 = np.sqrt(np.mean((y0 / scale) ** 2))
+    d1 = np.sqrt(np.mean((f0 / scale) ** 2))
+
+    if d0 < 1e-5 or d1 < 1e-5:
+        h = 1e-6
+    else:
+        h = 0.01 * d0 / d1
+
+    return min(h, abs(t1 - t0))
+
+
+def step_limit_error(t):
+    return Exception(
+        'NDSolve: maximum number of steps reached at the point x == {}'.format(
+            t))
+
+
+def dormand_prince_step(system, t, y, k, signed_h):
+    """
+    Compute the stages of one Dormand-Prince step, k[1:] is overwritten.
+
+    Return:
+        - Tuple with new point, new value, value of the last stage and
+        error estimate.
+    """
+    for stage in range(1, 6):
+        y_stage = y + signed_h * sum(
+            a * k[j] for j, a in enumerate(DP_A[stage]))
+        k[stage] = system.f(t + DP_C[stage] * signed_h, y_stage)
+
+    y_new = y + signed_h * sum(b * k[j] for j, b in enumerate(DP_B))
+    t_new = t + signed_h
+    k[6] = system.f(t_new, y_new)
+
+    error = signed_h * sum(e * k[j] for j, e in enumerate(DP_E))
+    return t_new, y_new, y_stage, error
+
+
+def is_stiff_step(h, k, y_new, y_stage):
+    # Hairer's test, |h * lambda| from last two stages.
+    numerator = np.sum((k[6] - k[5]) ** 2)
+    denominator = np.sum((y_new - y_stage) ** 2)
+    return denominator > 0 and h * math.sqrt(
+        numerator / denominator) > STIFFNESS_THRESHOLD
+
+
+def count_stiffness(stiff_steps, non_stiff_steps, stiff):
+    """
+    Return:
+        - Tuple with updated counts of stiff and non stiff steps in a row,
+        a few non stiff steps reset the stiff count.
+    """
+    if stiff:
+        return stiff_steps + 1, 0
+
+    non_stiff_steps += 1
+    if non_stiff_steps >= NON_STIFF_STEPS:
+        stiff_steps = 0
+
+    return stiff_steps, non_stiff_steps
+
+
+def dormand_prince(system, t0, y0, t1, atol, rtol, max_steps,
+                   detect_stiffness=False):
+    """
+    Integrate with an adaptive Dormand-Prince 5(4) method.
+
+    Return:
+        - Tuple with points, values, derivatives and True if integration
+        stopped because problem is stiff.
+    """
+    direction = 1 if t1 >= t0 else -1
+    t, y = t0, y0
+    k = [system.f(t, y)] + [None] * 6
+
+    ts, ys, dys = [t], [y], [k[0]]
+    h = initial_step(system, t0, y0, k[0], t1, atol, rtol)
+    stiff_steps = non_stiff_steps = 0
+    steps = 0
+
+    while (t1 - t) * direction > 0:
+        if steps >= max_steps:
+            raise step_limit_error(t)
+        steps += 1
+
+        h = min(h, abs(t1 - t))
+        t_new, y_new, y_stage, error = dormand_prince_step(
+            system, t, y, k, h * direction)
+        err = error_norm(error, y, y_new, atol, rtol)
+
+        if not np.isfinite(err):
+            h = h / 10
+            if h < 1e-14 * max(1, abs(t)):
+                raise Exception(
+                    'NDSolve: equations are singular at x == {}'.format(t))
+            continue
+
+        if err <= 1:
+            if detect_stiffness:
+                stiff_steps, non_stiff_steps = count_stiffness(
+                    stiff_steps, non_stiff_steps,
+                    is_stiff_step(h, k, y_new, y_stage))
+
+            t, y = t_new, y_new
+            k[0] = k[6]
+            ts.append(t)
+            ys.append(y)
+            dys.append(k[0])
+
+            if stiff_steps >= STIFFNESS_STEPS:
+                return ts, ys, dys, True
+
+        factor = 10 if err == 0 else 0.9 * err ** -0.2
+        h = h * min(10, max(0.2, factor))
+
+        if h < 1e-14 * max(1, abs(t)):
+            raise Exception(
+                'NDSolve: step size is effectively zero at x == {}'.format(t))
+
+    return ts, ys, dys, False
+
+
+def rosenbrock(system, t0, y0, t1, atol, rtol, max_steps):
+    """
+    Integrate with an adaptive Rosenbrock 2(3) method (Shampine & Reichelt
+    ode23s). It's L-stable, so it's useful for stiff problems.
+
+    Return:
+        - Tuple with points, values and derivatives.
+    """
+    direction = 1 if t1 >= t0 else -1
+    identity = np.eye(system.size)
+    t, y = t0, y0
+    f0 = system.f(t, y)
+
+    ts, ys, dys = [t], [y], [f0]
+    h = initial_step(system, t0, y0, f0, t1, atol, rtol)
+    steps = 0
+
+    while (t1 - t) * direction > 0:
+        if steps >= max_steps:
+            raise step_limit_error(t)
+        steps += 1
+
+        h = min(h, abs(t1 - t))
+        signed_h = h * direction
+
+        jacobian = system.jacobian(t, y)
+        dfdx = system.dfdx(t, y)
+        w = identity - signed_h * ROSENBROCK_D * jacobian
+
+        try:
+            k1 = np.linalg.solve(w, f0 + signed_h * ROSENBROCK_D * dfdx)
+            f1 = system.f(t + signed_h / 2, y + signed_h / 2 * k1)
+            k2 = np.linalg.solve(w, f1 - k1) + k1
+            y_new = y + signed_h * k2
+            t_new = t + signed_h
+            f2 = system.f(t_new, y_new)
+            k3 = np.linalg.solve(
+                w, f2 - ROSENBROCK_E32 * (k2 - f1) - 2 * (k1 - f0) +
+                signed_h * ROSENBROCK_D * dfdx
+            )
+        except np.linalg.LinAlgError:
+            err = float('inf')
+        else:
+            error = signed_h / 6 * (k1 - 2 * k2 + k3)
+            err = error_norm(error, y, y_new, atol, rtol)
+
+        if np.isfinite(err) and err <= 1:
+            t, y, f0 = t_new, y_new, f2
+            ts.append(t)
+            ys.append(y)
+            dys.append(f0)
+
+        if not np.isfinite(err):
+            factor = 0.1
+        else:
+            factor = 5 if err == 0 else 0.9 * err ** (-1 / 3)
+        h = h * min(5, max(0.1, factor))
+
+        if h < 1e-14 * max(1, abs(t)):
+            raise Exception(
+                'NDSolve: step size is effectively zero at x == {}'.format(t))
+
+    return ts, ys, dys
+
+
+def integrate(system, t0, y0, t1, method, atol, rtol, max_steps):
+    if method == 'Rosenbrock':
+        return rosenbrock(system, t0, y0, t1, atol, rtol, max_steps)
+
+    ts, ys, dys, stiff = dormand_prince(
+        system, t0, y0, t1, atol, rtol, max_steps,
+        detect_stiffness=method == 'StiffnessSwitching'
+    )
+
+    if stiff:
+        stiff_ts, stiff_ys, stiff_dys = rosenbrock(
+            system, ts[-1], ys[-1], t1, atol, rtol, max_steps - len(ts))
+        ts, ys, dys = ts + stiff_ts[1:], ys + stiff_ys[1:], dys + stiff_dys[1:]
+
+    return ts, ys, dys
+
+
+class NDSolve(Module):
+    """
+    Finds a numerical solution to the ordinary differential equations eqns
+    for the functions y with the independent variable x in the range xmin to
+    xmax.
+    ```
+    NDSolve[{eqns, ics}, y, {x, xmin, xmax}]
+    NDSolve[{eqns, ics}, {y1, y2, ...}, {x, xmin, xmax}]
+    ```
+
+    Solutions are given as rules to InterpolatingFunction objects.
+
+    Options:
+        - **Method** - `Automatic` (Dormand-Prince, switching to Rosenbrock
+        if problem is stiff), `ExplicitRungeKutta` or `Rosenbrock`.
+        - **AccuracyGoal** - Absolute tolerance digits (default 8).
+        - **PrecisionGoal** - Relative tolerance digits (default 8).
+        - **MaxSteps** - Maximum number of steps (default 10000).
+
+    # Examples
+    **Input:**
+    ```
+    s = NDSolve[{y'[x] == -y[x], y[0] == 1}, y, {x, 0, 2}]; y[1] /. s
+    ```
+    **Output:**
+    ```
+    0.367879441171442
+    ```
+    """
+
+    def run(self, equations, functions, variable, *options):
+        options = self.configuration_list2dict(options)
+
+        if not isinstance(equations, list):
+            equations = [equations]
+        if not isinstance(functions, list):
+            functions = [functions]
+
+        x = variable[0]
+        x_min, x_max = float(variable[1]), float(variable[2])
+        names = [
+            f.head if hasattr(f, 'head') else str(f) for f in functions
+        ]
+
+        method = ODE_METHODS.get(str(options.get('Method', 'Automatic')))
+        if method is None:
+            raise Exception(
+                'NDSolve: unknown method `{}`'.format(options['Method']))
+
+        atol = 10.0 ** -float(options.get('AccuracyGoal', DEFAULT_GOAL))
+        rtol = 10.0 ** -float(options.get('PrecisionGoal', DEFAULT_GOAL))
+        max_steps = int(options.get('MaxSteps', DEFAULT_MAX_STEPS))
+
+        expressions = [self.to_sympy_equation(eq) for eq in equations]
+        differential = [expr for expr in expressions if expr.has(x)]
+        initial = [expr for expr in expressions if not expr.has(x)]
+
+        unknowns = [sp.Function(name)(x) for name in names]
+        orders = NDSolve.get_orders(differential, unknowns)
+
+        state, rhs = NDSolve.first_order_system(
+            differential, x, unknowns, orders)
+        x_initial, y_initial = NDSolve.initial_values(
+            initial, names, orders)
+
+        system = OdeSystem(x, state, rhs)
+
+        points, values, derivatives = [x_initial], [y_initial], [
+            system.f(x_initial, y_initial)]
+
+        # Once per side of the initial point, to the farthest end, so points
+        # are sorted even if initial point is out of range.
+        for x_end in (min(x_min, x_max, x_initial),
+                      max(x_min, x_max, x_initial)):
+            if x_end == x_initial:
+                continue
+
+            ts, ys, dys = integrate(
+                system, x_initial, y_initial, x_end, method, atol, rtol,
+                max_steps)
+
+            if x_end < x_initial:
+                points = ts[:0:-1] + points
+                values = ys[:0:-1] + values
+                derivatives = dys[:0:-1] + derivatives
+            else:
+                points = points + ts[1:]
+                values = values + ys[1:]
+                derivatives = derivatives + dys[1:]
+
+        values = np.array(values)
+        derivatives = np.array(derivatives)
+
+        solutions = {}
+        component = 0
+
+        for name, order in zip(names, orders):
+            solutions[name] = InterpolatingFunction(
+                points, values[:, component], derivatives[:, component])
+            component += order
+
+        return RuleSet(self.get_kernel(), solutions)
+
+    def to_sympy_equation(self, equation):
+        if not hasattr(equation, 'left'):
+            raise Exception(
+                'NDSolve: `{}` is not an equation'.format(equation))
+
+        return NDSolve.to_sympy(equation.left) - \
+            NDSolve.to_sympy(equation.right)
+
+    @staticmethod
+    def to_sympy(value):
+        if hasattr(value, 'get_sympy'):
+            return value.get_sympy()
+
+        return sp.sympify(value)
+
+    @staticmethod
+    def get_orders(differential, unknowns):
+        """
+        Return:
+            - Differential order of each unknown function.
+        """
+        orders = []
+
+        for unknown in unknowns:
+            order = 0
+
+            for expr in differential:
+                for derivative in expr.atoms(sp.Derivative):
+                    if derivative.expr == unknown:
+                        order = max(order, derivative.derivative_count)
+
+            if order == 0:
+                raise Exception(
+                    'NDSolve: no derivatives of `{}` found'.format(
+                        unknown.func))
+
+            orders.append(order)
+
+        return orders
+
+    @staticmethod
+    def first_order_system(differential, x, unknowns, orders):
+        """
+        Reduce equations to a first order explicit system.
+
+        Return:
+            - Tuple with state symbols and right hand sides.
+        """
+        highest = [
+            sp.Derivative(unknown, (x, order))
+            for unknown, order in zip(unknowns, orders)
+        ]
+
+        solutions = sp.solve(differential, highest, dict=True)
+        if not solutions:
+            raise Exception(
+                'NDSolve: equations can\'t be solved for {}'.format(highest))
+
+        solution = solutions[0]
+        if any(derivative not in solution for derivative in highest):
+            raise Exception(
+                'NDSolve: equations can\'t be solved for {}'.format(highest))
+
+        state = []
+        mapping = {}
+
+        for unknown, order in zip(unknowns, orders):
+            for k in range(order):
+                symbol = sp.Dummy('{}{}'.format(unknown.func, k))
+                state.append(symbol)
+                if k == 0:
+                    mapping[unknown] = symbol
+                else:
+                    mapping[sp.Derivative(unknown, (x, k))] = symbol
+
+        rhs = []
+        position = 0
+
+        for derivative, order in zip(highest, orders):
+            rhs.extend(state[position + 1:position + order])
+            rhs.append(solution[derivative].xreplace(mapping))
+            position += order
+
+        unknown_symbols = set().union(
+            *[expr.free_symbols for expr in rhs]) - set(state) - {x}
+        if unknown_symbols:
+            raise Exception(
+                'NDSolve: equations have unknown parameters {}'.format(
+                    unknown_symbols))
+
+        return state, rhs
+
+    @staticmethod
+    def initial_values(initial, names, orders):
+        """
+        Return:
+            - Tuple with initial point and initial state.
+        """
+        offsets = {}
+        position = 0
+        for name, order in zip(names, orders):
+            offsets[name] = position
+            position += order
+
+        values = [None] * position
+        point = None
+
+        for expr in initial:
+            targets = [
+                atom for atom in expr.atoms(AppliedUndef)
+                if atom.func.__name__ in offsets and not atom.free_symbols
+            ] + [
+                atom for atom in expr.atoms(sp.Subs)
+                if isinstance(atom.expr, sp.Derivative)
+            ]
+
+            if len(targets) != 1:
+                raise Exception(
+                    'NDSolve: `{} == 0` is not a valid initial '
+                    'condition'.format(expr))
+
+            target = targets[0]
+
+            if isinstance(target, sp.Subs):
+                name = target.expr.expr.func.__name__
+                order = target.expr.derivative_count
+                target_point = target.point[0]
+            else:
+                name = target.func.__name__
+                order = 0
+                target_point = target.args[0]
+
+            if name not in offsets or order >= orders[names.index(name)]:
+                raise Exception(
+                    'NDSolve: `{} == 0` is not a valid initial '
+                    'condition'.format(expr))
+
+            target_point = float(target_point)
+            if point is not None and point != target_point:
+                raise Exception(
+                    'NDSolve: initial conditions must be given at the same '
+                    'point')
+            point = target_point
+
+            value = sp.Dummy('value')
+            solution = sp.solve(expr.xreplace({target: value}), value)
+            if len(solution) != 1:
+                raise Exception(
+                    'NDSolve: `{} == 0` is not a valid initial '
+                    'condition'.format(expr))
+
+            values[offsets[name] + order] = float(solution[0])
+
+        if point is None or any(value is None for value in values):
+            raise Exception(
+                'NDSolve: expected {} initial conditions, {} given'.format(
+                    len(values), len(initial)))
+
+        return point, np.array(values, dtype=float)
+
+    def get_arguments(self):
+        return [
+            ModuleArg(),
+            ModuleArg(),
+            ModuleArg(),
+            ModuleArg(ARG_FLAG_OPTIONAL | ARG_FLAG_ALL_NEXT)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertAlmostEqual(evaluation.evaluate_code(
+            "s = NDSolve[{y'[x] == -y[x], y[0] == 1}, y, {x, 0, 2}]; "
+            "y[1] /. s"
+        ), math.exp(-1), places=6)
+
+        # Second order equation
+        solution = evaluation.evaluate_code(
+            "NDSolve[{y''[x] + y[x] == 0, y[0] == 0, y'[0] == 1}, y, "
+            "{x, 0, 10}]"
+        )
+        points = np.linspace(0, 10, 50)
+        test.assertLess(
+            np.max(np.abs(solution['y'].sample(points) - np.sin(points))),
+            1e-6
+        )
+
+        # Systems, and integration in both directions
+        solution = evaluation.evaluate_code(
+            "NDSolve[{u'[t] == v[t], v'[t] == -u[t], u[0] == 1, v[0] == 0}, "
+            "{u, v}, {t, -1, 1}]"
+        )
+        test.assertAlmostEqual(solution['u'](-1), math.cos(1), places=6)
+        test.assertAlmostEqual(solution['v'](1), -math.sin(1), places=6)
+
+        # Initial condition out of range
+        solution = evaluation.evaluate_code(
+            "NDSolve[{y'[x] == y[x], y[0] == 1}, y, {x, 1, 2}]")
+        test.assertTrue(np.all(np.diff(solution['y'].x) > 0))
+        test.assertAlmostEqual(solution['y'](1.5), math.exp(1.5), places=5)
+
+        # Stiff problem, automatic method switches to Rosenbrock
+        solution = evaluation.evaluate_code(
+            "NDSolve[{y'[x] == -1000 * (y[x] - 1), y[0] == 0}, y, {x, 0, 10}]"
+        )
+        test.assertLess(len(solution['y'].x), 200)
+        test.assertAlmostEqual(solution['y'](10), 1, places=6)
+
+        # Interpolating functions can be plotted directly
+        plot = evaluation.evaluate_code(
+            "s = NDSolve[{y'[x] == y[x], y[0] == 1}, y, {x, 0, 1}]; "
+            "Plot[y /. s, {x, 0, 1}]"
+        )
+        test.assertAlmostEqual(plot.y[-1], math.e, places=6)
@@ -0,0 +1,66 @@
+from tsteno.atoms.module import ARG_FLAG_NO_AUTO_EVAL, ARG_FLAG_SPECIAL_CONTEXT
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_ALL_NEXT
+from tsteno.kernel.summation import to_limits, is_finite, count_terms
+from tsteno.kernel.summation import vectorized_sum, accelerated_sum
+from tsteno.kernel.summation import evaluate_summand
+
+
+class NSum(Module):
+    """
+    Gives a numerical approximation to the sum of expr for i from imin to
+    imax. Same iterators as `Sum` are accepted.
+    ```
+    NSum[expr, {i, imin, imax}]
+    ```
+
+    Finite sums are evaluated with Numpy, infinite sums use convergence
+    acceleration.
+
+    # Examples
+    **Input:**
+    ```
+    NSum[(-1)^(i + 1) / i, {i, 1, oo}]
+    ```
+    **Output:**
+    ```
+    0.693147180559945
+    ```
+    """
+
+    def run(self, context, fn, *iterators):
+        changes, limits = to_limits(iterators, self.__class__.__name__)
+        summand = evaluate_summand(context, fn, iterators, changes)
+
+        if not is_finite(limits):
+            return accelerated_sum(summand, limits)
+
+        if count_terms(limits) == 0:
+            return 0.0
+
+        return vectorized_sum(summand, limits)
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_SPECIAL_CONTEXT),
+            ModuleArg(ARG_FLAG_NO_AUTO_EVAL),
+            ModuleArg(ARG_FLAG_ALL_NEXT)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertAlmostEqual(
+            evaluation.evaluate_code('NSum[i, {i, 1, 100}]'), 5050)
+        test.assertIsInstance(
+            evaluation.evaluate_code('NSum[i, {i, 1, 100}]'), float)
+        test.assertAlmostEqual(
+            evaluation.evaluate_code('NSum[1 / (i * j), {i, 1, 4}, {j, 1, 5}]'),
+            25 / 12 * 137 / 60)
+
+        # Convergence acceleration for slowly convergent series
+        test.assertAlmostEqual(
+            evaluation.evaluate_code('NSum[(-1)^(i + 1) / i, {i, 1, oo}]'),
+            0.693147180559945, places=12)
+        test.assertAlmostEqual(
+            evaluation.evaluate_code('NSum[1 / i^2, {i, 1, oo}]'),
+            1.64493406684823, places=12)
@@ -0,0 +1,115 @@
+import sympy as sp
+from tsteno.atoms.module import ARG_FLAG_NO_AUTO_EVAL, ARG_FLAG_SPECIAL_CONTEXT
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_ALL_NEXT
+from tsteno.kernel.summation import DIRECT_SUM_LIMIT
+from tsteno.kernel.summation import CLOSED_FORM_TIME_CONSTRAINT
+from tsteno.kernel.summation import to_limits, is_finite, count_terms
+from tsteno.kernel.summation import closed_form, direct_sum, vectorized_sum
+from tsteno.kernel.summation import accelerated_sum, evaluate_summand
+
+
+class Sum(Module):
+    """
+    Evaluates the sum of expr for i from imin to imax (optionally with step
+    di). Several iterators give nested sums, first one is the outermost.
+    ```
+    Sum[expr, {i, imax}]
+    Sum[expr, {i, imin, imax}]
+    Sum[expr, {i, imin, imax, di}]
+    Sum[expr, {i, imin, imax}, {j, jmin, jmax}, ...]
+    ```
+
+    Closed forms are used when available. Numeric sums (inexact summands)
+    and long sums without closed form are evaluated with Numpy.
+
+    # Examples
+    **Input:**
+    ```
+    Sum[i^2, {i, 1, n}]
+    ```
+    **Output:**
+    ```
+    n**3/3 + n**2/2 + n/6
+    ```
+    """
+
+    def run(self, context, fn, *iterators):
+        changes, limits = to_limits(iterators, self.__class__.__name__)
+        summand = evaluate_summand(context, fn, iterators, changes)
+
+        if is_finite(limits) and count_terms(limits) == 0:
+            return 0
+
+        return self.sum(summand, limits)
+
+    def sum(self, summand, limits):
+        if summand.has(sp.Float):
+            return self.numeric_sum(summand, limits)
+
+        evaluation = self.get_kernel().get_kext('eval')
+        result = evaluation.constrained(
+            lambda: closed_form(summand, limits),
+            time_constraint=CLOSED_FORM_TIME_CONSTRAINT,
+            on_exceeded=lambda err: None
+        )
+
+        if result is not None:
+            return result
+
+        if not is_finite(limits):
+            return sp.Sum(summand, *reversed(limits))
+
+        if count_terms(limits) <= DIRECT_SUM_LIMIT:
+            return direct_sum(summand, limits)
+
+        return vectorized_sum(summand, limits)
+
+    def numeric_sum(self, summand, limits):
+        if is_finite(limits):
+            return vectorized_sum(summand, limits)
+
+        return accelerated_sum(summand, limits)
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_SPECIAL_CONTEXT),
+            ModuleArg(ARG_FLAG_NO_AUTO_EVAL),
+            ModuleArg(ARG_FLAG_ALL_NEXT)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code('Sum[i, {i, 1, 10}]'), 55)
+        test.assertEqual(evaluation.evaluate_code('Sum[i^2, {i, 4}]'), 30)
+        test.assertEqual(
+            evaluation.evaluate_code('Sum[i, {i, 1, 10, 2}]'), 25)
+        test.assertEqual(evaluation.evaluate_code('Sum[i, {i, 5, 3}]'), 0)
+        test.assertEqual(
+            evaluation.evaluate_code('Sum[i * j, {i, 1, 3}, {j, 1, i}]'), 25)
+
+        # Closed forms
+        n = sp.Symbol('n')
+        test.assertEqual(
+            evaluation.evaluate_code('Sum[i^2, {i, 1, n}]'),
+            n ** 3 / 3 + n ** 2 / 2 + n / 6)
+        test.assertEqual(
+            evaluation.evaluate_code('Sum[1/i^2, {i, 1, oo}]'), sp.pi ** 2 / 6)
+
+        # Closed form is used with big numeric bounds, never term by term
+        test.assertAlmostEqual(
+            evaluation.evaluate_code('N[Sum[1/i^2, {i, 1, 10^7}]]'),
+            1.64493396684823, places=12)
+
+        # Without closed form, short sums are exact and long sums numeric
+        test.assertEqual(
+            evaluation.evaluate_code('Sum[Sin[i]/i, {i, 1, 3}]'),
+            sp.sin(1) + sp.sin(2) / 2 + sp.sin(3) / 3)
+        test.assertAlmostEqual(
+            evaluation.evaluate_code('Sum[Sin[i]/i, {i, 1, 10^6}]'),
+            float((sp.pi - 1) / 2), places=5)
+
+        # Inexact summands are evaluated with Numpy
+        test.assertAlmostEqual(
+            evaluation.evaluate_code('Sum[1.0 / i^2, {i, 1, 10^6}]'),
+            1.64493306684877, places=12)
@@ -0,0 +1,56 @@
+import numpy as np
+from tsteno.atoms.module import ModuleArg, Module
+from tsteno.kernel.linear_algebra import get_matrix_shape, is_numeric
+from tsteno.kernel.linear_algebra import to_array, from_array
+from tsteno.kernel.linear_algebra import to_domain_matrix, from_domain_element
+
+
+class Det(Module):
+    """
+    Gives the determinant of the square matrix m.
+    ```
+    Det[m]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    Det[{{a, b}, {c, d}}]
+    ```
+    **Output:**
+    ```
+    a*d - b*c
+    ```
+    """
+
+    def run(self, matrix):
+        get_matrix_shape(matrix, 'Det', square=True)
+
+        if is_numeric(matrix):
+            return from_array(np.linalg.det(to_array(matrix)))
+
+        matrix = to_domain_matrix(matrix)
+
+        return from_domain_element(matrix.domain, matrix.det())
+
+    def get_arguments(self):
+        return [
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code(
+            'Det[{{a, b}, {c, d}}]'), evaluation.evaluate_code('a * d - b * c'))
+        test.assertEqual(evaluation.evaluate_code(
+            'Det[{{1, 2}, {3, 4}}]'), -2)
+        test.assertIs(type(evaluation.evaluate_code(
+            'Det[{{1, 2}, {3, 4}}]')), int)
+        test.assertEqual(evaluation.evaluate_code(
+            'Det[{{1/2, 1}, {1, 4}}]'), 1)
+        test.assertAlmostEqual(evaluation.evaluate_code(
+            'Det[{{1.5, 2}, {3, 4}}]'), 0)
+
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'Det[{{1, 2, 3}, {4, 5, 6}}]')
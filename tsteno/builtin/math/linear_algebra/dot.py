@@ -0,0 +1,87 @@
+from functools import reduce
+import numpy as np
+from tsteno.atoms.module import ModuleArg, Module, ARG_FLAG_ALL_NEXT
+from tsteno.kernel.linear_algebra import get_shape, is_numeric
+from tsteno.kernel.linear_algebra import to_array, from_array
+from tsteno.kernel.linear_algebra import to_domain_matrix, from_domain_matrix
+
+
+class Dot(Module):
+    """
+    Gives products of vectors and matrices.
+    ```
+    Dot[a, b, c, ...]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    Dot[{{1, 2}, {3, 4}}, {1, 1}]
+    ```
+    **Output:**
+    ```
+    {3, 7}
+    ```
+    """
+
+    def run(self, *arguments):
+        return reduce(self.dot, arguments)
+
+    def dot(self, a, b):
+        a_shape, b_shape = get_shape(a, 'Dot'), get_shape(b, 'Dot')
+
+        if a_shape[-1] != b_shape[0]:
+            raise Exception(
+                'Dot: tensors `{}` and `{}` have incompatible shapes'.format(
+                    a, b))
+
+        if is_numeric(a, b):
+            return from_array(np.dot(to_array(a), to_array(b)))
+
+        # Vectors are columns, left vector is transposed to a row.
+        left = to_domain_matrix(a)
+        if len(a_shape) == 1:
+            left = left.transpose()
+
+        left, right = left.unify(to_domain_matrix(b))
+        product = from_domain_matrix(left * right)
+
+        if len(a_shape) == 1 and len(b_shape) == 1:
+            return product[0][0]
+        if len(a_shape) == 1:
+            return product[0]
+        if len(b_shape) == 1:
+            return [row[0] for row in product]
+
+        return product
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_ALL_NEXT)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code(
+            'Dot[{{1, 2}, {3, 4}}, {1, 1}]'), [3, 7])
+        test.assertEqual(evaluation.evaluate_code(
+            'Dot[{1, 2}, {3, 4}]'), 11)
+        test.assertEqual(evaluation.evaluate_code(
+            'Dot[{1, 1}, {{1, 2}, {3, 4}}]'), [4, 6])
+        test.assertEqual(evaluation.evaluate_code(
+            'Dot[{{1, 2}, {3, 4}}, {{0, 1}, {1, 0}}, {{2, 0}, {0, 2}}]'),
+            [[4, 2], [8, 6]])
+
+        # Exact entries give exact results
+        test.assertEqual(evaluation.evaluate_code(
+            'Dot[{{a, 1/2}}, {b, 2}]'),
+            evaluation.evaluate_code('{a * b + 1}'))
+
+        # Numeric entries are multiplied with Numpy
+        result = evaluation.evaluate_code('Dot[{{1.5, 2}, {3, 4}}, {2, 1}]')
+        test.assertEqual(result, [5.0, 10.0])
+        test.assertIs(type(result[0]), float)
+
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'Dot[{1, 2}, {1, 2, 3}]')
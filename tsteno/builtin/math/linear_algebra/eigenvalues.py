@@ -0,0 +1,60 @@
+import numpy as np
+from tsteno.atoms.module import ModuleArg, Module
+from tsteno.kernel.linear_algebra import get_matrix_shape, is_numeric
+from tsteno.kernel.linear_algebra import to_array, from_array
+from tsteno.kernel.linear_algebra import to_domain_matrix, sort_by_magnitude
+from tsteno.kernel.linear_algebra import exact_eigenvalues, magnitude_order
+
+
+class Eigenvalues(Module):
+    """
+    Gives a list of the eigenvalues of the square matrix m, sorted by
+    decreasing absolute value.
+    ```
+    Eigenvalues[m]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    Eigenvalues[{{2, 1}, {1, 2}}]
+    ```
+    **Output:**
+    ```
+    {3, 1}
+    ```
+    """
+
+    def run(self, matrix):
+        get_matrix_shape(matrix, 'Eigenvalues', square=True)
+
+        if is_numeric(matrix):
+            eigenvalues = np.linalg.eigvals(to_array(matrix))
+            return from_array(
+                eigenvalues[magnitude_order(eigenvalues)])
+
+        return sort_by_magnitude(exact_eigenvalues(to_domain_matrix(matrix)))
+
+    def get_arguments(self):
+        return [
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code(
+            'Eigenvalues[{{2, 1}, {1, 2}}]'), [3, 1])
+        test.assertEqual(evaluation.evaluate_code(
+            'Eigenvalues[{{1, 1, 0}, {0, 1, 0}, {0, 0, 2}}]'), [2, 1, 1])
+        test.assertEqual(evaluation.evaluate_code(
+            'Eigenvalues[{{0, 1}, {2, 0}}]'),
+            evaluation.evaluate_code('{Sqrt[2], -Sqrt[2]}'))
+
+        result = evaluation.evaluate_code('Eigenvalues[{{2.0, 1}, {1, 2}}]')
+        test.assertAlmostEqual(result[0], 3)
+        test.assertAlmostEqual(result[1], 1)
+
+        # Complex eigenvalues
+        result = evaluation.evaluate_code('Eigenvalues[{{0, -1.0}, {1, 0}}]')
+        test.assertAlmostEqual(abs(result[0] - 1j), 0)
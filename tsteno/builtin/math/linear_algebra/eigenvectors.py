@@ -0,0 +1,66 @@
+import numpy as np
+from tsteno.atoms.module import ModuleArg, Module
+from tsteno.kernel.linear_algebra import get_matrix_shape, is_numeric
+from tsteno.kernel.linear_algebra import to_array, from_array
+from tsteno.kernel.linear_algebra import exact_eigenvectors, magnitude_order
+
+
+class Eigenvectors(Module):
+    """
+    Gives a list of the eigenvectors of the square matrix m, sorted as
+    `Eigenvalues[m]`.
+    ```
+    Eigenvectors[m]
+    ```
+
+    Numeric eigenvectors are normalized, exact ones are not.
+
+    # Examples
+    **Input:**
+    ```
+    Eigenvectors[{{2, 1}, {1, 2}}]
+    ```
+    **Output:**
+    ```
+    {{1, 1}, {-1, 1}}
+    ```
+    """
+
+    def run(self, matrix):
+        get_matrix_shape(matrix, 'Eigenvectors', square=True)
+
+        if not is_numeric(matrix):
+            return exact_eigenvectors(matrix)
+
+        eigenvalues, eigenvectors = np.linalg.eig(to_array(matrix))
+        order = magnitude_order(eigenvalues)
+
+        return from_array(np.ascontiguousarray(eigenvectors[:, order].T))
+
+    def get_arguments(self):
+        return [
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code(
+            'Eigenvectors[{{2, 1}, {1, 2}}]'), [[1, 1], [-1, 1]])
+
+        # Defective matrix, missing eigenvectors are zero
+        test.assertEqual(evaluation.evaluate_code(
+            'Eigenvectors[{{1, 1}, {0, 1}}]'), [[1, 0], [0, 0]])
+
+        matrix = [[2.0, 1.0], [1.0, 3.0]]
+        result = evaluation.evaluate_code(
+            'Eigenvectors[{{2.0, 1}, {1, 3}}]')
+        eigenvalues = evaluation.evaluate_code(
+            'Eigenvalues[{{2.0, 1}, {1, 3}}]')
+
+        for eigenvalue, eigenvector in zip(eigenvalues, result):
+            test.assertTrue(np.allclose(
+                np.dot(matrix, eigenvector),
+                np.multiply(eigenvalue, eigenvector)
+            ))
+            test.assertAlmostEqual(np.linalg.norm(eigenvector), 1)
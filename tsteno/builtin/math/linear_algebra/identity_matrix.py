@@ -0,0 +1,45 @@
+import numpy as np
+from tsteno.atoms.module import ModuleArg, Module
+
+
+class IdentityMatrix(Module):
+    """
+    Gives the n×n identity matrix.
+    ```
+    IdentityMatrix[n]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    IdentityMatrix[2]
+    ```
+    **Output:**
+    ```
+    {{1, 0}, {0, 1}}
+    ```
+    """
+
+    def run(self, n):
+        if int(n) != n or n < 1:
+            raise Exception(
+                'IdentityMatrix: `{}` is not a positive integer'.format(n))
+
+        return np.eye(int(n), dtype=int).tolist()
+
+    def get_arguments(self):
+        return [
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code(
+            'IdentityMatrix[3]'), [[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+        test.assertEqual(evaluation.evaluate_code(
+            'Dot[IdentityMatrix[2], {{a, b}, {c, d}}]'),
+            evaluation.evaluate_code('{{a, b}, {c, d}}'))
+
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'IdentityMatrix[0]')
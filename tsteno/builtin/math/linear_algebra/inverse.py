@@ -0,0 +1,65 @@
+import numpy as np
+from sympy.polys.matrices.exceptions import DMNonInvertibleMatrixError
+from tsteno.atoms.module import ModuleArg, Module
+from tsteno.kernel.linear_algebra import get_matrix_shape, is_numeric
+from tsteno.kernel.linear_algebra import to_array, from_array
+from tsteno.kernel.linear_algebra import to_domain_matrix, from_domain_matrix
+
+
+class Inverse(Module):
+    """
+    Gives the inverse of a square matrix m.
+    ```
+    Inverse[m]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    Inverse[{{1, 2}, {3, 4}}]
+    ```
+    **Output:**
+    ```
+    {{-2, 1}, {3/2, -1/2}}
+    ```
+    """
+
+    def run(self, matrix):
+        get_matrix_shape(matrix, 'Inverse', square=True)
+
+        if is_numeric(matrix):
+            try:
+                return from_array(np.linalg.inv(to_array(matrix)))
+            except np.linalg.LinAlgError:
+                raise Exception(
+                    'Inverse: matrix `{}` is singular'.format(matrix))
+
+        try:
+            return from_domain_matrix(
+                to_domain_matrix(matrix).to_field().inv())
+        except DMNonInvertibleMatrixError:
+            raise Exception('Inverse: matrix `{}` is singular'.format(matrix))
+
+    def get_arguments(self):
+        return [
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code(
+            'Inverse[{{1, 2}, {3, 4}}]'),
+            evaluation.evaluate_code('{{-2, 1}, {3/2, -1/2}}'))
+        test.assertEqual(evaluation.evaluate_code(
+            'Dot[{{a, 1}, {1, a}}, Inverse[{{a, 1}, {1, a}}]]'),
+            [[1, 0], [0, 1]])
+
+        result = evaluation.evaluate_code('Inverse[{{2.0, 0}, {0, 4}}]')
+        test.assertEqual(result, [[0.5, 0.0], [0.0, 0.25]])
+
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'Inverse[{{1, 2}, {2, 4}}]')
+        test.assertRaises(
+            Exception, evaluation.evaluate_code,
+            'Inverse[{{1.0, 2}, {2, 4}}]')
@@ -0,0 +1,121 @@
+import numpy as np
+from tsteno.atoms.module import ModuleArg, Module
+from tsteno.kernel.linear_algebra import get_matrix_shape, get_shape
+from tsteno.kernel.linear_algebra import is_numeric, to_array, from_array
+from tsteno.kernel.linear_algebra import to_domain_matrix, from_domain_matrix
+
+
+class LinearSolve(Module):
+    """
+    Finds an x that solves the matrix equation m.x == b.
+    ```
+    LinearSolve[m, b]
+    ```
+
+    When the system has several solutions, one of them is given.
+
+    # Examples
+    **Input:**
+    ```
+    LinearSolve[{{1, 2}, {3, 4}}, {5, 6}]
+    ```
+    **Output:**
+    ```
+    {-4, 9/2}
+    ```
+    """
+
+    def run(self, matrix, b):
+        rows, columns = get_matrix_shape(matrix, 'LinearSolve')
+        b_shape = get_shape(b, 'LinearSolve')
+
+        if b_shape[0] != rows:
+            raise Exception(
+                'LinearSolve: `{}` and `{}` have incompatible shapes'.format(
+                    matrix, b))
+
+        if is_numeric(matrix, b):
+            solution = self.solve_numeric(to_array(matrix), to_array(b))
+        else:
+            solution = self.solve_exact(matrix, b, columns)
+
+        if solution is None:
+            raise Exception(
+                'LinearSolve: linear equation `{}.x == {}` has no '
+                'solution'.format(matrix, b))
+
+        return solution
+
+    def solve_numeric(self, matrix, b):
+        if matrix.shape[0] == matrix.shape[1]:
+            try:
+                return from_array(np.linalg.solve(matrix, b))
+            except np.linalg.LinAlgError:
+                pass
+
+        solution = np.linalg.lstsq(matrix, b, rcond=None)[0]
+        if not np.allclose(matrix @ solution, b):
+            return None
+
+        return from_array(solution)
+
+    def solve_exact(self, matrix, b, columns):
+        left, right = to_domain_matrix(matrix).unify(to_domain_matrix(b))
+        reduced, pivots = left.hstack(right).to_field().rref()
+
+        if any(pivot >= columns for pivot in pivots):
+            return None
+
+        # Free variables are zero
+        reduced = from_domain_matrix(reduced)
+        solution = [[0] * (len(reduced[0]) - columns)] * columns
+
+        for row, pivot in enumerate(pivots):
+            solution[pivot] = reduced[row][columns:]
+
+        if not isinstance(b[0], (list, np.ndarray)):
+            return [row[0] for row in solution]
+
+        return solution
+
+    def get_arguments(self):
+        return [
+            ModuleArg(),
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code(
+            'LinearSolve[{{1, 2}, {3, 4}}, {5, 6}]'),
+            evaluation.evaluate_code('{-4, 9/2}'))
+
+        test.assertEqual(evaluation.evaluate_code(
+            'LinearSolve[{{a, 1}, {1, a}}, {1, 1}]'),
+            evaluation.evaluate_code('{1 / (a + 1), 1 / (a + 1)}'))
+
+        # Underdetermined system, free variables are zero
+        test.assertEqual(evaluation.evaluate_code(
+            'LinearSolve[{{1, 1, 1}, {0, 1, 2}}, {6, 5}]'), [1, 5, 0])
+
+        # Several right hand sides
+        test.assertEqual(evaluation.evaluate_code(
+            'LinearSolve[{{2, 0}, {0, 4}}, {{2, 4}, {4, 8}}]'),
+            [[1, 2], [1, 2]])
+
+        result = evaluation.evaluate_code(
+            'LinearSolve[{{1.0, 2}, {3, 4}}, {5, 6}]')
+        test.assertAlmostEqual(result[0], -4)
+        test.assertAlmostEqual(result[1], 4.5)
+
+        result = evaluation.evaluate_code(
+            'LinearSolve[{{1.0, 1}, {2, 2}}, {1, 2}]')
+        test.assertAlmostEqual(result[0] + result[1], 1)
+
+        test.assertRaises(
+            Exception, evaluation.evaluate_code,
+            'LinearSolve[{{1, 1}, {2, 2}}, {1, 3}]')
+        test.assertRaises(
+            Exception, evaluation.evaluate_code,
+            'LinearSolve[{{1.0, 1}, {2, 2}}, {1, 3}]')
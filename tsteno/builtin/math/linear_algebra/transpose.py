@@ -0,0 +1,43 @@
+from tsteno.atoms.module import ModuleArg, Module
+from tsteno.kernel.linear_algebra import get_matrix_shape
+
+
+class Transpose(Module):
+    """
+    Transposes the first two levels in list.
+    ```
+    Transpose[list]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    Transpose[{{1, 2, 3}, {4, 5, 6}}]
+    ```
+    **Output:**
+    ```
+    {{1, 4}, {2, 5}, {3, 6}}
+    ```
+    """
+
+    def run(self, matrix):
+        get_matrix_shape(matrix, 'Transpose')
+
+        return [list(column) for column in zip(*matrix)]
+
+    def get_arguments(self):
+        return [
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code(
+            'Transpose[{{1, 2, 3}, {4, 5, 6}}]'), [[1, 4], [2, 5], [3, 6]])
+        test.assertEqual(evaluation.evaluate_code(
+            'Transpose[Transpose[{{a, b}, {c, d}}]]'),
+            evaluation.evaluate_code('{{a, b}, {c, d}}'))
+
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'Transpose[{1, 2}]')
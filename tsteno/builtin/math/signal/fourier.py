@@ -0,0 +1,62 @@
+import numpy as np
+from tsteno.atoms.module import ModuleArg, Module, ARG_FLAG_OPTIONAL
+from tsteno.kernel.signal import fourier
+
+
+class Fourier(Module):
+    """
+    Gives the discrete Fourier transform of a list of numbers (or of an
+    array, in all its dimensions), computed with FFT.
+    ```
+    Fourier[list]
+    Fourier[list, {a, b}]
+    ```
+
+    Each element is `n^((a - 1) / 2) Sum[u[r] Exp[2 Pi I b r s / n]]`,
+    default parameters are `{0, 1}` and b must be 1 or -1.
+
+    # Examples
+    **Input:**
+    ```
+    Fourier[{1, 2, 3, 4}]
+    ```
+    **Output:**
+    ```
+    {5., -1. - 1. I, -1., -1. + 1. I}
+    ```
+    """
+
+    def run(self, values, parameters=None):
+        return fourier(values, parameters, False, 'Fourier')
+
+    def get_arguments(self):
+        return [
+            ModuleArg(),
+            ModuleArg(ARG_FLAG_OPTIONAL)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        np.testing.assert_allclose(
+            evaluation.evaluate_code('Fourier[{1, 2, 3, 4}]'),
+            [5, -1 - 1j, -1, -1 + 1j])
+        np.testing.assert_allclose(
+            evaluation.evaluate_code('Fourier[{1, 2, 3, 4}, {1, -1}]'),
+            [10, -2 + 2j, -2, -2 - 2j])
+        np.testing.assert_allclose(
+            evaluation.evaluate_code('Fourier[{{1, 0}, {0, 0}}]'),
+            [[.5, .5], [.5, .5]])
+
+        # Against the definition, a sum of n^2 terms
+        values = np.random.default_rng(0).random(64)
+        positions = np.arange(64)
+        np.testing.assert_allclose(
+            self.run(values),
+            np.exp(2j * np.pi * np.outer(positions, positions) / 64) @ values
+            / 8)
+
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'Fourier[{a, b}]')
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'Fourier[{1, 2}, {0, 2}]')
@@ -0,0 +1,53 @@
+import numpy as np
+from tsteno.atoms.module import ModuleArg, Module, ARG_FLAG_OPTIONAL
+from tsteno.kernel.signal import fourier
+
+
+class InverseFourier(Module):
+    """
+    Gives the inverse discrete Fourier transform of a list of numbers (or
+    of an array, in all its dimensions), computed with FFT.
+    ```
+    InverseFourier[list]
+    InverseFourier[list, {a, b}]
+    ```
+
+    Each element is `n^((-1 - a) / 2) Sum[v[s] Exp[-2 Pi I b r s / n]]`,
+    default parameters are `{0, 1}` and b must be 1 or -1.
+
+    # Examples
+    **Input:**
+    ```
+    InverseFourier[Fourier[{1, 2, 3}]]
+    ```
+    **Output:**
+    ```
+    {1., 2., 3.}
+    ```
+    """
+
+    def run(self, values, parameters=None):
+        return fourier(values, parameters, True, 'InverseFourier')
+
+    def get_arguments(self):
+        return [
+            ModuleArg(),
+            ModuleArg(ARG_FLAG_OPTIONAL)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        np.testing.assert_allclose(evaluation.evaluate_code(
+            'InverseFourier[Fourier[{1, 2, 3}]]'), [1, 2, 3], atol=1e-12)
+        np.testing.assert_allclose(evaluation.evaluate_code(
+            'InverseFourier[Fourier[{{1, 2}, {3, 4}}, {-1, 1}], {-1, 1}]'),
+            [[1, 2], [3, 4]], atol=1e-12)
+        np.testing.assert_allclose(
+            evaluation.evaluate_code('InverseFourier[{4, 0, 0, 0}]'),
+            [2, 2, 2, 2])
+
+        # 10^6 points
+        np.testing.assert_allclose(evaluation.evaluate_code(
+            'InverseFourier[Fourier[Range[10^6]]]').real,
+            np.arange(1, 10 ** 6 + 1))
@@ -0,0 +1,63 @@
+import numpy as np
+from tsteno.atoms.module import ModuleArg, Module
+from tsteno.kernel.signal import convolve
+
+
+class ListConvolve(Module):
+    """
+    Gives the convolution of kernel with list, at each position where the
+    whole kernel overlaps list. Arrays are convolved in all dimensions.
+    ```
+    ListConvolve[kernel, list]
+    ```
+
+    Long kernels of numbers are convolved with FFT.
+
+    # Examples
+    **Input:**
+    ```
+    ListConvolve[{x, y}, {a, b, c}]
+    ```
+    **Output:**
+    ```
+    {b x + a y, c x + b y}
+    ```
+    """
+
+    def run(self, kernel, values):
+        return convolve(
+            kernel, values, self.get_kernel().get_kext('numerical'),
+            'ListConvolve')
+
+    def get_arguments(self):
+        return [
+            ModuleArg(),
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(
+            evaluation.evaluate_code('ListConvolve[{x, y}, {a, b, c}]'),
+            evaluation.evaluate_code('{b*x + a*y, c*x + b*y}'))
+        test.assertEqual(evaluation.evaluate_code(
+            'ListConvolve[{1, 2}, {1, 2, 3}]').tolist(), [4, 7])
+        np.testing.assert_allclose(evaluation.evaluate_code(
+            'ListConvolve[{{1, 0}, {0, -1.}}, {{1, 2, 3}, {4, 5, 6}}]'),
+            [[4, 4]])
+
+        # FFT, exact for integers
+        kernel = np.arange(1, 1001)
+        values = np.arange(3000) % 7
+        result = self.run(kernel, values)
+        test.assertEqual(result.dtype.kind, 'i')
+        test.assertEqual(
+            result.tolist(), np.convolve(values, kernel, 'valid').tolist())
+
+        # Too big for floating point
+        test.assertEqual(evaluation.evaluate_code(
+            'ListConvolve[{2^60, 1}, {2^60, 1, 1}]'), [2 ** 61, 2 ** 60 + 1])
+
+        test.assertRaises(Exception, evaluation.evaluate_code,
+                          'ListConvolve[{1, 2, 3}, {1, 2}]')
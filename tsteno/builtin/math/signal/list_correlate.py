@@ -0,0 +1,60 @@
+import numpy as np
+from tsteno.atoms.module import ModuleArg, Module
+from tsteno.kernel.signal import convolve, reverse
+
+
+class ListCorrelate(Module):
+    """
+    Gives the correlation of kernel with list, at each position where the
+    whole kernel overlaps list. Arrays are correlated in all dimensions.
+    ```
+    ListCorrelate[kernel, list]
+    ```
+
+    Long kernels of numbers are correlated with FFT.
+
+    # Examples
+    **Input:**
+    ```
+    ListCorrelate[{x, y}, {a, b, c}]
+    ```
+    **Output:**
+    ```
+    {a x + b y, b x + c y}
+    ```
+    """
+
+    def run(self, kernel, values):
+        return convolve(
+            reverse(kernel), values, self.get_kernel().get_kext('numerical'),
+            'ListCorrelate')
+
+    def get_arguments(self):
+        return [
+            ModuleArg(),
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(
+            evaluation.evaluate_code('ListCorrelate[{x, y}, {a, b, c}]'),
+            evaluation.evaluate_code('{a*x + b*y, b*x + c*y}'))
+        test.assertEqual(evaluation.evaluate_code(
+            'ListCorrelate[{1, 2}, {1, 2, 3}]').tolist(), [5, 8])
+        test.assertEqual(evaluation.evaluate_code(
+            'ListCorrelate[{{1, 2}}, {{1, 2, 3}, {4, 5, 6}}]').tolist(),
+            [[5, 8], [14, 17]])
+
+        # Complex kernels aren't conjugated
+        test.assertEqual(
+            evaluation.evaluate_code('ListCorrelate[{I, 1}, {2, 1}]'),
+            evaluation.evaluate_code('{1 + 2 I}'))
+        np.testing.assert_allclose(
+            self.run(np.array([1j, 1]), np.array([2, 1])), [1 + 2j])
+
+        values = np.random.default_rng(0).random(10 ** 5)
+        np.testing.assert_allclose(
+            self.run(values[:500], values),
+            np.correlate(values, values[:500], 'valid'))
@@ -0,0 +1,67 @@
+import sys
+from sympy import Symbol
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_ALL_NEXT
+from tsteno.atoms.module import ARG_FLAG_RETURN_VAR_NAME, ARG_FLAG_SPECIAL_CONTEXT
+from tsteno.language.ast import IdentifierToken
+
+
+class Clear(Module):
+    """
+    Clears values and definitions of the given symbols, memoized results
+    included.
+    ```
+    Clear[symbol1, symbol2, ...]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    f[n_] := f[n] = n^2; f[3]; Clear[f]; f[3]
+    ```
+
+    **Output:**
+    ```
+    f[3]
+    ```
+    """
+
+    def run(self, context, *symbols):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        for symbol in symbols:
+            if not isinstance(symbol, IdentifierToken):
+                raise Exception('Clear: `{}` is not a symbol'.format(symbol))
+
+            name = symbol.get_value()
+
+            if context.get_local_context():
+                context.user_variables.pop(name, None)
+                context.user_modules.pop(name, None)
+
+            evaluation.user_variables.pop(name, None)
+            evaluation.user_modules.pop(name, None)
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_SPECIAL_CONTEXT),
+            ModuleArg(ARG_FLAG_RETURN_VAR_NAME | ARG_FLAG_ALL_NEXT)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        recursion_limit = sys.getrecursionlimit()
+        test.assertEqual(evaluation.evaluate_code(
+            'fib[0] = 0; fib[1] = 1; fib[n_] := fib[n] = fib[n - 1] + fib[n - 2]; '
+            'fib[100]'), 354224848179261915075)
+        # Deep recursion limit only applies while evaluating
+        test.assertEqual(sys.getrecursionlimit(), recursion_limit)
+        # Results are remembered as definitions
+        test.assertEqual(len(evaluation.user_modules['fib'].literal_values), 101)
+
+        test.assertEqual(
+            str(evaluation.evaluate_code('Clear[fib]; fib[3]')), 'fib[3]')
+        test.assertEqual(evaluation.evaluate_code(
+            'a = 3; b = 4; Clear[a, b]; a + b'), Symbol('a') + Symbol('b'))
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'Clear[1]')
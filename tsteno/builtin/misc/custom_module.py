@@ -20,8 +20,15 @@ class UserDefinedModule(Module):
         context.set_local_context(True)
         fargs = self.parse_arguments(arguments, context)
 
+        return self.apply(fargs, context)
+
+    def apply(self, values, context):
+        context.set_local_context(True)
+        # Every variable assigned in a module is local
+        context.function_frame = False
+
         for i in range(0, len(self.variable_mapping)):
-            context.set_user_variable(self.variable_mapping[i], fargs[i])
+            context.set_user_variable(self.variable_mapping[i], values[i])
 
         self.local_variables(context)
         execution_result = self.function(context)
@@ -0,0 +1,78 @@
+from sympy import oo
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_OPTIONAL
+from tsteno.atoms.module import ARG_FLAG_RETURN_VAR_NAME, ARG_FLAG_SPECIAL_CONTEXT
+from tsteno.kernel.definition import get_definition
+from tsteno.language.ast import IdentifierToken
+
+MEMOIZE_DEFAULT_SIZE = 2 ** 16
+""" Default maximum number of remembered results """
+
+
+class Memoize(Module):
+    """
+    Remembers results of the user function f by arguments, so calls with the
+    same arguments are evaluated once. Only the last size results are kept
+    (`Infinity` keeps all of them).
+    ```
+    Memoize[f]
+    Memoize[f, size]
+    ```
+
+    Results are forgotten when f is redefined or cleared (`Clear[f]`).
+
+    # Examples
+    **Input:**
+    ```
+    fib[n_] := If[n < 2, n, fib[n - 1] + fib[n - 2]]; Memoize[fib]; fib[60]
+    ```
+
+    **Output:**
+    ```
+    1548008755920
+    ```
+    """
+
+    def run(self, context, function, size=MEMOIZE_DEFAULT_SIZE):
+        if not isinstance(function, IdentifierToken):
+            raise Exception(
+                'Memoize: `{}` is not a function name'.format(function))
+
+        if size == oo:
+            size = None
+        elif int(size) != size or size < 1:
+            raise Exception(
+                'Memoize: size `{}` is not a positive integer'.format(size))
+        else:
+            size = int(size)
+
+        evaluation = self.get_kernel().get_kext('eval')
+        get_definition(
+            evaluation, function.get_value(), context).memoize(size)
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_SPECIAL_CONTEXT),
+            ModuleArg(ARG_FLAG_RETURN_VAR_NAME),
+            ModuleArg(ARG_FLAG_OPTIONAL)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code(
+            'fib[n_] := If[n < 2, n, fib[n - 1] + fib[n - 2]]; '
+            'Memoize[fib]; fib[60]'), 1548008755920)
+
+        # Bounded size, least recently used results are dropped
+        evaluation.evaluate_code('sq[x_] := x^2; Memoize[sq, 2]')
+        test.assertEqual(evaluation.evaluate_code(
+            '{sq[1], sq[2], sq[1], sq[3]}'), [1, 4, 1, 9])
+        memo = evaluation.user_modules['sq'].memo
+        test.assertEqual(list(memo), [(1, ), (3, )])
+
+        # Redefinitions forget results
+        test.assertEqual(evaluation.evaluate_code('sq[x_] := x^3; sq[3]'), 27)
+        test.assertEqual(evaluation.evaluate_code('sq[1] = 5; sq[1]'), 5)
+
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'Memoize[sq, 0]')
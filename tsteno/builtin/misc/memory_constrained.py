@@ -0,0 +1,65 @@
+from sympy import Symbol
+from tsteno.kernel.constraint import ABORTED
+from tsteno.atoms.module import (
+    Module, ModuleArg, ARG_FLAG_NO_AUTO_EVAL, ARG_FLAG_OPTIONAL,
+    ARG_FLAG_SPECIAL_CONTEXT
+)
+
+
+class MemoryConstrained(Module):
+    """
+    Evaluates expr, stopping if more than b bytes of memory are requested.
+    ```
+    MemoryConstrained[expr, b]
+    ```
+    Returns `$Aborted` if memory constraint is not met.
+
+    ```
+    MemoryConstrained[expr, b, failexpr]
+    ```
+    Returns failexpr if memory constraint is not met.
+
+    # Examples
+    **Input:**
+    ```
+    MemoryConstrained[N[Range[10^6]], 10^4, failed]
+    ```
+    **Output:**
+    ```
+    failed
+    ```
+    """
+
+    def run(self, context, expr, memory, failexpr=None):
+        evaluation = self.get_kernel().get_kext('eval')
+        no_var_mode = context.get_no_var_mode()
+
+        def on_exceeded(err):
+            context.set_no_var_mode(no_var_mode)
+            if failexpr is None:
+                return ABORTED
+            return failexpr()
+
+        return evaluation.constrained(
+            expr, memory_constraint=int(memory), on_exceeded=on_exceeded)
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_SPECIAL_CONTEXT),
+            ModuleArg(ARG_FLAG_NO_AUTO_EVAL),
+            ModuleArg(),
+            ModuleArg(ARG_FLAG_NO_AUTO_EVAL | ARG_FLAG_OPTIONAL)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(
+            evaluation.evaluate_code('MemoryConstrained[1 + 1, 10^6]'), 2)
+
+        test.assertEqual(evaluation.evaluate_code(
+            'MemoryConstrained[N[Range[10^6]], 10^4, failed]'),
+            Symbol('failed'))
+
+        test.assertEqual(evaluation.evaluate_code(
+            'MemoryConstrained[N[Range[10^6]], 10^4]'), ABORTED)
@@ -1,18 +1,88 @@
-from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_ALLOW_APPLY
+import sympy as sp
+from sympy.abc import x, y
+from tsteno.atoms.module import Module, ModuleArg
+from tsteno.kernel.replacement import replace, to_alternatives
 
 
 class ReplaceAll(Module):
+    """
+    Applies a rule or list of rules to each subpart of expr. All rules are
+    applied at once, in one traversal of expr.
+    ```
+    expr /. rules
+    ReplaceAll[expr, rules]
+    ```
+
+    If rules is a list of lists of rules, or repeats a variable (`Solve`
+    solutions), a list with the result of each one is given.
+
+    # Examples
+    Swap variables.
+
+    **Input:**
+    ```
+    {x, y} /. {x -> y, y -> x}
+    ```
+
+    **Output:**
+    ```
+    {y, x}
+    ```
+    ---
+    Evaluate an expression in all solutions.
+
+    **Input:**
+    ```
+    x^2 + 1 /. Solve[x^2 == 4, x]
+    ```
+
+    **Output:**
+    ```
+    {5, 5}
+    ```
+    """
+
     def run(self, expr, rules):
-        for search, repl in rules.rules_dict.items():
-            expr = expr.subs(search, repl)
-        return expr
+        alternatives, multiple = to_alternatives(rules, 'ReplaceAll')
+        results = [replace(expr, rule) for rule in alternatives]
+
+        return results if multiple else results[0]
 
     def get_arguments(self):
         return [
-            ModuleArg(ARG_FLAG_ALLOW_APPLY), ModuleArg()
+            ModuleArg(), ModuleArg()
         ]
 
     def run_test(self, test):
         evaluation = self.get_kernel().get_kext('eval')
         test.assertEqual(evaluation.evaluate_code(
             '{x, x^2, x^3, x^4} /. x -> 2'), [2, 4, 8, 16])
+
+        # All rules in one traversal
+        test.assertEqual(evaluation.evaluate_code(
+            'x^2 + y /. {x -> 3, y -> 1}'), 10)
+        test.assertEqual(evaluation.evaluate_code(
+            '{x, y} /. {x -> y, y -> x}'), [y, x])
+        test.assertEqual(evaluation.evaluate_code(
+            'Sin[x + y] /. {(x + y) -> z}'), sp.sin(sp.Symbol('z')))
+        test.assertEqual(evaluation.evaluate_code('x /. {}'), x)
+
+        # Compound left sides are matched by their expression
+        test.assertEqual(evaluation.evaluate_code(
+            'f[x] + 1 /. f[x] -> 2'), 3)
+
+        # Native numbers and packed arrays, 1 and 1.0 are different
+        test.assertEqual(evaluation.evaluate_code('{x, 1} /. 1 -> 5'), [x, 5])
+        test.assertEqual(evaluation.evaluate_code(
+            '{1., 1} /. 1 -> 5'), [1.0, 5])
+        test.assertEqual(evaluation.evaluate_code(
+            'Last[Table[ii * 1., {ii, 300}] /. 300. -> c]'), sp.Symbol('c'))
+
+        # Alternatives
+        test.assertEqual(evaluation.evaluate_code(
+            'x^2 + 1 /. Solve[x^2 == 4, x]'), [5, 5])
+        test.assertEqual(evaluation.evaluate_code(
+            'x + y /. {{x -> 1, y -> 2}, {x -> 3}}'), [3, 3 + y])
+
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'x /. {x -> 1, 2}')
@@ -0,0 +1,58 @@
+from sympy.abc import x
+from tsteno.atoms.module import Module, ModuleArg
+from tsteno.kernel.replacement import replace_repeated, to_alternatives
+
+
+class ReplaceRepeated(Module):
+    """
+    Repeatedly applies rules to expr until it no longer changes. Cyclic
+    rules give an error as soon as an expression repeats.
+    ```
+    expr //. rules
+    ReplaceRepeated[expr, rules]
+    ```
+
+    # Examples
+    Follow a chain of rules.
+
+    **Input:**
+    ```
+    a //. {a -> b, b -> c}
+    ```
+
+    **Output:**
+    ```
+    c
+    ```
+    """
+
+    def run(self, expr, rules):
+        alternatives, multiple = to_alternatives(rules, 'ReplaceRepeated')
+        results = [
+            replace_repeated(expr, rule, 'ReplaceRepeated')
+            for rule in alternatives
+        ]
+
+        return results if multiple else results[0]
+
+    def get_arguments(self):
+        return [
+            ModuleArg(), ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+        test.assertEqual(evaluation.evaluate_code(
+            'a //. {a -> b, b -> c}'), evaluation.evaluate_code('c'))
+        test.assertEqual(evaluation.evaluate_code(
+            '{a, b} //. {a -> b, b -> c}'), evaluation.evaluate_code('{c, c}'))
+        test.assertEqual(evaluation.evaluate_code('x^2 //. x -> 3'), 9)
+        test.assertEqual(evaluation.evaluate_code(
+            'ReplaceRepeated[x + 1, x -> x]'), x + 1)
+
+        # Single replacement, unlike ReplaceAll
+        test.assertEqual(evaluation.evaluate_code(
+            'a /. {a -> b, b -> c}'), evaluation.evaluate_code('b'))
+
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'a //. {a -> b, b -> a}')
@@ -5,7 +5,8 @@ from tsteno.atoms.rule import RuleSet
 class Rule(Module):
 
     def run(self, key, value):
-        return RuleSet(self.get_kernel(), {str(key): value})
+        # Keys are strings, so rules can be used as options
+        return RuleSet(self.get_kernel(), {str(key): value}, {str(key): key})
 
     def get_arguments(self):
         return [
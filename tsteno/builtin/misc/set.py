@@ -1,35 +1,38 @@
+from tsteno.atoms.association import Association
+from tsteno.atoms.sequence import Sequence
 from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_SPECIAL_CONTEXT
 from tsteno.atoms.module import ARG_FLAG_RETURN_VAR_NAME
+from tsteno.kernel.definition import define_function, define_variable
 
 
 class Set(Module):
 
     def define_one(self, evaluation, variable, value, context):
-        if isinstance(value, Module):
-            variable_name = variable.head
-            value.set_param_mapping(variable.childrens)
-            if context.get_local_context():
-                define_var_fn = context.set_user_module
-            else:
-                define_var_fn = evaluation.set_global_user_module
-        else:
-            if context.get_local_context():
-                define_var_fn = context.set_user_variable
-            else:
-                define_var_fn = evaluation.set_global_user_variable
-
-            if hasattr(value, '__call__'):
-                value = value()
-
-            variable_name = variable.get_value()
-
-        define_var_fn(variable_name, value)
+        if hasattr(variable, 'head'):
+            # Function definition, `f[n_] = value`
+            define_function(evaluation, variable, value, context)
+            return
+
+        if hasattr(value, '__call__') and not isinstance(value, Module):
+            value = value()
+
+        if isinstance(value, Association):
+            # Associations are modified in place (`AssociateTo`)
+            value = value.copy()
+
+        define_variable(evaluation, variable.get_value(), value, context)
 
     def run(self, all_variables, all_values, context):
         evaluation = self.get_kernel().get_kext('eval')
 
         if not isinstance(all_variables, list):
-            all_variables = [all_variables]
+            # Lists with one or no items are values too, s = {}
+            self.define_one(evaluation, all_variables, all_values, context)
+            return all_values
+
+        if isinstance(all_values, Sequence):
+            # {a, b} = Range[2]
+            all_values = all_values.tolist()
 
         if not isinstance(all_values, list):
             all_values = [all_values]
@@ -63,5 +66,17 @@ class Set(Module):
         test.assertEqual(evaluation.evaluate_code(
             '{a, b, c} = {1, 2, 3}; b'), 2)
 
+        # Definitions for literal arguments
+        test.assertEqual(evaluation.evaluate_code(
+            'Do[sq[i] = i^2, {i, 100}]; sq[7] + sq[8]'), 113)
+        test.assertEqual(evaluation.evaluate_code(
+            'cube[x_] = x^3; cube[2]'), 8)
+        floats = '{' + ', '.join('{}.'.format(i) for i in range(1, 301)) + '}'
+        test.assertEqual(evaluation.evaluate_code(
+            'sqf[' + floats + '] = 1; sqf[Table[ii * 1., {ii, 300}]]'), 1)
+
+        test.assertEqual(evaluation.evaluate_code('a = {5}; a'), [5])
+        test.assertEqual(evaluation.evaluate_code('a = {}; a'), [])
+
         test.assertEqual(evaluation.evaluate_code(
             't = {x, x^2, x^3, x^4} /. x -> 2; t'), [2, 4, 8, 16])
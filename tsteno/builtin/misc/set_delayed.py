@@ -0,0 +1,96 @@
+from sympy import Symbol
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_SPECIAL_CONTEXT
+from tsteno.atoms.module import ARG_FLAG_RETURN_VAR_NAME, ARG_FLAG_NO_AUTO_EVAL
+from tsteno.kernel.definition import define_function, define_variable
+
+
+class SetDelayed(Module):
+    """
+    Defines a function, rhs is evaluated each time the function is called.
+    A function can have many definitions, the most specific one matching
+    the arguments is used.
+    ```
+    lhs := rhs
+    SetDelayed[lhs, rhs]
+    ```
+
+    Variables (`x := rhs`) are assigned as with `Set`.
+
+    # Examples
+    Factorial, with a literal definition for zero.
+
+    **Input:**
+    ```
+    fact[0] = 1; fact[n_] := n * fact[n - 1]; fact[5]
+    ```
+
+    **Output:**
+    ```
+    120
+    ```
+    """
+
+    def run(self, variable, value, context):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        if hasattr(variable, 'head'):
+            define_function(evaluation, variable, value, context, True)
+        else:
+            define_variable(
+                evaluation, variable.get_value(), value(context), context)
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_RETURN_VAR_NAME),
+            ModuleArg(ARG_FLAG_NO_AUTO_EVAL),
+            ModuleArg(ARG_FLAG_SPECIAL_CONTEXT)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code(
+            'fact[0] = 1; fact[n_] := n * fact[n - 1]; fact[5]'), 120)
+
+        # Definition order doesn't matter, literals are more specific
+        test.assertEqual(evaluation.evaluate_code(
+            'fib[n_] := fib[n - 1] + fib[n - 2]; fib[0] = 0; fib[1] = 1; '
+            'fib[10]'), 55)
+
+        # Delayed, rhs uses current values
+        test.assertEqual(evaluation.evaluate_code(
+            'k = 1; g[x_] := x + k; k = 10; g[1]'), 11)
+
+        # Redefinition replaces, other arities and literals are kept
+        evaluation.evaluate_code(
+            'h[x_] := 1; h[x_] := 2; h[x_, y_] := 3; h[0, y_] := 4; '
+            'h[x_, x_] := 5')
+        test.assertEqual(evaluation.evaluate_code('h[7]'), 2)
+        test.assertEqual(evaluation.evaluate_code('h[1, 2]'), 3)
+        test.assertEqual(evaluation.evaluate_code('h[0, 2]'), 4)
+        test.assertEqual(evaluation.evaluate_code('h[2, 2]'), 5)
+
+        # Bodies change globals, only patterns are local
+        test.assertEqual(evaluation.evaluate_code(
+            'tot = 0; acc[x_] := (tot = tot + x); acc[3]; acc[4]; tot'), 7)
+        test.assertEqual(evaluation.evaluate_code(
+            'lst = {}; push[x_] := AppendTo[lst, x]; push[1]; push[2]; lst'),
+            [1, 2])
+        test.assertEqual(evaluation.evaluate_code('x'), Symbol('x'))
+
+        # Module bodies
+        test.assertEqual(evaluation.evaluate_code(
+            'sq[x_] := Module[{y = x}, y * y]; sq[3]'), 9)
+
+        # No matching definition, call stays symbolic
+        test.assertEqual(
+            evaluation.evaluate_code('fact[1, 2]').get_sympy().func.__name__,
+            'fact')
+
+        # Symbolic literals
+        test.assertEqual(evaluation.evaluate_code(
+            'p[a] := 1; p[b] := 2; p[b]'), 2)
+
+        # Variables are assigned
+        test.assertEqual(evaluation.evaluate_code('v := 2 + 3; v'), 5)
+        test.assertEqual(evaluation.evaluate_code('a'), Symbol('a'))
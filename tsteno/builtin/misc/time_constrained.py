@@ -0,0 +1,113 @@
+import signal
+from sympy import Symbol
+from tsteno.kernel.constraint import (
+    ABORTED, Constraint, ConstraintExceeded, ConstraintStack
+)
+from tsteno.atoms.module import (
+    Module, ModuleArg, ARG_FLAG_NO_AUTO_EVAL, ARG_FLAG_OPTIONAL,
+    ARG_FLAG_SPECIAL_CONTEXT
+)
+
+
+class TimeConstrained(Module):
+    """
+    Evaluates expr, stopping after t seconds.
+    ```
+    TimeConstrained[expr, t]
+    ```
+    Returns `$Aborted` if time constraint is not met.
+
+    ```
+    TimeConstrained[expr, t, failexpr]
+    ```
+    Returns failexpr if time constraint is not met.
+
+    # Examples
+    **Input:**
+    ```
+    j = 0; TimeConstrained[While[j >= 0, j++], 1, -1]
+    ```
+    **Output:**
+    ```
+    -1
+    ```
+    """
+
+    def run(self, context, expr, seconds, failexpr=None):
+        evaluation = self.get_kernel().get_kext('eval')
+        no_var_mode = context.get_no_var_mode()
+
+        def on_exceeded(err):
+            context.set_no_var_mode(no_var_mode)
+            if failexpr is None:
+                return ABORTED
+            return failexpr()
+
+        return evaluation.constrained(
+            expr, time_constraint=float(seconds), on_exceeded=on_exceeded)
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_SPECIAL_CONTEXT),
+            ModuleArg(ARG_FLAG_NO_AUTO_EVAL),
+            ModuleArg(),
+            ModuleArg(ARG_FLAG_NO_AUTO_EVAL | ARG_FLAG_OPTIONAL)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(
+            evaluation.evaluate_code('TimeConstrained[1 + 1, 5]'), 2)
+
+        test.assertEqual(evaluation.evaluate_code(
+            'j = 0; TimeConstrained[While[j >= 0, j++], 0.1, -1]'), -1)
+
+        test.assertEqual(evaluation.evaluate_code(
+            'j = 0; TimeConstrained[While[j >= 0, j++], 1/10]'), ABORTED)
+
+        # Inner constraint doesn't catch outer one.
+        test.assertEqual(evaluation.evaluate_code(
+            'j = 0; TimeConstrained['
+            'TimeConstrained[While[j >= 0, j++], 10, inner], 0.1, outer]'),
+            Symbol('outer'))
+
+        # Constant arguments are computed within the budget, not before.
+        test.assertEqual(evaluation.evaluate_code(
+            'TimeConstrained[N[Pi, 200000], 0.2, fail]'), Symbol('fail'))
+
+        # Watchdog doesn't interrupt constraint bookkeeping, an expired
+        # constraint being popped would stay active otherwise.
+        if hasattr(signal, 'SIGALRM'):
+            constraints = ConstraintStack()
+            expired = Constraint(-1)
+            constraints.constraints.append(expired)
+
+            def pop_on_signal():
+                signal.raise_signal(signal.SIGALRM)
+                constraints.pop(expired)
+
+            constraints.protect(pop_on_signal)
+            previous_handler = signal.signal(
+                signal.SIGALRM, constraints.watchdog_handler)
+
+            try:
+                pop_on_signal()
+                test.assertFalse(constraints)
+
+                constraints.constraints.append(expired)
+                with test.assertRaises(ConstraintExceeded):
+                    signal.raise_signal(signal.SIGALRM)
+            finally:
+                signal.signal(signal.SIGALRM, previous_handler)
+
+        # Default per evaluation budget.
+        previous_constraint = evaluation.time_constraint
+        evaluation.time_constraint = 0.1
+
+        try:
+            test.assertEqual(evaluation.evaluate_code(
+                'j = 0; While[j >= 0, j++]; j'), ABORTED)
+            test.assertEqual(evaluation.evaluate_code('1 + 1'), 2)
+        finally:
+            evaluation.time_constraint = previous_constraint
@@ -1,3 +1,4 @@
+from sympy import Symbol, sympify
 from sympy.core.function import Derivative, Function
 from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_ALL_NEXT
 
@@ -23,6 +24,10 @@ class Unknown(Module):
 
         test.assertIsInstance(t, Derivative)
 
+        test.assertEqual(
+            evaluation.evaluate_code("1 - chachi[x]"),
+            1 - Function('chachi')(Symbol('x')))
+
 
 class UnknownProxy(Unknown):
     def __init__(self, kernel, fname, arguments):
@@ -30,6 +35,11 @@ class UnknownProxy(Unknown):
         self.head = fname
         self.childrens = arguments
 
+    def run(self, *arguments):
+        # Keep evaluated arguments (`f[1 + 1]` is `f[2]`)
+        self.childrens = list(arguments)
+        return self
+
     def __repr__(self):
         argument_repr = ", ".join(list(map(lambda x: str(x), self.childrens)))
         return "{}[{}]".format(self.head, argument_repr)
@@ -38,10 +48,37 @@ class UnknownProxy(Unknown):
         args = []
 
         for child in self.childrens:
-            args.append(child.get_sympy())
+            if hasattr(child, 'get_sympy'):
+                args.append(child.get_sympy())
+            else:
+                args.append(sympify(child))
 
         return Function(self.head)(*args)
 
+    def __neg__(self):
+        return -self.get_sympy()
+
+    def __add__(self, other):
+        return self.get_sympy() + other
+
+    def __mul__(self, other):
+        return self.get_sympy() * other
+
+    def __sub__(self, other):
+        return self.get_sympy() - other
+
+    def __truediv__(self, other):
+        return self.get_sympy() / other
+
+    def __rtruediv__(self, other):
+        return other / self.get_sympy()
+
+    def __pow__(self, other):
+        return self.get_sympy() ** other
+
+    def __rpow__(self, other):
+        return other ** self.get_sympy()
+
     def __radd__(self, other):
         return self.get_sympy() + other
 
@@ -49,7 +86,7 @@ class UnknownProxy(Unknown):
         return self.get_sympy() * other
 
     def __rsub__(self, other):
-        return self.get_sympy() - other
+        return other - self.get_sympy()
 
     def __rdiv__(self, other):
         return self.get_sympy() / other
@@ -0,0 +1,3 @@
+"""
+This package contains builtin random functions
+"""
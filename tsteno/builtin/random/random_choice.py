@@ -0,0 +1,117 @@
+"""
+This file contains class definition for drawing random numbers.
+"""
+import numpy as np
+from tsteno.atoms.arithmetic_sequence import ArithmeticSequence
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_OPTIONAL
+from tsteno.atoms.rule import RuleSet
+from tsteno.kernel.packed import is_list, pack
+from tsteno.kernel.sampling import get_shape, to_result
+
+
+class RandomChoice(Module):
+    """
+    Gives a pseudo-random choice of an element of list, or a list of
+    choices (with replacement). Elements are equally likely, unless
+    weights are given.
+    ```
+    RandomChoice[list]
+    RandomChoice[list, n]
+    RandomChoice[list, {n1, n2, ...}]
+    RandomChoice[{w1, w2, ...} -> list, ...]
+    ```
+
+    Choices are drawn at once, as positions, so packed lists give packed
+    arrays.
+
+    # Examples
+    **Input:**
+    ```
+    RandomChoice[{9, 1} -> {heads, tails}, 5]
+    ```
+    **Output:**
+    ```
+    {heads, heads, tails, heads, heads}
+    ```
+    """
+
+    def run(self, choices, shape=None):
+        weights = None
+        if isinstance(choices, RuleSet):
+            rules = choices.items()
+            if len(rules) != 1:
+                raise Exception(
+                    'RandomChoice: `{}` is not a rule weights -> list'.format(
+                        choices))
+            weights, choices = rules[0]
+
+        if not is_list(choices) or not len(choices):
+            raise Exception(
+                'RandomChoice: `{}` is not a non empty list'.format(choices))
+
+        generator = self.get_kernel().get_kext('random').get_generator()
+        positions = generator.choice(
+            len(choices), get_shape(shape, 'RandomChoice'),
+            p=self.get_probabilities(weights, len(choices)))
+
+        if isinstance(choices, ArithmeticSequence):
+            return to_result(choices.start + choices.step * positions)
+
+        array = pack(choices)
+        if array is not None:
+            return to_result(array[positions])
+
+        if np.ndim(positions) == 0:
+            return choices[int(positions)]
+
+        items = np.empty(len(choices), dtype=object)
+        for position, item in enumerate(choices):
+            items[position] = item
+
+        return items[positions].tolist()
+
+    @staticmethod
+    def get_probabilities(weights, size):
+        if weights is None:
+            return None
+
+        array = pack(weights)
+        if array is None or array.shape != (size, ) or \
+                array.dtype.kind not in 'biuf' or \
+                (array < 0).any() or not array.sum() > 0:
+            raise Exception(
+                'RandomChoice: `{}` are not {} non negative weights'.format(
+                    weights, size))
+
+        return array / array.sum()
+
+    def get_arguments(self):
+        return [
+            ModuleArg(),
+            ModuleArg(ARG_FLAG_OPTIONAL)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertIn(evaluation.evaluate_code('RandomChoice[{a, b, c}]'),
+                      evaluation.evaluate_code('{a, b, c}'))
+
+        values = evaluation.evaluate_code('RandomChoice[{2, 4, 8}, 10^4]')
+        test.assertIsInstance(values, np.ndarray)
+        test.assertEqual(sorted(set(values.tolist())), [2, 4, 8])
+
+        values = evaluation.evaluate_code('RandomChoice[Range[0, 10, 5], 100]')
+        test.assertTrue(set(values.tolist()) <= {0, 5, 10})
+
+        # Weights
+        test.assertEqual(evaluation.evaluate_code(
+            'RandomChoice[{0, 1, 0} -> {{1, 2}, x, y}, {2, 2}]'),
+            evaluation.evaluate_code('{{x, x}, {x, x}}'))
+        test.assertEqual(evaluation.evaluate_code(
+            'RandomChoice[{1, 0} -> {{1, 2}, x}, 2]'), [[1, 2], [1, 2]])
+
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'RandomChoice[{}]')
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'RandomChoice[{-1, 2} -> {a, b}]')
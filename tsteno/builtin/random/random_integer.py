@@ -0,0 +1,82 @@
+"""
+This file contains class definition for drawing random numbers.
+"""
+import numpy as np
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_OPTIONAL
+from tsteno.kernel.sampling import get_bounds, get_shape, integers
+from tsteno.kernel.sampling import to_integer
+
+
+class RandomInteger(Module):
+    """
+    Gives a pseudo-random integer uniformly distributed in a range, both
+    bounds included (0 or 1 by default), or a packed array of them.
+    ```
+    RandomInteger[]
+    RandomInteger[max]
+    RandomInteger[{min, max}]
+    RandomInteger[range, n]
+    RandomInteger[range, {n1, n2, ...}]
+    ```
+
+    All numbers are drawn at once from the kernel generator, see
+    `SeedRandom`. Ranges beyond 64 bit integers give lists of exact
+    integers instead of packed arrays.
+
+    # Examples
+    **Input:**
+    ```
+    RandomInteger[{1, 6}, 5]
+    ```
+    **Output:**
+    ```
+    {3, 1, 6, 6, 2}
+    ```
+    """
+
+    def run(self, bounds=1, shape=None):
+        low, high = get_bounds(bounds, to_integer, 'RandomInteger')
+        if low > high:
+            raise Exception('RandomInteger: `{}` is an empty range'.format(
+                bounds))
+
+        generator = self.get_kernel().get_kext('random').get_generator()
+
+        return integers(
+            generator, low, high, get_shape(shape, 'RandomInteger'))
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_OPTIONAL),
+            ModuleArg(ARG_FLAG_OPTIONAL)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertIn(evaluation.evaluate_code('RandomInteger[]'), (0, 1))
+        test.assertIs(type(evaluation.evaluate_code('RandomInteger[9]')), int)
+
+        values = evaluation.evaluate_code('RandomInteger[{1, 6}, 10^5]')
+        test.assertIsInstance(values, np.ndarray)
+        test.assertEqual(sorted(set(values.tolist())), [1, 2, 3, 4, 5, 6])
+
+        test.assertEqual(evaluation.evaluate_code(
+            'RandomInteger[{-1, -1}, {2, 2}]').tolist(), [[-1, -1], [-1, -1]])
+
+        # Big integers
+        value = evaluation.evaluate_code('RandomInteger[10^30]')
+        test.assertIs(type(value), int)
+        test.assertTrue(0 <= value <= 10 ** 30)
+        values = evaluation.evaluate_code('RandomInteger[{-2^70, 2^70}, {2, 3}]')
+        test.assertEqual([len(row) for row in values], [3, 3])
+        test.assertTrue(all(
+            -2 ** 70 <= value <= 2 ** 70 for row in values for value in row))
+        test.assertEqual(
+            evaluation.evaluate_code('RandomInteger[{2^70, 2^70}, 2]'),
+            [2 ** 70, 2 ** 70])
+
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'RandomInteger[{2, 1}]')
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'RandomInteger[1.5]')
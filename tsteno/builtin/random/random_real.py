@@ -0,0 +1,63 @@
+"""
+This file contains class definition for drawing random numbers.
+"""
+import numpy as np
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_OPTIONAL
+from tsteno.kernel.sampling import get_bounds, get_shape, to_real, to_result
+
+
+class RandomReal(Module):
+    """
+    Gives a pseudo-random real number uniformly distributed in a range
+    (from 0 to 1 by default), or a packed array of them.
+    ```
+    RandomReal[]
+    RandomReal[max]
+    RandomReal[{min, max}]
+    RandomReal[range, n]
+    RandomReal[range, {n1, n2, ...}]
+    ```
+
+    All numbers are drawn at once from the kernel generator, see
+    `SeedRandom`.
+
+    # Examples
+    **Input:**
+    ```
+    Mean[RandomReal[{-1, 1}, 10^6]]
+    ```
+    **Output:**
+    ```
+    0.000316...
+    ```
+    """
+
+    def run(self, bounds=1, shape=None):
+        low, high = get_bounds(bounds, to_real, 'RandomReal')
+        generator = self.get_kernel().get_kext('random').get_generator()
+
+        return to_result(generator.uniform(
+            low, high, get_shape(shape, 'RandomReal')))
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_OPTIONAL),
+            ModuleArg(ARG_FLAG_OPTIONAL)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        value = evaluation.evaluate_code('RandomReal[]')
+        test.assertIs(type(value), float)
+        test.assertTrue(0 <= value < 1)
+
+        values = evaluation.evaluate_code('RandomReal[{-2, 3/2}, 10^5]')
+        test.assertIsInstance(values, np.ndarray)
+        test.assertEqual(values.shape, (10 ** 5, ))
+        test.assertTrue(values.min() >= -2 and values.max() < 1.5)
+
+        test.assertEqual(
+            evaluation.evaluate_code('RandomReal[5, {2, 3}]').shape, (2, 3))
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'RandomReal[x]')
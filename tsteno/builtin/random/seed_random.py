@@ -0,0 +1,68 @@
+"""
+This file contains class definition for drawing random numbers.
+"""
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_OPTIONAL
+from tsteno.kernel.sampling import to_integer
+
+
+class SeedRandom(Module):
+    """
+    Restarts the kernel pseudo-random generator from a seed, so next random
+    numbers are reproducible, or from OS entropy if no seed is given.
+    ```
+    SeedRandom[n]
+    SeedRandom[]
+    ```
+
+    Sub-kernels created afterwards draw from independent streams, spawned
+    from the seed.
+
+    # Examples
+    **Input:**
+    ```
+    SeedRandom[42]; a = RandomReal[]; SeedRandom[42]; a == RandomReal[]
+    ```
+    **Output:**
+    ```
+    True
+    ```
+    """
+
+    def run(self, seed=None):
+        if seed is not None:
+            seed = to_integer(seed, 'SeedRandom')
+
+        self.get_kernel().get_kext('random').seed(seed)
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_OPTIONAL)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+        random = self.get_kernel().get_kext('random')
+
+        first = evaluation.evaluate_code('SeedRandom[42]; RandomReal[1, 10]')
+        second = evaluation.evaluate_code('SeedRandom[42]; RandomReal[1, 10]')
+        test.assertEqual(first.tolist(), second.tolist())
+
+        # Sub-kernel and worker streams are reproducible and independent
+        evaluation.evaluate_code('SeedRandom[7]')
+        first = [
+            self.get_kernel().create_subkernel().get_kext('random')
+            .get_generator().random() for _ in range(2)
+        ] + [generator.random() for generator in random.spawn(2)]
+
+        evaluation.evaluate_code('SeedRandom[7]')
+        second = [
+            self.get_kernel().create_subkernel().get_kext('random')
+            .get_generator().random() for _ in range(2)
+        ] + [generator.random() for generator in random.spawn(2)]
+
+        test.assertEqual(first, second)
+        test.assertEqual(len(set(first)), 4)
+
+        evaluation.evaluate_code('SeedRandom[]')
+        test.assertRaises(
+            Exception, evaluation.evaluate_code, 'SeedRandom[-1]')
@@ -0,0 +1,3 @@
+"""
+This package contains builtin statistics functions
+"""
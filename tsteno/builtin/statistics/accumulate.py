@@ -0,0 +1,55 @@
+"""
+This file contains class definition for list statistics.
+"""
+from sympy import Symbol
+from tsteno.atoms.module import Module, ModuleArg
+from tsteno.kernel.statistics import accumulate
+
+
+class Accumulate(Module):
+    """
+    Gives the running sums of the elements of list (of its rows, for
+    matrices).
+    ```
+    Accumulate[list]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    Accumulate[{1, 2, 3, 4}]
+    ```
+    **Output:**
+    ```
+    {1, 3, 6, 10}
+    ```
+    """
+
+    def run(self, values):
+        return accumulate(values, self.get_kernel().get_kext('numerical'))
+
+    def get_arguments(self):
+        return [
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code(
+            'Accumulate[{1, 2, 3, 4}]').tolist(), [1, 3, 6, 10])
+        test.assertEqual(evaluation.evaluate_code(
+            'Accumulate[{{1, 2}, {3, 4}}]').tolist(), [[1, 2], [4, 6]])
+        test.assertEqual(evaluation.evaluate_code('Accumulate[{}]'), [])
+
+        a, b = Symbol('a'), Symbol('b')
+        test.assertEqual(
+            evaluation.evaluate_code('Accumulate[{a, b, 1}]'),
+            [a, a + b, a + b + 1])
+        test.assertEqual(
+            evaluation.evaluate_code('Accumulate[{{a, 1}, {b, 2}}]'),
+            [[a, 1], [a + b, 3]])
+
+        # Exact, without overflows
+        test.assertEqual(evaluation.evaluate_code(
+            'Accumulate[{2^62, 2^62}]'), [2 ** 62, 2 ** 63])
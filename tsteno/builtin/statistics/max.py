@@ -0,0 +1,46 @@
+"""
+This file contains class definition for list statistics.
+"""
+from sympy import Max as SympyMax, Symbol, oo
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_ALL_NEXT
+from tsteno.kernel.statistics import extremum
+
+
+class Max(Module):
+    """
+    Gives the largest of the arguments, elements of lists are compared
+    too.
+    ```
+    Max[x1, x2, ...]
+    Max[{x1, x2, ...}, ...]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    Max[{3, 1}, 2, {{4}, 0}]
+    ```
+    **Output:**
+    ```
+    4
+    ```
+    """
+
+    def run(self, *arguments):
+        return extremum(arguments, True)
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_ALL_NEXT)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(
+            evaluation.evaluate_code('Max[{3, 1}, 2, {{4}, 0}]'), 4)
+        test.assertEqual(evaluation.evaluate_code('Max[1, 2.5, 1/2]'), 2.5)
+        test.assertEqual(evaluation.evaluate_code('Max[Range[10^9]]'), 10 ** 9)
+        test.assertEqual(evaluation.evaluate_code('Max[{}]'), -oo)
+        test.assertEqual(
+            evaluation.evaluate_code('Max[{a, 1}, 2]'), SympyMax(Symbol('a'), 2))
@@ -0,0 +1,49 @@
+"""
+This file contains class definition for list statistics.
+"""
+from sympy import Rational
+from tsteno.atoms.module import Module, ModuleArg
+from tsteno.kernel.statistics import mean
+
+
+class Mean(Module):
+    """
+    Gives the mean of the elements of list (of its columns, for matrices).
+    Integers give exact results.
+    ```
+    Mean[list]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    Mean[{1, 2, 3, 4}]
+    ```
+    **Output:**
+    ```
+    5/2
+    ```
+    """
+
+    def run(self, values):
+        return mean(values, self.get_kernel().get_kext('numerical'))
+
+    def get_arguments(self):
+        return [
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(
+            evaluation.evaluate_code('Mean[{1, 2, 3, 4}]'), Rational(5, 2))
+        test.assertIs(type(evaluation.evaluate_code('Mean[{1, 2, 3}]')), int)
+        test.assertEqual(evaluation.evaluate_code('Mean[{1, 2.5}]'), 1.75)
+        test.assertEqual(
+            str(evaluation.evaluate_code('Mean[{a, b}]')), 'a/2 + b/2')
+        test.assertEqual(evaluation.evaluate_code(
+            'Mean[{{1, 2}, {3, 5}}]'), [2, Rational(7, 2)])
+        test.assertEqual(
+            evaluation.evaluate_code('Mean[Range[0, 1, 1/4]]'), Rational(1, 2))
+        test.assertRaises(Exception, evaluation.evaluate_code, 'Mean[{}]')
@@ -0,0 +1,53 @@
+"""
+This file contains class definition for list statistics.
+"""
+from sympy import Rational
+from tsteno.atoms.module import Module, ModuleArg
+from tsteno.kernel.statistics import median
+
+
+class Median(Module):
+    """
+    Gives the median of the elements of list (of its columns, for
+    matrices), the mean of the two middle elements if their number is even.
+    ```
+    Median[list]
+    ```
+
+    Packed lists are partitioned with Numpy, without sorting them.
+
+    # Examples
+    **Input:**
+    ```
+    Median[{5, 1, 4, 2}]
+    ```
+    **Output:**
+    ```
+    3
+    ```
+    """
+
+    def run(self, values):
+        return median(values, self.get_kernel().get_kext('numerical'))
+
+    def get_arguments(self):
+        return [
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code('Median[{5, 1, 4, 2}]'), 3)
+        test.assertEqual(
+            evaluation.evaluate_code('Median[{5, 1, 4}]'), 4)
+        test.assertEqual(
+            evaluation.evaluate_code('Median[{1, 2}]'), Rational(3, 2))
+        test.assertEqual(
+            evaluation.evaluate_code('Median[{0.5, 3, 1}]'), 1)
+        test.assertEqual(
+            evaluation.evaluate_code('Median[{1/3, 1/2, 1/4}]'), Rational(1, 3))
+        test.assertEqual(
+            evaluation.evaluate_code('Median[Range[10^9]]'),
+            Rational(10 ** 9 + 1, 2))
+        test.assertRaises(Exception, evaluation.evaluate_code, 'Median[{a, b}]')
@@ -0,0 +1,47 @@
+"""
+This file contains class definition for list statistics.
+"""
+from sympy import Min as SympyMin, Symbol, oo
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_ALL_NEXT
+from tsteno.kernel.statistics import extremum
+
+
+class Min(Module):
+    """
+    Gives the smallest of the arguments, elements of lists are compared
+    too.
+    ```
+    Min[x1, x2, ...]
+    Min[{x1, x2, ...}, ...]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    Min[{3, 1}, 2, {{4}, 0}]
+    ```
+    **Output:**
+    ```
+    0
+    ```
+    """
+
+    def run(self, *arguments):
+        return extremum(arguments, False)
+
+    def get_arguments(self):
+        return [
+            ModuleArg(ARG_FLAG_ALL_NEXT)
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(
+            evaluation.evaluate_code('Min[{3, 1}, 2, {{4}, 0}]'), 0)
+        test.assertEqual(evaluation.evaluate_code('Min[1, 2.5, 1/2]'), 0.5)
+        test.assertEqual(
+            evaluation.evaluate_code('Min[Range[10, 1, -1]]'), 1)
+        test.assertEqual(evaluation.evaluate_code('Min[{}]'), oo)
+        test.assertEqual(
+            evaluation.evaluate_code('Min[{a, 1}, 2]'), SympyMin(Symbol('a'), 1))
@@ -0,0 +1,53 @@
+"""
+This file contains class definition for list statistics.
+"""
+from tsteno.atoms.module import Module, ModuleArg
+from tsteno.kernel.statistics import quantile
+
+
+class Quantile(Module):
+    """
+    Gives the q-th quantile of the elements of list (of its columns, for
+    matrices), the element at position `Ceiling[q Length[list]]` once
+    sorted.
+    ```
+    Quantile[list, q]
+    Quantile[list, {q1, q2, ...}]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    Quantile[{5, 1, 4, 2, 3}, {1/4, 1/2, 1}]
+    ```
+    **Output:**
+    ```
+    {2, 3, 5}
+    ```
+    """
+
+    def run(self, values, quantiles):
+        return quantile(
+            values, quantiles, self.get_kernel().get_kext('numerical'))
+
+    def get_arguments(self):
+        return [
+            ModuleArg(),
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code(
+            'Quantile[{5, 1, 4, 2, 3}, {1/4, 1/2, 1}]'), [2, 3, 5])
+        test.assertEqual(
+            evaluation.evaluate_code('Quantile[{5, 1, 4, 2, 3}, 0]'), 1)
+        test.assertEqual(
+            evaluation.evaluate_code('Quantile[{1/2, 1/3, 1}, 0.5]'), 0.5)
+        test.assertEqual(
+            evaluation.evaluate_code('Quantile[Range[10, 1, -1], 0.3]'), 3)
+        test.assertEqual(evaluation.evaluate_code(
+            'Quantile[{{1, 6}, {3, 5}, {2, 4}}, 1/2]'), [2, 5])
+        test.assertRaises(Exception, evaluation.evaluate_code,
+                          'Quantile[{1, 2}, 2]')
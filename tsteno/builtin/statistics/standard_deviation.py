@@ -0,0 +1,47 @@
+"""
+This file contains class definition for list statistics.
+"""
+from sympy import sqrt
+from tsteno.atoms.module import Module, ModuleArg
+from tsteno.kernel.statistics import standard_deviation
+
+
+class StandardDeviation(Module):
+    """
+    Gives the standard deviation of the elements of list (of its columns,
+    for matrices), the square root of its unbiased variance.
+    ```
+    StandardDeviation[list]
+    ```
+
+    # Examples
+    **Input:**
+    ```
+    StandardDeviation[{1, 2, 3, 4, 5}]
+    ```
+    **Output:**
+    ```
+    Sqrt[5/2]
+    ```
+    """
+
+    def run(self, values):
+        return standard_deviation(
+            values, self.get_kernel().get_kext('numerical'))
+
+    def get_arguments(self):
+        return [
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code(
+            'StandardDeviation[{1, 2, 3, 4, 5}]'), sqrt(10) / 2)
+        test.assertEqual(
+            evaluation.evaluate_code('StandardDeviation[{1, 3, 5}]'), 2)
+        test.assertEqual(
+            evaluation.evaluate_code('StandardDeviation[{1., 3}]'), 2 ** .5)
+        test.assertEqual(evaluation.evaluate_code(
+            'StandardDeviation[{{1, 2}, {3, 2}}]'), [sqrt(2), 0])
@@ -0,0 +1,54 @@
+"""
+This file contains class definition for list statistics.
+"""
+from tsteno.atoms.module import Module, ModuleArg
+from tsteno.kernel.statistics import total
+
+
+class Total(Module):
+    """
+    Gives the sum of the elements of list (of its columns, for matrices).
+    ```
+    Total[list]
+    ```
+
+    Packed lists are added with one Numpy call, and ranges in O(1).
+
+    # Examples
+    **Input:**
+    ```
+    Total[{1, 2, 3, 4}]
+    ```
+    **Output:**
+    ```
+    10
+    ```
+    """
+
+    def run(self, values):
+        return total(values, self.get_kernel().get_kext('numerical'))
+
+    def get_arguments(self):
+        return [
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(evaluation.evaluate_code('Total[{1, 2, 3, 4}]'), 10)
+        test.assertEqual(evaluation.evaluate_code('Total[{}]'), 0)
+        test.assertEqual(
+            evaluation.evaluate_code('Total[{1, 2.5}]'), 3.5)
+        test.assertEqual(
+            str(evaluation.evaluate_code('Total[{a, b, 1/2}]')), 'a + b + 1/2')
+        test.assertEqual(
+            evaluation.evaluate_code('Total[{{1, 2}, {3, 4}}]'), [4, 6])
+
+        # Ranges aren't expanded
+        test.assertEqual(evaluation.evaluate_code('Total[Range[10^12]]'),
+                         10 ** 12 * (10 ** 12 + 1) // 2)
+
+        # Exact, without overflows
+        test.assertEqual(evaluation.evaluate_code(
+            'Total[{2^62, 2^62, 2^62}]'), 3 * 2 ** 62)
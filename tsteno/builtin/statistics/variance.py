@@ -0,0 +1,59 @@
+"""
+This file contains class definition for list statistics.
+"""
+import numpy as np
+from sympy import Rational
+from tsteno.atoms.module import Module, ModuleArg
+from tsteno.kernel.statistics import variance
+
+
+class Variance(Module):
+    """
+    Gives the unbiased variance of the elements of list (of its columns,
+    for matrices).
+    ```
+    Variance[list]
+    ```
+
+    Packed lists of numbers are read in blocks, so big (or memory-mapped)
+    lists aren't copied.
+
+    # Examples
+    **Input:**
+    ```
+    Variance[{1, 2, 3, 4}]
+    ```
+    **Output:**
+    ```
+    5/3
+    ```
+    """
+
+    def run(self, values):
+        return variance(values, self.get_kernel().get_kext('numerical'))
+
+    def get_arguments(self):
+        return [
+            ModuleArg()
+        ]
+
+    def run_test(self, test):
+        evaluation = self.get_kernel().get_kext('eval')
+
+        test.assertEqual(
+            evaluation.evaluate_code('Variance[{1, 2, 3, 4}]'), Rational(5, 3))
+        test.assertAlmostEqual(
+            evaluation.evaluate_code('Variance[{1., 2, 3, 4}]'), 5 / 3)
+        test.assertEqual(
+            evaluation.evaluate_code('Variance[Range[4]]'), Rational(5, 3))
+        test.assertEqual(
+            evaluation.evaluate_code('Variance[{1/2, 3/2}]'), Rational(1, 2))
+        test.assertEqual(
+            str(evaluation.evaluate_code('Expand[Variance[{a, b}]]')),
+            'a**2/2 - a*b + b**2/2')
+        test.assertRaises(Exception, evaluation.evaluate_code, 'Variance[{1}]')
+
+        # Blocks are combined without losing precision
+        test.assertAlmostEqual(
+            self.run(1e9 + np.arange(3e6)) / (3e6 * (3e6 + 1) / 12), 1,
+            places=12)
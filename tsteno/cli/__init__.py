@@ -1,4 +1,5 @@
 import click
+import numpy as np
 from sys import platform
 
 if platform == "linux" or platform == "linux2":
@@ -7,9 +8,12 @@ from sympy import mathematica_code as mcode
 from tsteno import VERSION, CODENAME, COPYRIGHT
 from tsteno.kernel.kernel import Kernel
 from tsteno.kernel.kexts.log import LogLevel
+from tsteno.kernel.kexts.numerical import NUMERICAL_MODES
 from tsteno.gui import init_gui
 from tsteno.notebook import Notebook
+from tsteno.atoms.association import Association
 from tsteno.atoms.rule import RuleSet
+from tsteno.atoms.sequence import Sequence
 
 
 @click.command()
@@ -19,17 +23,31 @@ from tsteno.atoms.rule import RuleSet
 @click.option('--launcher', '-l', is_flag=True, help='Launcher mode')
 @click.option('--input', '-i', 'input_', help="*.nb file for input")
 @click.option('--http-port', '-p', 'http_port', help='HTTP port', default=8000)
-def main(debug, cli, launcher, input_, http_port):
-    kernel_opts = {}
+@click.option('--numerical-mode', '-n', 'numerical_mode',
+              type=click.Choice(NUMERICAL_MODES), default=None,
+              help='Kernel-wide numerical mode')
+@click.option('--time-constraint', '-t', 'time_constraint', type=float,
+              default=None, help='Maximum seconds of each evaluation')
+@click.option('--memory-constraint', '-m', 'memory_constraint', type=int,
+              default=None, help='Maximum bytes allocated by each evaluation')
+def main(debug, cli, launcher, input_, http_port, numerical_mode,
+         time_constraint, memory_constraint):
+    kernel_opts = {'kext_extensions': {}}
     if debug:
-        kernel_opts = {
-            'kext_extensions': {
-                'log': {
-                    'log_level': LogLevel.DEBUG
-                }
-            }
+        kernel_opts['kext_extensions']['log'] = {
+            'log_level': LogLevel.DEBUG
         }
 
+    if numerical_mode is not None:
+        kernel_opts['kext_extensions']['numerical'] = {
+            'mode': numerical_mode
+        }
+
+    kernel_opts['kext_extensions']['eval'] = {
+        'time_constraint': time_constraint,
+        'memory_constraint': memory_constraint
+    }
+
     kernel = Kernel(options=kernel_opts)
     evaluation = kernel.get_kext('eval')
 
@@ -55,7 +73,10 @@ k = 0
 
 
 def parse_to_print(to_print):
-    if isinstance(to_print, RuleSet):
+    if isinstance(to_print, (Sequence, np.ndarray)):
+        to_print = to_print.tolist()
+
+    if isinstance(to_print, (RuleSet, Association)):
         return str(to_print)
     elif isinstance(to_print, list):
         out = '{'
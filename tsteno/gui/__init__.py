@@ -10,7 +10,9 @@ from sympy import mathematica_code as mcode
 from tsteno.notebook import Notebook
 from tsteno.atoms.plot import Plot, PlotArray
 from tsteno.atoms.manipulate import Manipulate
+from tsteno.atoms.association import Association
 from tsteno.atoms.rule import RuleSet
+from tsteno.atoms.sequence import Sequence
 
 evaluation = None
 output = None
@@ -108,7 +110,10 @@ def prepropcess_output(eval_result, output_result):
 
 def parse_output(to_print):
 
-    if isinstance(to_print, RuleSet):
+    if isinstance(to_print, (Sequence, numpy.ndarray)):
+        to_print = to_print.tolist()
+
+    if isinstance(to_print, (RuleSet, Association)):
         return str(to_print)
     elif isinstance(to_print, list):
         out = '{'
@@ -0,0 +1,158 @@
+"""
+Resource constraints for evaluations (time and memory budgets).
+
+Constraints are enforced in two ways:
+
+- Cooperative checkpoints, every evaluated node checks active constraints.
+- A watchdog timer (`SIGALRM`), so long running calls that never evaluate a
+node (a big `Simplify`, `Integrate`...) are interrupted too. Watchdog is only
+available on Unix, when evaluating from main thread.
+"""
+import time
+import signal
+import threading
+import tracemalloc
+from sympy import Symbol
+
+ABORTED = Symbol('$Aborted')
+""" Result of an aborted evaluation """
+
+WATCHDOG_INTERVAL = 0.02
+""" Seconds between watchdog checks """
+
+
+class ConstraintExceeded(BaseException):
+    """
+    Raised when an evaluation exceeds its constraint. It doesn't inherit from
+    `Exception`, so it can't be silenced by modules catching their errors.
+    """
+
+    def __init__(self, constraint, reason):
+        super().__init__(reason)
+        self.constraint = constraint
+
+
+class Constraint:
+    """
+    Represent time and/or memory budget of one evaluation.
+    """
+    __slots__ = ['time_constraint', 'memory_constraint', 'deadline',
+                 'memory_base']
+
+    def __init__(self, time_constraint=None, memory_constraint=None):
+        """
+        Parameters:
+            - **time_constraint** - Maximum seconds (optional).
+            - **memory_constraint** - Maximum allocated bytes (optional).
+        """
+        self.time_constraint = time_constraint
+        self.memory_constraint = memory_constraint
+
+        self.deadline = None
+        if time_constraint is not None:
+            self.deadline = time.monotonic() + time_constraint
+
+        self.memory_base = None
+        if memory_constraint is not None:
+            self.memory_base = tracemalloc.get_traced_memory()[0]
+
+    def check(self):
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise ConstraintExceeded(
+                self, 'Time constraint of {} seconds exceeded'.format(
+                    self.time_constraint))
+
+        if self.memory_base is not None and \
+                tracemalloc.get_traced_memory()[0] - self.memory_base > \
+                self.memory_constraint:
+            raise ConstraintExceeded(
+                self, 'Memory constraint of {} bytes exceeded'.format(
+                    self.memory_constraint))
+
+
+class ConstraintStack:
+    """
+    Active constraints of an evaluation kext, constraints can be nested.
+    """
+    __slots__ = ['constraints', 'previous_handler', 'watchdog', 'tracing',
+                 'protected_code']
+
+    def __init__(self):
+        self.constraints = []
+        self.previous_handler = None
+        self.watchdog = False
+        self.tracing = False
+
+        self.protected_code = set()
+        """ Code where watchdog can't interrupt (constraint bookkeeping) """
+
+        for function in (self.push, self.pop, self.start_watchdog,
+                         self.stop_watchdog):
+            self.protect(function)
+
+    def __bool__(self):
+        return len(self.constraints) > 0
+
+    def check(self):
+        for constraint in self.constraints:
+            constraint.check()
+
+    def protect(self, function):
+        """
+        Don't let watchdog interrupt given function (only its own code, not
+        the functions it calls). Functions that push and pop constraints
+        must be protected, otherwise a constraint could be exceeded while
+        it's being popped.
+        """
+        self.protected_code.add(function.__code__)
+
+    def push(self, constraint):
+        if constraint.memory_constraint is not None and \
+                not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.tracing = True
+            constraint.memory_base = tracemalloc.get_traced_memory()[0]
+
+        if not self.constraints:
+            self.start_watchdog()
+
+        self.constraints.append(constraint)
+
+    def pop(self, constraint):
+        self.constraints.remove(constraint)
+
+        if not self.constraints:
+            self.stop_watchdog()
+
+        if self.tracing and not any(
+            item.memory_constraint is not None for item in self.constraints
+        ):
+            tracemalloc.stop()
+            self.tracing = False
+
+    def start_watchdog(self):
+        if not hasattr(signal, 'setitimer') or \
+                threading.current_thread() is not threading.main_thread():
+            return
+
+        self.previous_handler = signal.signal(
+            signal.SIGALRM, self.watchdog_handler)
+        self.watchdog = True
+        signal.setitimer(
+            signal.ITIMER_REAL, WATCHDOG_INTERVAL, WATCHDOG_INTERVAL)
+
+    def stop_watchdog(self):
+        if not self.watchdog:
+            return
+
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, self.previous_handler or signal.SIG_DFL)
+        self.previous_handler = None
+        self.watchdog = False
+
+    def watchdog_handler(self, signum, frame):
+        if frame is not None and frame.f_code in self.protected_code:
+            # Next tick will check again.
+            return
+
+        self.check()
@@ -0,0 +1,413 @@
+"""
+Pattern definitions of user functions (down values).
+
+A user function can have many definitions, `f[0] = 1; f[n_] := n f[n - 1]`,
+and each call uses the most specific one that matches its arguments.
+Definitions are indexed by number of arguments and literal arguments, so
+calls don't scan all of them:
+
+| Definition                       | Index                         | Lookup  |
+|----------------------------------|-------------------------------|---------|
+| Only literals, `f[0, 1]`         | Arity and all arguments       | O(1)    |
+| Literal first, `f[0, n_]`        | Arity and first argument      | Bucket  |
+| Pattern first, `f[n_, 0]`        | Arity                         | Bucket  |
+
+Definitions in a bucket are ordered by number of literal arguments and
+repeated patterns (most specific first, `f[x_, x_]` before `f[x_, y_]`),
+then by definition order. Literal arguments are compared by structural key.
+
+Results can be memoized in two ways:
+
+- Definitions made while evaluating, `f[n_] := f[n] = ...`, are literal
+definitions, so next calls with the same arguments find them in O(1).
+- Memoized functions (`Memoize[f]`) remember their last results by
+arguments, in a table of bounded size (least recently used are dropped).
+"""
+from collections import OrderedDict
+from tsteno.atoms.hashing import structural_key
+from tsteno.atoms.module import Module, ModuleArg, ARG_FLAG_ALL_NEXT
+from tsteno.kernel.replacement import Rules, replace
+from tsteno.language.ast import IdentifierToken
+
+
+class Pattern:
+    """
+    Pattern argument in definition signatures. Patterns are numbered by
+    first appearance of their name, so `f[x_, x_]` and `f[x_, y_]` are
+    different definitions, and `f[x_]` and `f[y_]` are the same one.
+    """
+    __slots__ = ('index', )
+
+    def __init__(self, index):
+        self.index = index
+
+    def __eq__(self, other):
+        return isinstance(other, Pattern) and self.index == other.index
+
+    def __hash__(self):
+        return hash((Pattern, self.index))
+
+
+class DownValue:
+    """
+    One definition of a user function, `f[0, n_] := value`.
+    """
+    __slots__ = ('signature', 'parameters', 'literals', 'specificity', 'value',
+                 'delayed')
+
+    def __init__(self, signature, parameters, value, delayed):
+        """
+        Parameters:
+            - **signature** - Tuple with key of each literal argument, and
+            `Pattern` for patterns.
+            - **parameters** - List of pattern `(position, name)`, blanks
+            (`_`) have no name.
+            - **value** - Value, or function evaluated on each call if
+            delayed.
+            - **delayed** - Whether definition was made with `:=`.
+        """
+        self.signature = signature
+        self.parameters = parameters
+        self.literals = [
+            (position, key) for position, key in enumerate(signature)
+            if not isinstance(key, Pattern)
+        ]
+        self.specificity = len(signature) - len(set(
+            key for key in signature if isinstance(key, Pattern)))
+        """ Number of constrained arguments, literals or repeated patterns """
+        self.value = value
+        self.delayed = delayed
+
+    def match(self, values, keys):
+        """
+        Return:
+            - Dictionary with values of named patterns, or None if
+            definition doesn't match values.
+        """
+        for position, key in self.literals:
+            if keys[position] != key:
+                return None
+
+        bindings = {}
+        for position, name in self.parameters:
+            if not name:
+                continue
+
+            if name in bindings and \
+                    structural_key(bindings[name]) != keys[position]:
+                # Repeated pattern, `f[x_, x_]`
+                return None
+
+            bindings[name] = values[position]
+
+        return bindings
+
+    def is_pure(self, is_pure_expression):
+        """
+        Check if evaluating definition has no side effects.
+
+        Parameters:
+            - **is_pure_expression** - Function that checks a parsed node.
+        """
+        if isinstance(self.value, Module):
+            functions = (getattr(self.value, 'local_variables', None),
+                         getattr(self.value, 'function', None))
+        elif self.delayed:
+            functions = (self.value, )
+        else:
+            # Value is replaced, not evaluated
+            return True
+
+        return all(
+            hasattr(function, 'node') and is_pure_expression(function.node)
+            for function in functions)
+
+    def evaluate(self, values, bindings, context):
+        if isinstance(self.value, Module):
+            # `f[x_] = Module[...]`, module binds its parameters
+            return self.call(context, {}, lambda: self.value.apply(
+                [values[position] for position, _ in self.parameters],
+                context))
+
+        if self.delayed:
+            return self.call(context, bindings, lambda: self.evaluate_body(
+                context))
+
+        if bindings:
+            return replace(self.value, Rules(bindings.items()))
+
+        return self.value
+
+    def evaluate_body(self, context):
+        result = self.value(context)
+
+        if hasattr(result, 'set_param_mapping'):
+            # `f[x_] := Module[...]`, module body is evaluated on each call
+            result.set_param_mapping([])
+            result = result.apply([], context)
+
+        return result
+
+    @staticmethod
+    def call(context, bindings, function):
+        """
+        Run function in a new local frame with given variables. Caller
+        variables are restored afterwards, so recursive calls don't
+        overwrite them. Only given variables are local, other assignments
+        go to the global store.
+        """
+        variables = context.user_variables
+        modules = context.user_modules
+        local = context.get_local_context()
+        function_frame = context.function_frame
+
+        context.user_variables = bindings
+        context.user_modules = {}
+        context.set_local_context(True)
+        context.function_frame = True
+
+        try:
+            return function()
+        finally:
+            context.set_local_context(local)
+            context.function_frame = function_frame
+            context.user_variables = variables
+            context.user_modules = modules
+
+
+class Definition(Module):
+    """
+    All definitions of a user function.
+    """
+    __slots__ = ('name', 'literal_values', 'first_values', 'pattern_values',
+                 'memo', 'memo_size')
+
+    def __init__(self, kernel, name):
+        """
+        Parameters:
+            - **kernel** - Represent Tungsteno kernel.
+            - **name** - Function name.
+        """
+        super().__init__(kernel)
+        self.name = name
+
+        self.literal_values = {}
+        """ Definitions with only literals, by arity and keys """
+
+        self.first_values = {}
+        """ Definitions with literal first argument, by arity and key """
+
+        self.pattern_values = {}
+        """ Definitions with pattern first argument, by arity """
+
+        self.memo = None
+        """ Results by argument keys, if function is memoized """
+
+        self.memo_size = None
+        """ Maximum number of memoized results (None if unbounded) """
+
+    def memoize(self, size=None):
+        """
+        Remember results of next calls, up to size results.
+        """
+        self.memo = OrderedDict()
+        self.memo_size = size
+
+    def add(self, arguments, value, context, delayed):
+        """
+        Add a definition, replacing the one with the same arguments if any.
+
+        Parameters:
+            - **arguments** - Left side arguments, as given to `Set`.
+        """
+        signature, parameters = self.get_signature(arguments, context)
+
+        if isinstance(value, Module):
+            value.set_param_mapping([
+                arguments[position] for position, _ in parameters])
+
+        down_value = DownValue(signature, parameters, value, delayed)
+
+        if not parameters:
+            self.literal_values[(len(signature), signature)] = down_value
+            if self.memo:
+                self.memo.pop(signature, None)
+            return
+
+        if self.memo:
+            self.memo.clear()
+
+        self.add_pattern_value(down_value)
+
+    def get_signature(self, arguments, context):
+        """
+        Return:
+            - Tuple with the signature of the left side arguments (patterns
+            and structural keys), and the list of positions and names of
+            the named patterns.
+        """
+        evaluation = self.get_kernel().get_kext('eval')
+        signature = []
+        parameters = []
+        patterns = {}
+
+        for position, argument in enumerate(arguments):
+            if isinstance(argument, IdentifierToken):
+                name = argument.get_value()
+                if name.endswith('_'):
+                    name = name[:-1]
+                    # Blanks (`_`) are always different patterns
+                    pattern = name or position
+                    if pattern not in patterns:
+                        patterns[pattern] = len(patterns)
+                    signature.append(Pattern(patterns[pattern]))
+                    parameters.append((position, name))
+                    continue
+
+                argument = evaluation.get_variable_definition(name, context)
+
+            signature.append(structural_key(argument))
+
+        return tuple(signature), parameters
+
+    def add_pattern_value(self, down_value):
+        """
+        Add a definition with patterns, keeping its bucket sorted by
+        specificity.
+        """
+        signature = down_value.signature
+
+        if not isinstance(signature[0], Pattern):
+            bucket = self.first_values.setdefault(
+                (len(signature), signature[0]), [])
+        else:
+            bucket = self.pattern_values.setdefault(len(signature), [])
+
+        for index, other in enumerate(bucket):
+            if other.signature == signature:
+                bucket[index] = down_value
+                return
+
+        index = len(bucket)
+        while index > 0 and \
+                bucket[index - 1].specificity < down_value.specificity:
+            index -= 1
+        bucket.insert(index, down_value)
+
+    def find(self, values, keys):
+        """
+        Parameters:
+            - **keys** - Structural keys of values.
+
+        Return:
+            - Tuple with most specific matching definition and values of
+            its patterns, or (None, None) if no definition matches.
+        """
+        arity = len(values)
+
+        down_value = self.literal_values.get((arity, keys))
+        if down_value is not None:
+            return down_value, {}
+
+        if arity:
+            for down_value in self.first_values.get((arity, keys[0]), ()):
+                bindings = down_value.match(values, keys)
+                if bindings is not None:
+                    return down_value, bindings
+
+        for down_value in self.pattern_values.get(arity, ()):
+            bindings = down_value.match(values, keys)
+            if bindings is not None:
+                return down_value, bindings
+
+        return None, None
+
+    def is_pure(self, is_pure_expression):
+        """
+        Check if all definitions have no side effects.
+        """
+        down_values = list(self.literal_values.values())
+        for bucket in self.first_values.values():
+            down_values.extend(bucket)
+        for bucket in self.pattern_values.values():
+            down_values.extend(bucket)
+
+        return all(down_value.is_pure(is_pure_expression)
+                   for down_value in down_values)
+
+    def eval(self, arguments, context):
+        return self.apply(self.parse_arguments(arguments, context), context)
+
+    def apply(self, values, context):
+        values = list(values)
+        keys = tuple(structural_key(value) for value in values)
+
+        memo = self.memo
+        if memo is not None and keys in memo:
+            memo.move_to_end(keys)
+            return memo[keys]
+
+        down_value, bindings = self.find(values, keys)
+
+        if down_value is None:
+            # No definition matches, call stays symbolic
+            evaluation = self.get_kernel().get_kext('eval')
+            return evaluation.builtin_modules['Unknown'].proxy(
+                self.name, values).run(*values)
+
+        result = down_value.evaluate(values, bindings, context)
+
+        if memo is not None and self.memo is memo:
+            memo[keys] = result
+            if self.memo_size is not None and len(memo) > self.memo_size:
+                memo.popitem(last=False)
+
+        return result
+
+    def get_arguments(self):
+        return [ModuleArg(ARG_FLAG_ALL_NEXT)]
+
+    def __repr__(self):
+        return self.name
+
+
+def define_variable(evaluation, name, value, context):
+    if context.is_local_variable(name):
+        context.set_user_variable(name, value)
+    else:
+        evaluation.set_global_user_variable(name, value)
+
+
+def get_definition(evaluation, name, context):
+    """
+    Return:
+        - Definitions of user function with given name, created if it
+        doesn't exist. Functions already defined globally stay global, so
+        definitions made while evaluating them (`f[n_] := f[n] = ...`) are
+        kept. In function frames new functions are global too.
+    """
+    if context.get_local_context() and (
+            name in context.user_modules or
+            not (context.function_frame or name in evaluation.user_modules)):
+        modules = context.user_modules
+    else:
+        modules = evaluation.user_modules
+
+    definition = modules.get(name)
+    if not isinstance(definition, Definition):
+        definition = Definition(evaluation.get_kernel(), name)
+        modules[name] = definition
+
+    return definition
+
+
+def define_function(evaluation, pattern, value, context, delayed=False):
+    """
+    Add a definition to a user function, `f[n_] = value`.
+
+    Parameters:
+        - **pattern** - Left side, with function name (`head`) and
+        arguments (`childrens`).
+    """
+    definition = get_definition(evaluation, pattern.head, context)
+    definition.add(pattern.childrens, value, context, delayed)
@@ -0,0 +1,205 @@
+"""
+Data files for `Import` and `Export`.
+
+Numeric data never goes through the Tungsteno tokenizer, it's read and
+written with Numpy as packed arrays:
+
+| Format     | Import                                   | Export                |
+|------------|------------------------------------------|-----------------------|
+| NPY        | Memory-mapped packed array               | Packed array          |
+| CSV, TSV   | Packed array if all fields are numbers,  | Written in chunks of  |
+|            | parsed in chunks. List of rows (numbers  | rows                  |
+|            | and strings) otherwise                   |                       |
+
+Memory-mapped arrays are read lazily from disk, so importing a big NPY file
+is O(1) and only the accessed parts are loaded.
+"""
+import csv
+import io
+import os
+import numpy as np
+from sympy import mathematica_code as mcode
+from tsteno.kernel.packed import PACKED_KINDS, is_list, pack
+
+READ_CHUNK_SIZE = 2 ** 24
+""" Bytes of text parsed at once when importing tables """
+
+WRITE_CHUNK_ROWS = 2 ** 14
+""" Rows formatted at once when exporting tables """
+
+FORMATS = {
+    '.csv': 'CSV',
+    '.tsv': 'TSV',
+    '.npy': 'NPY',
+}
+""" Formats by file extension """
+
+DELIMITERS = {
+    'CSV': ',',
+    'TSV': '\t',
+}
+""" Field delimiters of table formats """
+
+FLOAT_CHARACTERS = frozenset(b'.eEiInN')
+""" Characters that only appear in floating point numbers (1.5, 1e3, inf) """
+
+
+def get_format(path, file_format, name):
+    """
+    Return:
+        - Format name, given or deduced from path extension.
+    """
+    if file_format is None:
+        extension = os.path.splitext(path)[1].lower()
+        file_format = FORMATS.get(extension)
+    else:
+        file_format = str(file_format).upper()
+
+    if file_format not in FORMATS.values():
+        raise Exception('{}: unknown format of `{}`, use one of {}'.format(
+            name, path, ', '.join(sorted(FORMATS.values()))))
+
+    return file_format
+
+
+def read(path, file_format):
+    if file_format == 'NPY':
+        return read_npy(path)
+
+    return read_table(path, DELIMITERS[file_format])
+
+
+def write(path, value, file_format):
+    if file_format == 'NPY':
+        write_npy(path, value)
+    else:
+        write_table(path, value, DELIMITERS[file_format])
+
+
+def read_npy(path):
+    array = np.load(path, mmap_mode='r', allow_pickle=False)
+
+    if array.dtype.kind not in PACKED_KINDS:
+        # Strings can't be packed
+        return array.tolist()
+
+    return array
+
+
+def write_npy(path, value):
+    array = value if isinstance(value, np.ndarray) else pack(value)
+
+    if array is None or array.dtype.kind not in PACKED_KINDS:
+        raise Exception('Export: NPY files only contain rectangular arrays '
+                        'of numbers')
+
+    np.save(path, array, allow_pickle=False)
+
+
+def read_table(path, delimiter):
+    array = read_numeric_table(path, delimiter)
+    if array is not None:
+        return array
+
+    with open(path, newline='') as file:
+        return [
+            [to_number(field) for field in row]
+            for row in csv.reader(file, delimiter=delimiter)
+        ]
+
+
+def read_numeric_table(path, delimiter):
+    """
+    Parse a table of numbers in chunks of whole lines.
+
+    Return:
+        - Packed array, or None if some field isn't a number or rows have
+        different lengths.
+    """
+    chunks = []
+    columns = None
+
+    with open(path, 'rb') as file:
+        rest = b''
+
+        while True:
+            data = file.read(READ_CHUNK_SIZE)
+            if data:
+                data = rest + data
+                end = data.rfind(b'\n') + 1
+                chunk, rest = data[:end], data[end:]
+            else:
+                chunk, rest = rest, b''
+
+            if chunk.strip():
+                array = parse_numeric_chunk(chunk, delimiter)
+                if array is None or (
+                        columns is not None and array.shape[1] != columns):
+                    return None
+
+                columns = array.shape[1]
+                chunks.append(array)
+
+            if not data:
+                break
+
+    if not chunks:
+        return None
+
+    return chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+
+
+def parse_numeric_chunk(chunk, delimiter):
+    dtype = np.float64 if FLOAT_CHARACTERS.intersection(chunk) else np.int64
+
+    try:
+        return np.loadtxt(
+            io.StringIO(chunk.decode()), delimiter=delimiter, dtype=dtype,
+            ndmin=2, comments=None)
+    except (ValueError, OverflowError, UnicodeDecodeError):
+        return None
+
+
+def write_table(path, value, delimiter):
+    array = value if isinstance(value, np.ndarray) else pack(value)
+
+    if array is not None and array.ndim <= 2 and array.dtype.kind in 'biuf':
+        if array.ndim < 2:
+            # Lists are written as a column
+            array = array.reshape(-1, 1)
+        if array.dtype.kind == 'b':
+            array = array.astype(int)
+
+        with open(path, 'w') as file:
+            for start in range(0, len(array), WRITE_CHUNK_ROWS):
+                rows = array[start:start + WRITE_CHUNK_ROWS].tolist()
+                file.write(''.join(
+                    delimiter.join(map(repr, row)) + '\n' for row in rows))
+        return
+
+    if not is_list(value):
+        value = [value]
+
+    with open(path, 'w', newline='') as file:
+        writer = csv.writer(file, delimiter=delimiter, lineterminator='\n')
+        for row in value:
+            if not is_list(row):
+                row = [row]
+            writer.writerow([to_field(item) for item in row])
+
+
+def to_number(field):
+    for number_type in (int, float):
+        try:
+            return number_type(field)
+        except ValueError:
+            pass
+
+    return field
+
+
+def to_field(value):
+    if isinstance(value, (str, int, float)):
+        return value
+
+    return str(mcode(value))
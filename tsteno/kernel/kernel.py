@@ -1,17 +1,35 @@
 """ Kernel represent basic evaluation environment """
+import copy
 import uuid
 import datetime
 from .kexts.log import Log, LogLevel
 from .kexts.evaluation import Evaluation
 from .kexts.output import Output
+from .kexts.optimizer import Optimizer
+from .kexts.numerical import Numerical, NUMERICAL_MODE_SYMBOLIC
+from .kexts.random import Random
 
 KERNEL_DEFAULT_OPTIONS = {
     'kext_extensions': {
         'numerical': {
             'precission': 10,
+            'mode': NUMERICAL_MODE_SYMBOLIC,
+        },
+        'random': {
+            'seed': None,
         },
         'log': {
             'log_level': LogLevel.NORMAL
+        },
+        'eval': {
+            'time_constraint': None,
+            'memory_constraint': None,
+            'recursion_limit': 20000,
+        },
+        'optimizer': {
+            'constant_folding': True,
+            'hash_consing': True,
+            'loop_invariant_hoisting': True,
         }
     }
 }
@@ -26,7 +44,7 @@ class Kernel:
     def __init__(self, parent=None, options={}):
         if parent is None:
             self.options = self.__calculate_options(
-                KERNEL_DEFAULT_OPTIONS, options
+                copy.deepcopy(KERNEL_DEFAULT_OPTIONS), options
             )
         else:
             self.options = options
@@ -68,7 +86,10 @@ class Kernel:
         )
 
         self.register_kext('log', Log, log_kext=log_kext)
+        self.register_kext('numerical', Numerical)
+        self.register_kext('random', Random)
         self.register_kext('eval', Evaluation)
+        self.register_kext('optimizer', Optimizer)
         self.register_kext('output', Output)
 
         log_kext.write(
@@ -77,7 +98,7 @@ class Kernel:
         )
 
     def create_subkernel(self):
-        return Kernel(self)
+        return Kernel(self, self.options)
 
     def get_kext(self, kext_name):
         if kext_name in self.kext_definitions:
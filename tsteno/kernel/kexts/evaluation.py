@@ -2,12 +2,16 @@ import os
 import sys
 import time
 
-from sympy import Symbol
+from sympy import Symbol, Function
 from .log import LogLevel
 from .kext_base import KextBase
+from .numerical import NATIVE_NUMBER_TYPES
 from tsteno.language.ast import Node
 from tsteno.language.ast import IdentifierToken
 from tsteno.atoms.module import Module
+from tsteno.kernel.constraint import (
+    ABORTED, Constraint, ConstraintExceeded, ConstraintStack
+)
 from tsteno.language.parser import Parser
 from tsteno.language.tokenizer import Tokenizer
 import tsteno.language.token_list as token_list
@@ -32,7 +36,7 @@ CONTROL_FLOW_STATUS_R_STACK = 1
 class Context:
     __slot__ = ['__control_flow__', '__is_global__',
                 '__local_context__', 'user_variables', 'user_modules',
-                '__last_result__', '__no_var_mode__'
+                '__last_result__', '__no_var_mode__', 'function_frame'
                 ]
 
     def __init__(self):
@@ -72,6 +76,16 @@ class Context:
     def get_local_context(self):
         return self.__local_context__
 
+    def is_local_variable(self, variable):
+        """
+        Return:
+            - True if assignments to variable stay in local context. In
+            function bodies only bound variables (patterns, iterators) are
+            local, in modules every assigned variable is.
+        """
+        return self.__local_context__ and (
+            not self.function_frame or variable in self.user_variables)
+
     def __reset__(self):
         self.__is_global__ = True
         self.__control_flow__ = CONTROL_FLOW_STATUS_P_STACK
@@ -80,6 +94,7 @@ class Context:
         self.user_modules = {}
         self.__last_result__ = None
         self.__no_var_mode__ = 0
+        self.function_frame = False
 
 
 class Evaluation(KextBase):
@@ -88,7 +103,9 @@ class Evaluation(KextBase):
         'builtin_variables', 'builtin_modules',
         'user_modules', 'user_variables', 'user_modules',
         'tokenizer', 'parser', 'auto_symbols',
-        'expr_pointer', 'expr_pointer_context'
+        'expr_pointer', 'expr_pointer_context',
+        'constraints', 'time_constraint', 'memory_constraint',
+        'recursion_limit'
     ]
 
     def __init__(self, kernel):
@@ -116,6 +133,24 @@ class Evaluation(KextBase):
         self.expr_pointer = []
         self.expr_pointer_context = []
 
+        self.constraints = ConstraintStack()
+        self.constraints.protect(self.constrained)
+
+        self.time_constraint = self.get_kernel().get_option_value(
+            'kext_extensions', 'eval', 'time_constraint')
+        """ Default time budget of each evaluation (seconds) """
+
+        self.memory_constraint = self.get_kernel().get_option_value(
+            'kext_extensions', 'eval', 'memory_constraint')
+        """ Default memory budget of each evaluation (bytes) """
+
+        self.recursion_limit = self.get_kernel().get_option_value(
+            'kext_extensions', 'eval', 'recursion_limit')
+        """
+        Python recursion limit while evaluating, each call of a recursive
+        user function takes a few dozens of Python frames
+        """
+
         if self.get_kernel().parent is None:
             self.__bootstrap(log_kext)
 
@@ -164,11 +199,32 @@ class Evaluation(KextBase):
         nodes = self.parser.get_nodes(tokens)
         context = Context()
 
-        nodes = list(nodes)
-        for node in nodes:
-            context.set_last_result(self.evaluate_node(node, context))
-            if context.get_control_flow() == CONTROL_FLOW_STATUS_R_STACK:
-                return context.get_last_result()
+        optimizer = self.get_kernel().get_kext('optimizer')
+
+        def evaluate_nodes():
+            # Folded constants are computed within the evaluation budget
+            for node in optimizer.optimize(list(nodes)):
+                context.set_last_result(self.evaluate_node(node, context))
+                if context.get_control_flow() == CONTROL_FLOW_STATUS_R_STACK:
+                    return True
+            return False
+
+        def aborted(err):
+            log_kext.write(
+                'Evaluation aborted: {}'.format(err), LogLevel.ERROR)
+            context.set_last_result(ABORTED)
+            return False
+
+        if self.time_constraint is None and self.memory_constraint is None:
+            returned = self.with_recursion_limit(evaluate_nodes)
+        else:
+            returned = self.with_recursion_limit(lambda: self.constrained(
+                evaluate_nodes, self.time_constraint, self.memory_constraint,
+                aborted
+            ))
+
+        if returned:
+            return context.get_last_result()
 
         if tokens[-1].get_type() != token_list.TOKEN_CLOSE_EXPR:
             output = self.get_kernel().get_kext('output')
@@ -176,14 +232,95 @@ class Evaluation(KextBase):
 
         return context.get_last_result()
 
+    def with_recursion_limit(self, fn):
+        """
+        Run fn with the recursion limit option, previous Python recursion
+        limit is restored afterwards.
+        """
+        previous_limit = sys.getrecursionlimit()
+        if self.recursion_limit is None or \
+                self.recursion_limit <= previous_limit:
+            return fn()
+
+        sys.setrecursionlimit(self.recursion_limit)
+        try:
+            return fn()
+        finally:
+            sys.setrecursionlimit(previous_limit)
+
     def evaluate_node(self, node, context):
+        if self.constraints:
+            self.constraints.check()
+
         if isinstance(node, Node):
+            if type(node) is not Node:
+                # Nodes created by optimizer know how to evaluate themselves.
+                return node.evaluate(self, context)
+            if context.get_no_var_mode() != 0 and \
+                    node.head not in self.builtin_modules:
+                # Assignment target, `f[n_] = ...` defines f, doesn't call it
+                return self.builtin_modules['Unknown'].proxy(
+                    node.head, node.childrens).eval(node.childrens, context)
             return self.run_function(node.head, node.childrens, context)
         elif isinstance(node, IdentifierToken) and \
                 context.get_no_var_mode() == 0:
             return self.get_variable_definition(node.get_value(), context)
         return node
 
+    def evaluate_condition(self, node, context):
+        """
+        Evaluate a condition (`If`, `While`...) to a boolean. Comparisons of
+        native numbers are evaluated directly, without building a
+        `Comparator`.
+        """
+        if type(node) is Node and len(node.childrens) == 2:
+            definition = self.builtin_modules.get(node.head)
+            operator = getattr(definition, 'operator', None)
+
+            if operator is not None and \
+                    node.head not in self.user_modules and not (
+                        context.get_local_context() and
+                        node.head in context.user_modules):
+                left = self.evaluate_node(node.childrens[0], context)
+                right = self.evaluate_node(node.childrens[1], context)
+
+                if type(left) in NATIVE_NUMBER_TYPES and \
+                        type(right) in NATIVE_NUMBER_TYPES:
+                    return bool(operator(left, right))
+
+                return bool(definition.run(left, right))
+
+        return bool(self.evaluate_node(node, context))
+
+    def constrained(self, fn, time_constraint=None, memory_constraint=None,
+                    on_exceeded=None):
+        """
+        Run fn with a time and/or memory budget.
+
+        Parameters:
+            - **fn** - Function to evaluate.
+            - **time_constraint** - Maximum seconds (optional).
+            - **memory_constraint** - Maximum allocated bytes (optional).
+            - **on_exceeded** - Called with exceeded exception when budget is
+            exceeded, if not given exception is raised.
+
+        Return:
+            - fn result, or on_exceeded result if budget was exceeded.
+        """
+        constraint = Constraint(time_constraint, memory_constraint)
+        self.constraints.push(constraint)
+
+        try:
+            return fn()
+        except ConstraintExceeded as err:
+            if err.constraint is not constraint or on_exceeded is None:
+                raise
+            exceeded = err
+        finally:
+            self.constraints.pop(constraint)
+
+        return on_exceeded(exceeded)
+
     def get_autocompletion(self, text, state):
         if len(text) < 2:
             return None
@@ -225,6 +362,35 @@ class Evaluation(KextBase):
             fname, arguments, context)
         return module_definition.eval(arguments, context)
 
+    def bind_function(self, function, context):
+        """
+        Resolve a function once, so it can be applied many times to evaluated
+        values without parsing arguments again.
+
+        Parameters:
+            - **function** - Module name (symbol) or module.
+            - **context** - Represent local context to execute function.
+
+        Return:
+            - Python function that receives evaluated values.
+        """
+        if isinstance(function, Module):
+            definition = function
+        else:
+            name = str(function)
+
+            if not (context.get_local_context() and
+                    name in context.user_modules) and \
+                    name not in self.user_modules and \
+                    name not in self.builtin_modules:
+                # Unknown functions stay symbolic, f[f[x]]...
+                head = Function(name)
+                return lambda *values: head(*values)
+
+            definition = self.get_module_definition(name, [], context)
+
+        return lambda *values: definition.apply(values, context)
+
     def clear(self):
         self.user_modules.clear()
         self.user_variables.clear()
@@ -0,0 +1,286 @@
+"""
+Numerical kext, decides how numeric values are represented while evaluating.
+
+Three modes are available:
+
+| Mode        | Representation                                          |
+|-------------|---------------------------------------------------------|
+| `symbolic`  | Exact Sympy values (default, nothing is approximated)   |
+| `machine`   | Native Python floats, evaluated with `math`/Numpy       |
+| `arbitrary` | Sympy floats (mpmath) with the configured `precission`  |
+"""
+import operator
+import numpy as np
+import sympy as sp
+from functools import reduce
+from tsteno.atoms.sequence import Sequence
+from .log import LogLevel
+from .kext_base import KextBase
+
+NUMERICAL_MODE_SYMBOLIC = 'symbolic'
+""" Keep exact values (rationals, symbolic constants...) """
+
+NUMERICAL_MODE_MACHINE = 'machine'
+""" Approximate every numeric value to a native machine float """
+
+NUMERICAL_MODE_ARBITRARY = 'arbitrary'
+""" Approximate every numeric value with `precission` digits """
+
+NUMERICAL_MODES = (
+    NUMERICAL_MODE_SYMBOLIC, NUMERICAL_MODE_MACHINE, NUMERICAL_MODE_ARBITRARY
+)
+
+NATIVE_NUMBER_TYPES = frozenset((
+    int, float, complex,
+    np.int8, np.int16, np.int32, np.int64,
+    np.uint8, np.uint16, np.uint32, np.uint64,
+    np.float32, np.float64, np.complex64, np.complex128
+))
+""" Types that can be operated without Sympy (booleans are excluded) """
+
+NATIVE_INTEGER_TYPES = (int, np.integer)
+""" Native integer types, used to keep exact integer arithmetic """
+
+
+class Numerical(KextBase):
+    __slots__ = ['mode', 'precission', 'native_arithmetic']
+
+    def __init__(self, kernel):
+        super().__init__(kernel)
+
+        log_kext = self.get_kernel().get_kext('log')
+        log_kext.write(
+            'Starting numerical interface for eval kext...', LogLevel.DEBUG)
+
+        self.mode = None
+        self.precission = None
+
+        self.set_mode(
+            kernel.get_option_value('kext_extensions', 'numerical', 'mode'),
+            kernel.get_option_value(
+                'kext_extensions', 'numerical', 'precission')
+        )
+
+    def set_mode(self, mode, precission=None):
+        """
+        Change kernel-wide numerical mode.
+
+        Parameters:
+            - **mode** - One of `NUMERICAL_MODES`.
+            - **precission** - Digits used by arbitrary mode (optional).
+        """
+        if mode not in NUMERICAL_MODES:
+            raise Exception("Unknown numerical mode `{}`".format(mode))
+
+        self.mode = mode
+        self.native_arithmetic = mode != NUMERICAL_MODE_ARBITRARY
+        """ Native numbers can be operated directly in current mode """
+
+        if precission is not None:
+            self.precission = int(precission)
+
+    def get_mode(self):
+        return self.mode
+
+    def is_machine(self):
+        return self.mode == NUMERICAL_MODE_MACHINE
+
+    def is_symbolic(self):
+        return self.mode == NUMERICAL_MODE_SYMBOLIC
+
+    def numericize(self, value):
+        """
+        Convert given value to current numerical mode representation.
+        """
+        if self.mode == NUMERICAL_MODE_SYMBOLIC:
+            return value
+        elif self.mode == NUMERICAL_MODE_MACHINE:
+            return self.to_machine(value)
+
+        return self.to_precission(value, self.precission)
+
+    def numericize_all(self, values):
+        """
+        Same as `numericize`, but for a sequence of values. In symbolic mode
+        given sequence is returned untouched.
+        """
+        if self.mode == NUMERICAL_MODE_SYMBOLIC:
+            return values
+
+        return [self.numericize(value) for value in values]
+
+    def add(self, values):
+        """
+        Sum all values. Native numbers are added directly, the remaining
+        symbolic values are built with a single `sympy.Add` call.
+        """
+        native, symbolic = self.split_natives(
+            self.numericize_all(values), operator.add, 0
+        )
+
+        if not symbolic:
+            return self.demote(native)
+
+        if native != 0:
+            symbolic.append(native)
+
+        return self.build_symbolic(sp.Add, operator.add, symbolic, 0)
+
+    def multiply(self, values):
+        """
+        Multiply all values. Native numbers are multiplied directly, the
+        remaining symbolic values are built with a single `sympy.Mul` call.
+        """
+        native, symbolic = self.split_natives(
+            self.numericize_all(values), operator.mul, 1
+        )
+
+        if not symbolic:
+            return self.demote(native)
+
+        if not (type(native) is int and native == 1):
+            # Inexact coefficients (1.0 x) are kept
+            symbolic.insert(0, native)
+
+        return self.build_symbolic(sp.Mul, operator.mul, symbolic, 1)
+
+    def split_natives(self, values, op, identity):
+        """
+        Reduce numbers (native or Sympy numbers) with given operator, and
+        collect the rest.
+
+        Return:
+            - Tuple with reduced number and list of non-numeric values.
+        """
+        native = identity
+        symbolic = []
+
+        for value in values:
+            if type(value) in NATIVE_NUMBER_TYPES or \
+                    isinstance(value, sp.Number):
+                native = op(native, value)
+            else:
+                symbolic.append(value)
+
+        return native, symbolic
+
+    def build_symbolic(self, sympy_cls, op, values, identity):
+        """
+        Build one Sympy node from all values, if any value isn't a Sympy
+        expression (lists, proxies...) values are reduced with Python
+        operator. Packed arrays are reduced as the lists they stand for.
+        """
+        for value in values:
+            if not isinstance(value, (sp.Expr, int, float, complex)):
+                return reduce(op, [
+                    value.tolist() if isinstance(value, np.ndarray) else value
+                    for value in values
+                ], identity)
+
+        return self.demote(sympy_cls(*values))
+
+    @staticmethod
+    def demote(value):
+        """
+        Convert Sympy integers to native integers, so next operations can
+        use native arithmetic.
+        """
+        if isinstance(value, sp.Integer):
+            return int(value)
+
+        return value
+
+    def to_machine(self, value):
+        """
+        Approximate value using machine precision.
+
+        Return:
+            - Python `int`, `float` or `complex` for numeric values.
+            - Sympy expression with numeric constants evaluated otherwise.
+        """
+        value_type = type(value)
+
+        if value_type is int or value_type is float or value_type is complex:
+            return value
+
+        if isinstance(value, (list, Sequence)):
+            return [self.to_machine(item) for item in value]
+
+        if not isinstance(value, sp.Basic):
+            return value
+
+        if value.is_Integer:
+            return int(value)
+
+        if not value.is_number:
+            return value.evalf()
+
+        result = complex(value)
+
+        if result != result:
+            # Complex infinity and other undefined values stay symbolic.
+            return value
+
+        if result.imag == 0:
+            return result.real
+
+        return result
+
+    def to_precission(self, value, digits):
+        """
+        Approximate value using `digits` digits of precission.
+        """
+        if isinstance(value, (list, Sequence)):
+            return [self.to_precission(item, digits) for item in value]
+
+        if isinstance(value, (int, float, np.integer, np.floating)) and \
+                not isinstance(value, bool):
+            return sp.Float(value, digits)
+
+        if isinstance(value, complex):
+            return sp.N(sp.sympify(value), digits)
+
+        if isinstance(value, sp.Basic):
+            return sp.N(value, digits)
+
+        return value
+
+    def elemental(self, x, machine_fn, complex_fn, symbolic_fn):
+        """
+        Evaluate an elemental function.
+
+        Machine numbers (or any number in machine mode) are computed with
+        native `math`/`cmath` functions, everything else is delegated to
+        Sympy and numericized afterwards.
+
+        Parameters:
+            - **x** - Function argument.
+            - **machine_fn** - Real machine implementation (`math.*`).
+            - **complex_fn** - Complex machine implementation (`cmath.*`).
+            - **symbolic_fn** - Symbolic implementation (`sympy.*`).
+        """
+        if self.mode == NUMERICAL_MODE_MACHINE:
+            x = self.to_machine(x)
+
+            if type(x) is int:
+                x = float(x)
+
+        x_type = type(x)
+
+        if x_type is float:
+            try:
+                return machine_fn(x)
+            except ValueError:
+                x_type = complex
+            except OverflowError:
+                return float('inf')
+
+        if x_type is complex:
+            try:
+                result = complex_fn(x)
+            except (ValueError, OverflowError):
+                pass
+            else:
+                return result.real if result.imag == 0 else result
+
+        return self.numericize(symbolic_fn(self.numericize(x)))
@@ -0,0 +1,530 @@
+"""
+Optimizer kext, transforms parsed nodes before they're evaluated.
+
+Nodes go through a pipeline of stages, each stage can be enabled or
+disabled through kernel options (`kext_extensions.optimizer`):
+
+| Option                    | Stage                                        |
+|---------------------------|----------------------------------------------|
+| `constant_folding`        | Evaluate constant subtrees only once         |
+| `hash_consing`            | Share structurally identical subtrees        |
+| `loop_invariant_hoisting` | Evaluate loop invariants once per loop run   |
+"""
+from .log import LogLevel
+from .kext_base import KextBase
+from tsteno.language.ast import Node, IdentifierToken
+
+PURE_MODULES = frozenset((
+    'Plus', 'Product', 'Minus', 'Div', 'Pow', 'ChangeSign', 'N',
+    'Sin', 'Cos', 'Tan', 'Exp', 'Log', 'Sqrt'
+))
+""" Modules without side effects, which only depend on their arguments """
+
+UNFOLDED_PURE_MODULES = frozenset((
+    'List', 'Module', 'Equal', 'NotEqual', 'GreaterThan', 'GreaterEqual',
+    'LessThan', 'LessEqual'
+))
+""" Modules without side effects that aren't folded (lists, comparators) """
+
+ASSIGNMENT_MODULES = {
+    'Set': 0,
+    'SetDelayed': 0,
+    'Increment': 0,
+    'PreIncrement': 0,
+    'AppendTo': 0,
+    'PrependTo': 0,
+    'AssociateTo': 0,
+    'KeyDropFrom': 0,
+    'Clear': None,
+}
+"""
+Modules that assign (or unbind) a variable, with the position of that
+variable (None if all arguments are variables)
+"""
+
+LOOP_MODULES = {
+    'Table': ((0,), 1),
+    'Plot': ((0,), 1),
+    'Plot3D': ((0,), 1),
+    'For': ((1, 2, 3), None),
+    'While': ((0, 1), None),
+    'Do': ((0,), 1),
+}
+"""
+Modules that evaluate some arguments repeatedly. Each one is described by
+the position of the repeated arguments, and the position of the first
+iterator specification (`{var, ...}`), if any.
+"""
+
+FOLD_MAX_EXPONENT = 4096
+""" Integer powers with bigger exponents are not folded """
+
+
+def rebuild(node, childrens):
+    """
+    Return:
+        - Given node if childrens didn't change, a new node otherwise.
+    """
+    for old, new in zip(node.childrens, childrens):
+        if old is not new:
+            return Node(node.head, *childrens)
+
+    return node
+
+
+class HoistedNode(Node):
+    """
+    Loop invariant subtree, it's evaluated once each time the enclosing loop
+    runs.
+    """
+    __slots__ = ('value', 'ready')
+
+    def __init__(self, head, *childrens):
+        super().__init__(head, *childrens)
+        self.value = None
+        self.ready = False
+
+    def evaluate(self, evaluation, context):
+        if not self.ready:
+            self.value = evaluation.run_function(
+                self.head, self.childrens, context)
+            self.ready = True
+
+        return self.value
+
+
+class LoopNode(Node):
+    """
+    Loop with hoisted invariants, invalidates them before running.
+    """
+    __slots__ = ('hoisted',)
+
+    def __init__(self, head, childrens, hoisted):
+        super().__init__(head, *childrens)
+        self.hoisted = hoisted
+
+    def evaluate(self, evaluation, context):
+        for hoisted in self.hoisted:
+            hoisted.ready = False
+
+        return evaluation.run_function(self.head, self.childrens, context)
+
+
+class OptimizerStage:
+    """
+    Super class for optimizer stages.
+    """
+    option_name = None
+    """ Kernel option used to enable this stage """
+
+    def __init__(self, optimizer):
+        self.optimizer = optimizer
+
+    def run(self, nodes):
+        """
+        Optimize a list of nodes (one evaluation unit). Should be
+        implemented by child class.
+        """
+        raise Exception("run function should be defined")
+
+
+class ConstantFolding(OptimizerStage):
+    """
+    Replace pure subtrees with constant arguments with their value.
+    """
+    option_name = 'constant_folding'
+
+    def run(self, nodes):
+        evaluation = self.optimizer.get_evaluation()
+        self.assigned = self.optimizer.collect_assigned(nodes)
+        self.constants = {
+            name for name in evaluation.builtin_variables
+            if name not in evaluation.user_variables and
+            name not in self.assigned
+        }
+
+        return [self.fold(node) for node in nodes]
+
+    def fold(self, node):
+        if isinstance(node, list):
+            return [self.fold(child) for child in node]
+
+        if not isinstance(node, Node):
+            return node
+
+        childrens = [self.fold(child) for child in node.childrens]
+        node = rebuild(node, childrens)
+
+        if not self.optimizer.is_pure(node.head) or \
+                node.head in self.assigned:
+            return node
+
+        for child in childrens:
+            if not self.is_constant(child):
+                return node
+
+        if not self.is_foldable(node):
+            return node
+
+        value = self.optimizer.evaluate_constant(node, node)
+
+        # Python lists are compound statements for the evaluator.
+        if isinstance(value, list):
+            return node
+
+        return value
+
+    def is_constant(self, node):
+        if isinstance(node, IdentifierToken):
+            return node.get_value() in self.constants
+
+        return not isinstance(node, (Node, list))
+
+    def is_foldable(self, node):
+        if node.head == 'N' and len(node.childrens) > 1:
+            # Arbitrary precision values can take any time to compute, and
+            # are only computed if they're used.
+            return False
+
+        if node.head != 'Pow' or len(node.childrens) != 2:
+            return True
+
+        exponent = node.childrens[1]
+
+        # Avoid computing huge integers that could never be used.
+        return not isinstance(exponent, int) or \
+            abs(exponent) <= FOLD_MAX_EXPONENT
+
+
+class HashConsing(OptimizerStage):
+    """
+    Share structurally identical subtrees, so they're stored only once.
+    """
+    option_name = 'hash_consing'
+
+    def run(self, nodes):
+        self.table = {}
+        nodes = [self.intern(node)[0] for node in nodes]
+        self.table = None
+
+        return nodes
+
+    def intern(self, node):
+        """
+        Return:
+            - Tuple with canonical node and its structural key.
+        """
+        if isinstance(node, list):
+            interned = [self.intern(child) for child in node]
+            key = ('List', tuple(child_key for _, child_key in interned))
+            node = [child for child, _ in interned]
+        elif type(node) is Node:
+            interned = [self.intern(child) for child in node.childrens]
+            key = (
+                'Node', node.head,
+                tuple(child_key for _, child_key in interned)
+            )
+            node = Node(node.head, *[child for child, _ in interned])
+        elif isinstance(node, IdentifierToken):
+            key = ('Identifier', node.get_value())
+        else:
+            try:
+                key = ('Atom', type(node), hash(node), node)
+            except TypeError:
+                key = ('Unhashable', id(node))
+            return node, key
+
+        return self.table.setdefault(key, node), key
+
+
+class LoopInvariantHoisting(OptimizerStage):
+    """
+    Mark pure subtrees of loop bodies that don't depend on any variable
+    modified by the loop, they're evaluated once per loop run.
+    """
+    option_name = 'loop_invariant_hoisting'
+
+    def run(self, nodes):
+        return [self.hoist(node) for node in nodes]
+
+    def hoist(self, node):
+        if isinstance(node, list):
+            return [self.hoist(child) for child in node]
+
+        if type(node) is not Node:
+            return node
+
+        childrens = [self.hoist(child) for child in node.childrens]
+
+        if node.head not in LOOP_MODULES or \
+                not self.optimizer.is_builtin(node.head):
+            return rebuild(node, childrens)
+
+        return self.hoist_loop(node, childrens)
+
+    def hoist_loop(self, node, childrens):
+        """
+        Return:
+            - Loop node with the invariants of its repeated arguments
+            hoisted, or the rebuilt node if there are none.
+        """
+        repeated = [
+            position for position in LOOP_MODULES[node.head][0]
+            if position < len(childrens)
+        ]
+        variant = self.iterator_variables(node.head, childrens)
+
+        for position in repeated:
+            if not self.collect_variant(childrens[position], variant):
+                # Loop calls user defined code, nothing can be assumed.
+                return rebuild(node, childrens)
+
+        hoisted = []
+        for position in repeated:
+            childrens[position] = self.extract(
+                childrens[position], variant, hoisted)
+
+        if not hoisted:
+            return rebuild(node, childrens)
+
+        return LoopNode(node.head, childrens, hoisted)
+
+    def iterator_variables(self, head, childrens):
+        """
+        Return:
+            - Set with the names of the iterators of a loop module.
+        """
+        first_iterator = LOOP_MODULES[head][1]
+        if first_iterator is None:
+            return set()
+
+        return {
+            name for spec in childrens[first_iterator:]
+            for name in self.optimizer.iterator_names(spec)
+        }
+
+    def collect_variant(self, node, variant):
+        """
+        Collect variables modified inside node.
+
+        Return:
+            - False if node calls modules with unknown side effects.
+        """
+        if isinstance(node, list):
+            return all(self.collect_variant(child, variant) for child in node)
+
+        if not isinstance(node, Node):
+            return True
+
+        if not self.optimizer.is_builtin(node.head):
+            return False
+
+        if node.head in ASSIGNMENT_MODULES:
+            variant.update(self.optimizer.assignment_names(node))
+
+        if node.head in LOOP_MODULES:
+            variant.update(
+                self.iterator_variables(node.head, node.childrens))
+
+        return all(
+            self.collect_variant(child, variant) for child in node.childrens
+        )
+
+    def extract(self, node, variant, hoisted):
+        if isinstance(node, list):
+            return [self.extract(child, variant, hoisted) for child in node]
+
+        if type(node) is not Node:
+            return node
+
+        if self.is_invariant(node, variant):
+            hoisted_node = HoistedNode(node.head, *node.childrens)
+            hoisted.append(hoisted_node)
+            return hoisted_node
+
+        return rebuild(node, [
+            self.extract(child, variant, hoisted) for child in node.childrens
+        ])
+
+    def is_invariant(self, node, variant):
+        if isinstance(node, IdentifierToken):
+            return node.get_value() not in variant
+
+        if isinstance(node, list):
+            return False
+
+        if not isinstance(node, Node):
+            return True
+
+        if type(node) is not Node or not self.optimizer.is_pure(node.head):
+            return False
+
+        return all(
+            self.is_invariant(child, variant) for child in node.childrens
+        )
+
+
+class Optimizer(KextBase):
+    __slots__ = ['stages', 'enabled_stages']
+
+    def __init__(self, kernel):
+        super().__init__(kernel)
+
+        log_kext = self.get_kernel().get_kext('log')
+        log_kext.write(
+            'Starting optimizer interface for eval kext...', LogLevel.DEBUG)
+
+        self.stages = []
+        self.enabled_stages = {}
+
+        for stage_cls in (
+            ConstantFolding, HashConsing, LoopInvariantHoisting
+        ):
+            self.register_stage(stage_cls(self))
+
+    def register_stage(self, stage):
+        """
+        Append a new stage at the end of the pipeline.
+        """
+        self.stages.append(stage)
+        self.enabled_stages[stage.option_name] = self.get_kernel(
+        ).get_option_value(
+            'kext_extensions', 'optimizer', stage.option_name
+        )
+
+    def set_stage_enabled(self, option_name, enabled):
+        if option_name not in self.enabled_stages:
+            raise Exception(
+                "Optimizer stage `{}` doesn't exists".format(option_name))
+
+        self.enabled_stages[option_name] = enabled
+
+    def optimize(self, nodes):
+        """
+        Run all enabled stages over a list of nodes.
+        """
+        log_kext = self.get_kernel().get_kext('log')
+
+        for stage in self.stages:
+            if not self.enabled_stages[stage.option_name]:
+                continue
+
+            try:
+                nodes = stage.run(nodes)
+            except RecursionError:
+                log_kext.write(
+                    'Optimizer stage `{}` skipped, expression is too '
+                    'deep'.format(stage.option_name), LogLevel.DEBUG)
+
+        return nodes
+
+    def get_evaluation(self):
+        return self.get_kernel().get_kext('eval')
+
+    def is_builtin(self, module):
+        """
+        Check if module is a builtin module not redefined by user.
+        """
+        evaluation = self.get_evaluation()
+
+        return module in evaluation.builtin_modules and \
+            module not in evaluation.user_modules
+
+    def is_pure(self, module):
+        return module in PURE_MODULES and self.is_builtin(module)
+
+    def is_pure_expression(self, node):
+        """
+        Check if evaluating node has no side effects, it only calls pure
+        builtins (arithmetic, comparisons, lists...).
+        """
+        if isinstance(node, list):
+            return all(self.is_pure_expression(child) for child in node)
+
+        if not isinstance(node, Node):
+            return True
+
+        if not self.is_pure(node.head) and not (
+                node.head in UNFOLDED_PURE_MODULES and
+                self.is_builtin(node.head)):
+            return False
+
+        return all(self.is_pure_expression(child) for child in node.childrens)
+
+    def evaluate_constant(self, node, default):
+        """
+        Evaluate a constant node, default is returned if evaluation fails.
+        """
+        from .evaluation import Context
+
+        try:
+            return self.get_evaluation().evaluate_node(node, Context())
+        except Exception:
+            return default
+
+    def collect_assigned(self, nodes):
+        """
+        Return:
+            - Set of names (variables or modules) assigned in given nodes.
+        """
+        assigned = set()
+        pending = list(nodes)
+
+        while pending:
+            node = pending.pop()
+
+            if isinstance(node, list):
+                pending.extend(node)
+            elif isinstance(node, Node):
+                if node.head in ASSIGNMENT_MODULES:
+                    assigned.update(self.assignment_names(node))
+                pending.extend(node.childrens)
+
+        return assigned
+
+    def assignment_names(self, node):
+        """
+        Return:
+            - Names assigned by a call of an assignment module.
+        """
+        position = ASSIGNMENT_MODULES[node.head]
+        if position is None:
+            targets = node.childrens
+        else:
+            targets = node.childrens[position:position + 1]
+
+        names = set()
+        for target in targets:
+            names.update(self.assigned_names(target))
+        return names
+
+    def assigned_names(self, node):
+        """
+        Return:
+            - Names assigned by an assignment target (`x`, `{x, y}`,
+            `f[x_]`...).
+        """
+        if isinstance(node, IdentifierToken):
+            return {node.get_value()}
+
+        if isinstance(node, Node):
+            if node.head == 'List':
+                names = set()
+                for child in node.childrens:
+                    names.update(self.assigned_names(child))
+                return names
+            return {node.head}
+
+        return set()
+
+    def iterator_names(self, spec):
+        """
+        Return:
+            - Variable names bound by an iterator specification.
+        """
+        if isinstance(spec, Node) and spec.head == 'List' and \
+                spec.childrens and \
+                isinstance(spec.childrens[0], IdentifierToken):
+            return {spec.childrens[0].get_value()}
+
+        return set()
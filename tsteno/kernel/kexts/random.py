@@ -0,0 +1,72 @@
+"""
+Random kext, owns the pseudo-random generator used by random builtins.
+
+Numbers are drawn from a Numpy `Generator` (PCG64), a whole packed array per
+call. Generators are seeded from a `SeedSequence`, which spawns independent
+streams:
+
+| Stream of     | Seed                                                   |
+|---------------|--------------------------------------------------------|
+| Root kernel   | `seed` option (`SeedRandom`), or OS entropy if None    |
+| Sub-kernel    | Spawned from parent kernel sequence on creation        |
+| Worker        | Spawned with `spawn`                                   |
+
+Spawned streams only depend on the parent seed and on spawn order, so
+parallel simulations are reproducible and don't overlap.
+"""
+import numpy as np
+from .log import LogLevel
+from .kext_base import KextBase
+
+
+class Random(KextBase):
+    __slots__ = ['seed_sequence', 'generator']
+
+    def __init__(self, kernel):
+        super().__init__(kernel)
+
+        log_kext = self.get_kernel().get_kext('log')
+        log_kext.write(
+            'Starting random interface for eval kext...', LogLevel.DEBUG)
+
+        self.seed_sequence = None
+        self.generator = None
+
+        if kernel.parent is None:
+            self.seed(kernel.get_option_value(
+                'kext_extensions', 'random', 'seed'))
+        else:
+            self.set_seed_sequence(
+                kernel.parent.get_kext('random').spawn_seed_sequences(1)[0])
+
+    def seed(self, seed=None):
+        """
+        Restart generator from given seed (non negative integer), or from
+        OS entropy if seed is None.
+        """
+        if seed is not None and (int(seed) != seed or seed < 0):
+            raise Exception(
+                '`{}` is not a non negative integer seed'.format(seed))
+
+        self.set_seed_sequence(np.random.SeedSequence(
+            None if seed is None else int(seed)))
+
+    def set_seed_sequence(self, seed_sequence):
+        self.seed_sequence = seed_sequence
+        self.generator = np.random.Generator(np.random.PCG64(seed_sequence))
+
+    def spawn_seed_sequences(self, count):
+        return self.seed_sequence.spawn(count)
+
+    def spawn(self, count):
+        """
+        Return:
+            - List of count independent generators, for workers.
+        """
+        return [
+            np.random.Generator(np.random.PCG64(seed_sequence))
+            for seed_sequence in self.spawn_seed_sequences(count)
+        ]
+
+    def get_generator(self):
+        return self.generator
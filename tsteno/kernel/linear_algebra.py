@@ -0,0 +1,241 @@
+"""
+Linear algebra backends for matrix builtins.
+
+Matrices are nested lists while evaluating. Before operating them they are
+converted to one of two representations:
+
+| Input                              | Representation                     |
+|------------------------------------|------------------------------------|
+| Numbers, at least one inexact      | Contiguous Numpy array (LAPACK)    |
+| Exact numbers or symbolic entries  | Sympy `DomainMatrix`               |
+
+`DomainMatrix` operates on domain elements (integers, rationals,
+polynomials...) instead of generic Sympy expressions, so it's much faster
+than `sympy.Matrix` for exact input.
+"""
+import numpy as np
+import sympy as sp
+from sympy.polys.matrices import DomainMatrix
+from tsteno.atoms.sequence import Sequence
+from tsteno.kernel.kexts.numerical import Numerical
+
+INEXACT_TYPES = (float, complex, np.inexact, sp.Float)
+""" Entries that make a matrix numeric """
+
+
+def get_shape(value, name):
+    """
+    Return:
+        - Tuple `(rows, )` for vectors or `(rows, columns)` for matrices.
+    """
+    if isinstance(value, np.ndarray) and 1 <= value.ndim <= 2 and value.size:
+        return value.shape
+
+    if not isinstance(value, (list, Sequence)) or not value:
+        raise Exception('{}: `{}` is not a vector or matrix'.format(
+            name, value))
+
+    if not isinstance(value[0], list):
+        if any(isinstance(item, list) for item in value):
+            raise Exception('{}: `{}` is not a vector or matrix'.format(
+                name, value))
+        return (len(value), )
+
+    columns = len(value[0])
+    if columns == 0 or any(
+        not isinstance(row, list) or len(row) != columns or
+        any(isinstance(item, list) for item in row)
+        for row in value
+    ):
+        raise Exception('{}: `{}` is not a vector or matrix'.format(
+            name, value))
+
+    return (len(value), columns)
+
+
+def get_matrix_shape(value, name, square=False):
+    shape = get_shape(value, name)
+
+    if len(shape) != 2 or (square and shape[0] != shape[1]):
+        raise Exception('{}: `{}` is not a {}matrix'.format(
+            name, value, 'square ' if square else ''))
+
+    return shape
+
+
+def entries(value):
+    for item in value:
+        if isinstance(item, (list, np.ndarray)):
+            yield from item
+        else:
+            yield item
+
+
+def is_inexact(entry):
+    if isinstance(entry, INEXACT_TYPES):
+        return True
+
+    return isinstance(entry, sp.Expr) and entry.has(sp.Float)
+
+
+def is_number(entry):
+    if isinstance(entry, (int, float, complex, np.number)):
+        return not isinstance(entry, bool)
+
+    return isinstance(entry, sp.Expr) and entry.is_number
+
+
+def is_numeric(*values):
+    """
+    Return:
+        - True if given vectors/matrices can be operated with Numpy (all
+        entries are numbers, and at least one of them is inexact).
+    """
+    inexact = False
+
+    for value in values:
+        for entry in entries(value):
+            if not is_number(entry):
+                return False
+            inexact = inexact or is_inexact(entry)
+
+    return inexact
+
+
+def to_array(value):
+    """
+    Convert a numeric vector/matrix to a contiguous Numpy array.
+    """
+    try:
+        return np.array(value, dtype=float)
+    except TypeError:
+        return np.array(value, dtype=complex)
+
+
+def from_array(array):
+    """
+    Convert a Numpy array (or scalar) to native Python values.
+    """
+    if np.iscomplexobj(array) and not np.any(np.imag(array)):
+        array = np.real(array)
+
+    return array.tolist() if isinstance(array, np.ndarray) else array.item()
+
+
+def to_domain_matrix(value):
+    """
+    Convert an exact vector/matrix to a `DomainMatrix`, vectors are converted
+    to column matrices.
+    """
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+
+    rows = value if isinstance(value[0], list) else [[item] for item in value]
+
+    return DomainMatrix.from_list_sympy(
+        len(rows), len(rows[0]), rows, extension=True)
+
+
+def from_domain_element(domain, element):
+    return Numerical.demote(domain.to_sympy(element))
+
+
+def from_domain_matrix(matrix):
+    """
+    Convert a `DomainMatrix` to nested lists.
+    """
+    domain = matrix.domain
+
+    return [
+        [from_domain_element(domain, element) for element in row]
+        for row in matrix.to_list()
+    ]
+
+
+def sort_by_magnitude(values, key=lambda value: value):
+    """
+    Sort eigenvalues (or items with eigenvalues) by decreasing absolute
+    value, then by decreasing real and imaginary parts. Symbolic values are
+    kept at the end in their original order.
+    """
+    def magnitude(item):
+        value = key(item)
+        if is_number(value):
+            value = complex(value)
+            return (0, -abs(value), -value.real, -value.imag)
+        return (1, 0, 0, 0)
+
+    return sorted(values, key=magnitude)
+
+
+def magnitude_order(eigenvalues):
+    """
+    Same as `sort_by_magnitude`, for a Numpy array of eigenvalues.
+
+    Return:
+        - Array of indices that sort given eigenvalues.
+    """
+    return np.lexsort((
+        -np.imag(eigenvalues), -np.real(eigenvalues), -np.abs(eigenvalues)))
+
+
+def exact_eigenvalues(matrix):
+    """
+    Parameters:
+        - **matrix** - Square `DomainMatrix`.
+
+    Return:
+        - List of eigenvalues, repeated by their multiplicity.
+    """
+    domain = matrix.domain
+    variable = sp.Dummy('lambda')
+    polynomial = sp.Poly(
+        [domain.to_sympy(coefficient) for coefficient in matrix.charpoly()],
+        variable
+    )
+
+    roots = sp.roots(polynomial)
+    if sum(roots.values()) < polynomial.degree():
+        if polynomial.free_symbols - {variable}:
+            raise Exception(
+                'Eigenvalues: characteristic polynomial `{}` can\'t be '
+                'solved'.format(polynomial.as_expr()))
+        # Roots without radicals, represented with CRootOf.
+        return polynomial.all_roots()
+
+    eigenvalues = []
+    for root, multiplicity in roots.items():
+        eigenvalues.extend([Numerical.demote(root)] * multiplicity)
+
+    return eigenvalues
+
+
+def exact_eigenvectors(matrix):
+    """
+    Parameters:
+        - **matrix** - Square matrix (nested lists) with exact entries.
+
+    Return:
+        - List of eigenvectors, sorted as eigenvalues. Defective matrices are
+        padded with zero vectors.
+    """
+    size = len(matrix)
+    eigenvalues = sort_by_magnitude(
+        exact_eigenvalues(to_domain_matrix(matrix)))
+
+    eigenvectors = []
+    for eigenvalue in dict.fromkeys(eigenvalues):
+        shifted = to_domain_matrix([
+            [entry - eigenvalue if i == j else entry
+             for j, entry in enumerate(row)]
+            for i, row in enumerate(matrix)
+        ]).to_field()
+
+        vectors = from_domain_matrix(shifted.nullspace())
+        multiplicity = eigenvalues.count(eigenvalue)
+
+        eigenvectors.extend(vectors[:multiplicity])
+        eigenvectors.extend(
+            [[0] * size] * (multiplicity - min(multiplicity, len(vectors))))
+
+    return eigenvectors
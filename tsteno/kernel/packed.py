@@ -0,0 +1,185 @@
+"""
+Packed arrays for list builtins.
+
+Lists of numbers can be operated as contiguous Numpy arrays (packed arrays)
+instead of item by item:
+
+| Input                                 | Packed                          |
+|---------------------------------------|---------------------------------|
+| Numpy array of booleans or numbers    | As is                           |
+| List of native numbers (any depth)    | Converted once with Numpy       |
+| Sequence (range, persistent vector)   | Converted once with Numpy       |
+| List with symbols, exact expressions  | Not packed, operated item by    |
+| or ragged sublists                    | item                            |
+
+Elementwise comparisons of packed arrays give boolean masks, which are packed
+arrays too, so filtering builtins (`Select`, `Pick`, `Count`...) never leave
+Numpy for numeric data.
+"""
+import operator as op
+import numpy as np
+import sympy as sp
+from tsteno.atoms.arithmetic_sequence import ArithmeticSequence
+from tsteno.atoms.sequence import Sequence
+from tsteno.atoms.comparator import Comparator
+
+PACKED_KINDS = 'biufc'
+""" Numpy dtype kinds of packed arrays (booleans and numbers) """
+
+BOOLEAN_SYMBOLS = {sp.Symbol('True'): True, sp.Symbol('False'): False}
+""" Language booleans, evaluated as symbols """
+
+
+def is_list(value):
+    return isinstance(value, (list, np.ndarray, Sequence))
+
+
+def pack(value):
+    """
+    Return:
+        - Packed array with given list values, or None if list can't be
+        packed.
+    """
+    if isinstance(value, np.ndarray):
+        return value if value.dtype.kind in PACKED_KINDS else None
+
+    if isinstance(value, Sequence):
+        array = np.asarray(value)
+        return array if array.dtype.kind in PACKED_KINDS else None
+
+    if not isinstance(value, list) or not value:
+        return None
+
+    try:
+        array = np.asarray(value)
+    except (ValueError, TypeError):
+        # Ragged sublists
+        return None
+
+    return array if array.dtype.kind in PACKED_KINDS else None
+
+
+def pack_scalar(value):
+    """
+    Return:
+        - Native number (or boolean) that can be operated with packed arrays,
+        or None for symbolic values.
+    """
+    if isinstance(value, (bool, int, float, complex, np.number, np.bool_)):
+        return value
+
+    if isinstance(value, sp.Symbol):
+        return BOOLEAN_SYMBOLS.get(value)
+
+    if isinstance(value, sp.Integer):
+        return int(value)
+
+    if isinstance(value, sp.Expr) and value.is_number:
+        try:
+            return complex(value) if not value.is_real else float(value)
+        except TypeError:
+            return None
+
+    return None
+
+
+def elementwise(left, right, operator):
+    """
+    Compare packed arrays (or a packed array and a number) elementwise.
+
+    Return:
+        - Boolean mask, or None if operands aren't numeric lists.
+    """
+    if not is_list(left) and not is_list(right):
+        return None
+
+    left = pack(left) if is_list(left) else pack_scalar(left)
+    right = pack(right) if is_list(right) else pack_scalar(right)
+    if left is None or right is None:
+        return None
+
+    try:
+        return np.asarray(operator(left, right), dtype=bool)
+    except ValueError:
+        raise Exception('Lists `{}` and `{}` have incompatible shapes'.format(
+            left.tolist() if is_list(left) else left,
+            right.tolist() if is_list(right) else right))
+
+
+def compare(left, right, operator):
+    """
+    Return:
+        - Boolean if both values are lists and operator is (in)equality,
+        lists are compared as a whole.
+        - Boolean mask for numeric lists compared with a number, or ordered.
+        - `Comparator` otherwise.
+    """
+    if operator in (op.eq, op.ne) and is_list(left) and is_list(right):
+        return equal(left, right) == (operator is op.eq)
+
+    mask = elementwise(left, right, operator)
+
+    return Comparator(left, right, operator) if mask is None else mask
+
+
+def is_true(value):
+    """
+    Return:
+        - True if value is a true boolean (Python, Numpy, Sympy or language
+        boolean, or a comparison that holds). Undecidable values are false.
+    """
+    if isinstance(value, Comparator):
+        value = value.eval()
+
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+
+    if isinstance(value, sp.Symbol):
+        return BOOLEAN_SYMBOLS.get(value, False)
+
+    return value is sp.true
+
+
+def equal(item, value):
+    """
+    Return:
+        - True if item and value are equal, lists are compared item by item.
+    """
+    if is_list(item) or is_list(value):
+        return is_list(item) and is_list(value) and \
+            len(item) == len(value) and \
+            all(equal(a, b) for a, b in zip(item, value))
+
+    return bool(item == value)
+
+
+def to_mask(value, size, name):
+    """
+    Return:
+        - Boolean mask with given size from a list of booleans.
+    """
+    if not is_list(value) or len(value) != size:
+        raise Exception('{}: `{}` is not a selector with {} items'.format(
+            name, value, size))
+
+    if isinstance(value, np.ndarray) and value.dtype.kind == 'b':
+        return value
+
+    return np.fromiter((is_true(item) for item in value), bool, size)
+
+
+def select(values, mask):
+    """
+    Return:
+        - Values where mask is true, packed if values are packed.
+    """
+    if isinstance(values, np.ndarray):
+        return values[mask]
+
+    # Ranges are computed, instead of read item by item.
+    array = pack(values) if isinstance(values, ArithmeticSequence) else None
+    if array is not None:
+        return array[mask]
+
+    # Lists keep their items (exact integers aren't converted to floats).
+    return [values[index] for index in np.flatnonzero(mask)]
@@ -0,0 +1,224 @@
+"""
+Portfolio solver, races several strategies for the same problem.
+
+Every strategy runs in its own forked worker process, first valid result wins
+and remaining workers are killed. Winner strategy is remembered for similar
+problems (same key), and next time it gets a head start over the rest.
+
+Strategies always run in workers, so a killed strategy can't leave the kernel
+process in an inconsistent state. A portfolio can be given a time budget,
+workers still running when it's over are killed too.
+"""
+import time
+import multiprocessing
+from collections import OrderedDict
+from multiprocessing.connection import wait
+
+PORTFOLIO_CACHE_SIZE = 1024
+""" Maximum number of remembered winners """
+
+HEAD_START_BUDGET = 0.2
+""" Minimum seconds given to the first strategy before racing the rest """
+
+HEAD_START_FACTOR = 2
+""" Remembered winner head start, relative to its last winning time """
+
+
+class PortfolioFailed(Exception):
+    """
+    Raised when no strategy gives a valid result.
+    """
+
+    def __init__(self, results):
+        super().__init__('No strategy gave a valid result')
+        self.results = results
+        """ Invalid results by strategy name """
+
+
+def _run_worker(strategy, args, connection):
+    try:
+        result = (True, strategy(*args))
+    except Exception as err:
+        result = (False, repr(err))
+
+    try:
+        connection.send(result)
+    except Exception as err:
+        # Result can't be pickled.
+        connection.send((False, repr(err)))
+    finally:
+        connection.close()
+
+
+def get_deadline(timeout):
+    return None if timeout is None else time.monotonic() + timeout
+
+
+def remaining_time(deadline):
+    """
+    Return:
+        - Seconds left before deadline (zero once it's over), or None if
+        there's no deadline.
+    """
+    if deadline is None:
+        return None
+
+    return max(0, deadline - time.monotonic())
+
+
+class Portfolio:
+    """
+    Represent a set of interchangeable strategies.
+    """
+    __slots__ = ['strategies', 'is_valid', 'winners', 'cache_size']
+
+    def __init__(self, strategies, is_valid,
+                 cache_size=PORTFOLIO_CACHE_SIZE):
+        """
+        Parameters:
+            - **strategies** - Ordered dictionary of strategy name to function.
+            - **is_valid** - Function that checks a strategy result.
+            - **cache_size** - Maximum number of remembered winners.
+        """
+        self.strategies = strategies
+        self.is_valid = is_valid
+        self.winners = OrderedDict()
+        self.cache_size = cache_size
+
+    def can_race(self):
+        """
+        Return:
+            - True if workers can be forked on this platform.
+        """
+        return 'fork' in multiprocessing.get_all_start_methods()
+
+    def solve(self, key, args, head_start=HEAD_START_BUDGET, timeout=None):
+        """
+        Solve a problem.
+
+        Parameters:
+            - **key** - Hashable problem shape, used to remember winners.
+            - **args** - Arguments given to strategies.
+            - **head_start** - Minimum seconds given to the remembered winner
+            (or first strategy) before starting the rest of strategies.
+            - **timeout** - Maximum seconds spent racing strategies (None if
+            unbounded). Strategies run one by one aren't interrupted, they
+            aren't started once it's over.
+
+        Return:
+            - Tuple with winner strategy name and its result.
+        """
+        names = list(self.strategies.keys())
+        first, elapsed = self.winners.get(key, (names[0], 0))
+        names.remove(first)
+        names.insert(0, first)
+
+        start_time = time.monotonic()
+
+        if self.can_race():
+            winner, result = self.race(
+                names, args, max(head_start, HEAD_START_FACTOR * elapsed),
+                timeout)
+        else:
+            winner, result = self.run_sequential(names, args, timeout)
+
+        self.remember(key, winner, time.monotonic() - start_time)
+
+        return winner, result
+
+    def run_sequential(self, names, args, timeout=None):
+        """
+        Run given strategies one by one, used when workers can't be forked.
+
+        Return:
+            - Tuple with winner strategy name and its result.
+        """
+        results = {}
+        deadline = get_deadline(timeout)
+
+        for name in names:
+            if remaining_time(deadline) == 0:
+                break
+
+            try:
+                result = self.strategies[name](*args)
+            except Exception as err:
+                result = repr(err)
+            else:
+                if self.is_valid(result):
+                    return name, result
+
+            results[name] = result
+
+        raise PortfolioFailed(results)
+
+    def race(self, names, args, head_start=HEAD_START_BUDGET, timeout=None):
+        """
+        Run given strategies concurrently, first one starts `head_start`
+        seconds before the rest. All workers are killed after `timeout`
+        seconds (if given).
+
+        Return:
+            - Tuple with winner strategy name and its result.
+        """
+        fork_context = multiprocessing.get_context('fork')
+        workers = {}
+        results = {}
+        deadline = get_deadline(timeout)
+
+        def start(name):
+            reader, writer = fork_context.Pipe(duplex=False)
+            process = fork_context.Process(
+                target=_run_worker,
+                args=(self.strategies[name], args, writer),
+                daemon=True
+            )
+            process.start()
+            writer.close()
+            workers[reader] = (name, process)
+            return reader
+
+        try:
+            pending = [start(names[0])]
+            waiting = names[1:]
+
+            while (pending or waiting) and remaining_time(deadline) != 0:
+                wait_time = remaining_time(deadline)
+                if waiting and (wait_time is None or head_start < wait_time):
+                    wait_time = head_start
+                ready = wait(pending, wait_time) if pending else []
+
+                for reader in ready:
+                    pending.remove(reader)
+                    name = workers[reader][0]
+
+                    try:
+                        success, result = reader.recv()
+                    except EOFError:
+                        # Worker died without answering.
+                        success, result = False, None
+
+                    if success and self.is_valid(result):
+                        return name, result
+
+                    results[name] = result
+
+                # Head start is over (or first strategy failed), start the
+                # rest of strategies.
+                pending.extend(start(name) for name in waiting)
+                waiting = []
+        finally:
+            for reader, (name, process) in workers.items():
+                if process.is_alive():
+                    process.kill()
+                process.join()
+                reader.close()
+
+        raise PortfolioFailed(results)
+
+    def remember(self, key, name, elapsed):
+        self.winners[key] = (name, elapsed)
+        self.winners.move_to_end(key)
+
+        if len(self.winners) > self.cache_size:
+            self.winners.popitem(last=False)
@@ -0,0 +1,243 @@
+"""
+Rule replacement for `ReplaceAll` and `ReplaceRepeated`.
+
+Rules are converted once to a dictionary of Sympy changes, and all of them
+are applied in a single traversal of the expression (`xreplace`), so they
+are applied simultaneously: `{x, y} /. {x -> y, y -> x}` swaps x and y.
+Rules with compound left sides (`x + y -> z`) need Sympy `subs` to match
+sub-expressions, which is used only in that case.
+
+| Rules                                 | Applied as                      |
+|---------------------------------------|---------------------------------|
+| Rule or list of rules                 | One rule set                    |
+| List of rules with repeated variables | Alternatives, one result each   |
+| (`Solve` solutions)                   |                                 |
+| List of lists of rules                | Alternatives, one result each   |
+"""
+import numpy as np
+import sympy as sp
+from sympy.core.function import AppliedUndef
+from tsteno.atoms.hashing import structural_key
+from tsteno.atoms.interpolating_function import InterpolatingFunction
+from tsteno.atoms.rule import RuleSet
+from tsteno.atoms.sequence import Sequence
+
+NUMBER_TYPES = (int, float, np.integer, np.floating)
+""" Native numbers that rules with number left sides are applied to """
+
+MAX_ITERATIONS = 65536
+""" Maximum number of replacements made by `ReplaceRepeated` """
+
+
+class Rules:
+    """
+    Rule set prepared to be applied to expressions.
+    """
+    __slots__ = ('values', 'changes', 'functions', 'numbers',
+                 'simultaneous')
+
+    def __init__(self, items):
+        """
+        Parameters:
+            - **items** - Rules, as (original key, value) pairs
+            (`RuleSet.items`).
+        """
+        self.values = {}
+        self.changes = {}
+        self.functions = {}
+
+        self.numbers = {}
+        """ Values by (type, number), for native numbers and packed arrays """
+
+        for key, value in items:
+            name = str(key)
+            self.values[name] = value
+
+            if isinstance(value, InterpolatingFunction):
+                self.functions[name] = value
+                continue
+
+            if hasattr(value, 'get_sympy'):
+                value = value.get_sympy()
+            key = to_sympy_key(key)
+            self.changes[key] = value
+
+            if key.is_Integer or key.is_Float:
+                self.numbers[to_number_key(key)] = value
+
+        self.simultaneous = any(
+            isinstance(key, (sp.Add, sp.Mul, sp.Pow)) for key in self.changes)
+
+
+def to_sympy_key(key):
+    """
+    Return:
+        - Sympy expression matched by a rule key (original left side).
+    """
+    if hasattr(key, 'get_sympy'):
+        key = key.get_sympy()
+
+    if isinstance(key, sp.Basic):
+        return key
+
+    if isinstance(key, str) and key.isidentifier():
+        # Not sympified, `E` or `N` are variables here
+        return sp.Symbol(key)
+
+    return sp.sympify(key, strict=True)
+
+
+def to_number_key(number):
+    """
+    Return:
+        - Key of a native (or Sympy) integer or float, 1 and 1.0 are
+        different keys.
+    """
+    if isinstance(number, (int, np.integer, sp.Integer)):
+        return int, int(number)
+
+    return float, float(number)
+
+
+def to_alternatives(rules, name):
+    """
+    Return:
+        - Tuple with list of `Rules` to apply and whether they are
+        alternatives (a result is given for each one).
+    """
+    if isinstance(rules, RuleSet):
+        return [Rules(rules.items())], False
+
+    if isinstance(rules, Sequence):
+        rules = rules.tolist()
+
+    if isinstance(rules, list):
+        if all(isinstance(rule, RuleSet) for rule in rules):
+            merged = merge(rules)
+            if merged is not None:
+                return [Rules(merged)], False
+            return [Rules(rule.items()) for rule in rules], True
+
+        if all(isinstance(rule, (list, RuleSet)) for rule in rules):
+            alternatives = []
+            for rule in rules:
+                alternative, _ = to_alternatives(rule, name)
+                if len(alternative) != 1:
+                    break
+                alternatives.append(alternative[0])
+            else:
+                return alternatives, True
+
+    raise Exception('{}: `{}` is not a valid list of rules'.format(
+        name, rules))
+
+
+def merge(rule_sets):
+    """
+    Return:
+        - List with all rules, as (original key, value) pairs, or None if
+        some variable is repeated.
+    """
+    names = set()
+    merged = []
+
+    for rule_set in rule_sets:
+        for key in rule_set.rules_dict:
+            if key in names:
+                return None
+            names.add(key)
+        merged.extend(rule_set.items())
+
+    return merged
+
+
+def replace(expr, rules):
+    """
+    Apply rules to expr, in one traversal.
+    """
+    if isinstance(expr, np.ndarray) and not rules.numbers:
+        # Packed arrays only contain numbers
+        return expr
+
+    if isinstance(expr, (Sequence, np.ndarray)):
+        expr = expr.tolist()
+
+    if isinstance(expr, list):
+        return [replace(item, rules) for item in expr]
+
+    head = getattr(expr, 'head', None)
+    if head in rules.functions:
+        # Function call, `f[x] /. f -> InterpolatingFunction[...]`
+        return apply_function(
+            head, rules.functions[head], expr.get_sympy().args)
+
+    if hasattr(expr, 'get_sympy'):
+        expr = expr.get_sympy()
+
+    if isinstance(expr, sp.Symbol) and expr.name in rules.values:
+        return rules.values[expr.name]
+
+    if isinstance(expr, NUMBER_TYPES) and not isinstance(expr, bool):
+        return rules.numbers.get(to_number_key(expr), expr)
+
+    if not isinstance(expr, sp.Basic):
+        return expr
+
+    return replace_sympy(expr, rules)
+
+
+def replace_sympy(expr, rules):
+    """
+    Apply rules to a sympy expression, in one traversal.
+    """
+    if rules.functions:
+        expr = expr.replace(
+            lambda node: isinstance(node, AppliedUndef) and
+            node.func.__name__ in rules.functions,
+            lambda node: apply_function(
+                node.func.__name__, rules.functions[node.func.__name__],
+                node.args)
+        )
+
+    if not rules.changes:
+        return expr
+
+    if rules.simultaneous:
+        return expr.subs(rules.changes, simultaneous=True)
+
+    return expr.xreplace(rules.changes)
+
+
+def replace_repeated(expr, rules, name):
+    """
+    Apply rules to expr until it doesn't change. Visited expressions are
+    remembered by structural key, so cycles are detected as soon as an
+    expression repeats.
+    """
+    key = structural_key(expr)
+    visited = {key}
+
+    for _ in range(MAX_ITERATIONS):
+        expr = replace(expr, rules)
+        next_key = structural_key(expr)
+
+        if next_key == key:
+            return expr
+
+        if next_key in visited:
+            raise Exception(
+                '{}: rules are cyclic, `{}` was already visited'.format(
+                    name, expr))
+
+        visited.add(next_key)
+        key = next_key
+
+    raise Exception('{}: no fixed point after {} iterations'.format(
+        name, MAX_ITERATIONS))
+
+
+def apply_function(name, function, args):
+    if len(args) != 1 or not args[0].is_number:
+        return sp.Function(name)(*args)
+
+    return function(float(args[0]))
@@ -0,0 +1,110 @@
+"""
+Arguments and results of random builtins.
+
+Random builtins draw all the numbers of a call at once, from the kernel
+generator (`random` kext):
+
+| Call                                | Result                        |
+|-------------------------------------|-------------------------------|
+| No shape, `RandomReal[]`            | One native number             |
+| Length, `RandomReal[1, n]`          | Packed array with n numbers   |
+| Dimensions, `RandomReal[1, {n, m}]` | Packed array with given shape |
+
+Integers beyond the range of packed arrays (int64) are drawn one by one, as
+native integers in lists.
+"""
+import math
+import numpy as np
+import sympy as sp
+from tsteno.kernel.packed import is_list
+
+
+def to_real(value, name):
+    if isinstance(value, (int, float, np.integer, np.floating)) and \
+            not isinstance(value, bool):
+        return value
+
+    if isinstance(value, sp.Expr) and value.is_real:
+        return int(value) if value.is_Integer else float(value)
+
+    raise Exception('{}: `{}` is not a real number'.format(name, value))
+
+
+def to_integer(value, name):
+    value = to_real(value, name)
+
+    if int(value) != value:
+        raise Exception('{}: `{}` is not an integer'.format(name, value))
+
+    return int(value)
+
+
+def get_bounds(value, convert, name):
+    """
+    Return:
+        - Tuple `(min, max)` from `max` (min is zero) or `{min, max}`.
+    """
+    if is_list(value):
+        if len(value) != 2:
+            raise Exception('{}: `{}` is not a range {{min, max}}'.format(
+                name, value))
+        return convert(value[0], name), convert(value[1], name)
+
+    return 0, convert(value, name)
+
+
+def get_shape(value, name):
+    """
+    Return:
+        - Numpy size (None for one number) from a length or a list of
+        dimensions.
+    """
+    if value is None:
+        return None
+
+    dimensions = list(value) if is_list(value) else [value]
+    shape = tuple(to_integer(dimension, name) for dimension in dimensions)
+
+    if any(dimension < 0 for dimension in shape):
+        raise Exception('{}: `{}` is not a valid length'.format(name, value))
+
+    return shape
+
+
+def to_result(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def integers(generator, low, high, shape):
+    """
+    Return:
+        - Uniformly distributed integers between low and high (both
+        included), with given Numpy size.
+    """
+    limits = np.iinfo(np.int64)
+    if limits.min <= low and high <= limits.max:
+        return to_result(generator.integers(low, high, shape, endpoint=True))
+
+    size = 1 if shape is None else math.prod(shape)
+    values = [low + big_integer(generator, high - low) for _ in range(size)]
+
+    if shape is None:
+        return values[0]
+
+    return np.array(values, dtype=object).reshape(shape).tolist()
+
+
+def big_integer(generator, span):
+    """
+    Return:
+        - Uniformly distributed native integer between 0 and span, drawn by
+        rejection from random bits.
+    """
+    bits = span.bit_length()
+    size = (bits + 7) // 8
+
+    while True:
+        value = int.from_bytes(generator.bytes(size), 'little') >> \
+            (8 * size - bits)
+        if value <= span:
+            return value
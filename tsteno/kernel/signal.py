@@ -0,0 +1,180 @@
+"""
+Discrete Fourier transforms and convolutions for signal builtins.
+
+Lists are operated as packed arrays with `numpy.fft`, in O(n log n):
+
+| Operation          | Packed numbers                  | Other lists         |
+|--------------------|---------------------------------|---------------------|
+| Fourier transforms | FFT in any number of dimensions | Not supported       |
+| Convolutions       | Direct for short kernels, FFT   | Sums of products    |
+|                    | for kernels longer than         | (vectors)           |
+|                    | `DIRECT_CONVOLUTION_SIZE`       |                     |
+
+Convolutions of integers give exact integers: FFT results are rounded while
+they are exact in floating point, otherwise they are computed directly.
+"""
+import numpy as np
+from tsteno.atoms.arithmetic_sequence import ArithmeticSequence
+from tsteno.kernel.packed import is_list, pack
+
+DIRECT_CONVOLUTION_SIZE = 64
+""" Longest kernel convolved directly, longer ones use FFT """
+
+FFT_EXACT_LIMIT = 2 ** 52
+""" Integer convolutions below this bound are exact with FFT """
+
+
+def to_signal(values, name):
+    array = pack(values) if is_list(values) else None
+
+    if array is None or not array.size or array.dtype.kind == 'b':
+        raise Exception('{}: `{}` is not a non empty list of numbers'.format(
+            name, values))
+
+    return array
+
+
+def get_exponent(parameters, name):
+    """
+    Return:
+        - Tuple `(a, b)` of Fourier parameters, b must be 1 or -1.
+    """
+    if parameters is None:
+        return 0, 1
+
+    if not is_list(parameters) or len(parameters) != 2 or \
+            parameters[1] not in (1, -1):
+        raise Exception(
+            '{}: `{}` are not Fourier parameters {{a, 1}} or {{a, -1}}'.format(
+                name, parameters))
+
+    return float(parameters[0]), int(parameters[1])
+
+
+def fourier(values, parameters, inverse, name):
+    """
+    Return:
+        - Discrete Fourier transform with parameters {a, b}, for each
+        dimension of length n
+        `v[s] = n^((a - 1) / 2) Sum[u[r] Exp[2 Pi I b r s / n], {r, 0, n - 1}]`
+        (`n^((-1 - a) / 2)` and `-b` for the inverse transform).
+    """
+    array = to_signal(values, name)
+    a, b = get_exponent(parameters, name)
+
+    if inverse:
+        a, b = -a, -b
+
+    if b > 0:
+        result = np.fft.ifftn(array) * array.size
+    else:
+        result = np.fft.fftn(array)
+
+    scale = array.size ** ((a - 1) / 2)
+    if scale != 1:
+        result *= scale
+
+    return result
+
+
+def convolve(kernel, values, numerical, name):
+    """
+    Return:
+        - Convolution of kernel with values, without overhangs,
+        `v[s] = Sum[k[r] u[s + m - 1 - r], {r, 0, m - 1}]` for kernels of
+        length m (in each dimension).
+    """
+    if isinstance(values, ArithmeticSequence):
+        values = pack(values)
+
+    kernel_array = pack(kernel) if is_list(kernel) else None
+    array = pack(values) if is_list(values) else None
+
+    if kernel_array is None or array is None or \
+            kernel_array.dtype.kind == 'b' or array.dtype.kind == 'b':
+        return convolve_items(kernel, values, numerical, name)
+
+    if kernel_array.ndim != array.ndim or any(
+            k > n or k == 0 for k, n in zip(kernel_array.shape, array.shape)):
+        raise Exception(
+            '{}: kernel `{}` is longer than list `{}` or has other '
+            'depth'.format(name, kernel, values))
+
+    exact = kernel_array.dtype.kind in 'iu' and array.dtype.kind in 'iu'
+    if exact:
+        bound = max(int(np.abs(kernel_array).max()), 1) * \
+            max(int(np.abs(array).max()), 1) * kernel_array.size
+        if bound >= FFT_EXACT_LIMIT:
+            return convolve_direct(
+                kernel_array.astype(object), array.astype(object)).tolist()
+
+    if array.ndim == 1 and len(kernel_array) <= DIRECT_CONVOLUTION_SIZE:
+        return convolve_direct(kernel_array, array)
+
+    result = convolve_fft(kernel_array, array)
+    if exact:
+        return np.rint(result).astype(np.int64)
+
+    return result
+
+
+def convolve_direct(kernel, array):
+    return np.convolve(array, kernel, 'valid')
+
+
+def convolve_fft(kernel, array):
+    shape = tuple(n + k - 1 for n, k in zip(array.shape, kernel.shape))
+    axes = tuple(range(array.ndim))
+
+    if array.dtype.kind == 'c' or kernel.dtype.kind == 'c':
+        full = np.fft.ifftn(
+            np.fft.fftn(array, shape) * np.fft.fftn(kernel, shape), shape)
+    else:
+        full = np.fft.irfftn(
+            np.fft.rfftn(array, shape) * np.fft.rfftn(kernel, shape), shape,
+            axes)
+
+    return full[tuple(
+        slice(k - 1, n) for n, k in zip(array.shape, kernel.shape))]
+
+
+def convolve_items(kernel, values, numerical, name):
+    """
+    Convolve vectors with symbolic elements, item by item.
+    """
+    if not is_list(kernel) or not is_list(values) or \
+            any(is_list(item) for item in kernel) or \
+            any(is_list(item) for item in values):
+        raise Exception('{}: `{}` and `{}` are not vectors'.format(
+            name, kernel, values))
+
+    size = len(kernel)
+    if not 0 < size <= len(values):
+        raise Exception('{}: kernel `{}` is longer than list `{}`'.format(
+            name, kernel, values))
+
+    return [
+        numerical.add([
+            numerical.multiply([
+                kernel[size - 1 - position], values[start + position]])
+            for position in range(size)
+        ])
+        for start in range(len(values) - size + 1)
+    ]
+
+
+def reverse(kernel):
+    """
+    Return:
+        - Kernel reversed in all dimensions, correlations are convolutions
+        with reversed kernels.
+    """
+    array = pack(kernel) if is_list(kernel) else None
+    if array is not None:
+        return array[(slice(None, None, -1), ) * array.ndim]
+
+    if is_list(kernel):
+        return [reverse(item) if is_list(item) else item
+                for item in reversed(list(kernel))]
+
+    return kernel
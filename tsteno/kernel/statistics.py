@@ -0,0 +1,392 @@
+"""
+Descriptive statistics for list builtins.
+
+Lists are reduced in one of three ways, depending on how they are stored:
+
+| Input                                 | Reduction                       |
+|---------------------------------------|---------------------------------|
+| Range (`ArithmeticSequence`)          | Closed form, O(1)               |
+| Packed array                          | One Numpy call (exact integer   |
+|                                       | results), or blocks of          |
+|                                       | `STREAM_CHUNK_SIZE` items       |
+| List with symbols, exact expressions  | Sympy, item by item             |
+
+Reductions that need temporary arrays (sums of squares, deviations) read
+packed arrays in blocks, and variances combine blocks with the parallel
+Welford update, so memory-mapped data is never copied whole to memory.
+Matrices are reduced by columns.
+"""
+import numpy as np
+import sympy as sp
+from tsteno.atoms.arithmetic_sequence import ArithmeticSequence
+from tsteno.atoms.association import Association
+from tsteno.kernel.packed import is_list, pack
+
+STREAM_CHUNK_SIZE = 2 ** 20
+""" Items of packed arrays read at once by streamed reductions """
+
+INT64_LIMIT = 2 ** 63
+""" Sums of integers below this bound don't overflow Numpy int64 """
+
+
+def get_vector(values, name):
+    if isinstance(values, Association):
+        values = values.values()
+
+    if not is_list(values):
+        raise Exception('{}: `{}` is not a list'.format(name, values))
+
+    return values
+
+
+def reduce_list(values, reduction, name):
+    """
+    Apply reduction to a vector, or to each column of a matrix.
+
+    Parameters:
+        - **reduction** - Function of a vector, given as a range, a 1-D
+        packed array or a list of scalars.
+    """
+    values = get_vector(values, name)
+
+    if isinstance(values, ArithmeticSequence):
+        return reduction(values)
+
+    array = pack(values)
+    if array is not None:
+        if array.ndim == 1:
+            return reduction(array)
+        if array.ndim == 2:
+            return [reduction(array[:, column])
+                    for column in range(array.shape[1])]
+
+        raise Exception('{}: `{}` is not a vector or matrix'.format(
+            name, values))
+
+    rows = [is_list(item) for item in values]
+    if not any(rows):
+        return reduction(list(values))
+
+    if not all(rows) or len(set(len(item) for item in values)) != 1:
+        raise Exception('{}: `{}` is not a vector or matrix'.format(
+            name, values))
+
+    return [reduction(list(column)) for column in zip(*values)]
+
+
+def is_integer_array(vector):
+    return isinstance(vector, np.ndarray) and vector.dtype.kind in 'biu'
+
+
+def blocks(array):
+    for start in range(0, len(array), STREAM_CHUNK_SIZE):
+        yield array[start:start + STREAM_CHUNK_SIZE]
+
+
+def to_native(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def ratio(numerator, denominator):
+    """
+    Return:
+        - Exact quotient of integers (native if it's an integer), or
+        quotient of other values.
+    """
+    if isinstance(numerator, int) and isinstance(denominator, int):
+        if numerator % denominator == 0:
+            return numerator // denominator
+
+        return sp.Rational(numerator, denominator)
+
+    return numerator / denominator
+
+
+def integer_sum(array, power=1):
+    """
+    Return:
+        - Exact sum of items (or their powers) of an integer packed array,
+        as a native integer.
+    """
+    if not array.size:
+        return 0
+
+    bound = max(int(array.max()), -int(array.min())) ** power
+    dtype = np.int64 if bound * array.size < INT64_LIMIT else object
+
+    result = 0
+    for block in blocks(array):
+        result += int(np.sum(block.astype(dtype) ** power))
+
+    return result
+
+
+def streamed_moments(array):
+    """
+    Return:
+        - Tuple with mean and sum of squared deviations of a packed array,
+        combining blocks with the parallel Welford update.
+    """
+    count, mean, squares = 0, 0.0, 0.0
+
+    for block in blocks(array):
+        size = len(block)
+        block_mean = float(np.mean(block))
+        block_squares = float(np.sum(np.square(block - block_mean)))
+
+        delta = block_mean - mean
+        count += size
+        mean += delta * size / count
+        squares += block_squares + delta * delta * (count - size) * size / count
+
+    return mean, squares
+
+
+def total(values, numerical, name='Total'):
+    def reduction(vector):
+        if isinstance(vector, ArithmeticSequence):
+            length = len(vector)
+            return numerical.add([
+                numerical.multiply([length, vector.start]),
+                numerical.multiply([length * (length - 1) // 2, vector.step])
+            ])
+
+        if is_integer_array(vector):
+            return integer_sum(vector)
+
+        if isinstance(vector, np.ndarray):
+            return to_native(np.sum(vector))
+
+        return numerical.add(vector)
+
+    return reduce_list(values, reduction, name)
+
+
+def mean(values, numerical, name='Mean'):
+    def reduction(vector):
+        length = len(vector)
+        if not length:
+            raise Exception('{}: list is empty'.format(name))
+
+        if isinstance(vector, ArithmeticSequence):
+            return numerical.add([vector.start, numerical.multiply([
+                ratio(length - 1, 2), vector.step])])
+
+        if is_integer_array(vector):
+            return ratio(integer_sum(vector), length)
+
+        if isinstance(vector, np.ndarray):
+            return to_native(np.mean(vector))
+
+        return numerical.multiply([
+            numerical.add(vector), sp.Rational(1, length)])
+
+    return numerical.numericize(reduce_list(values, reduction, name))
+
+
+def variance(values, numerical, name='Variance'):
+    """
+    Return:
+        - Unbiased (sample) variance, values are assumed real.
+    """
+    def reduction(vector):
+        length = len(vector)
+        if length < 2:
+            raise Exception('{}: list has less than two items'.format(name))
+
+        if isinstance(vector, ArithmeticSequence):
+            return numerical.multiply([
+                ratio(length * (length + 1), 12), vector.step, vector.step])
+
+        if is_integer_array(vector):
+            first = integer_sum(vector)
+            second = integer_sum(vector, 2)
+            return ratio(
+                length * second - first * first, length * (length - 1))
+
+        if isinstance(vector, np.ndarray):
+            if vector.dtype.kind == 'c':
+                return to_native(np.var(vector, ddof=1))
+
+            return streamed_moments(vector)[1] / (length - 1)
+
+        average = numerical.multiply([
+            numerical.add(vector), sp.Rational(1, length)])
+        return numerical.multiply([numerical.add([
+            (item - average) ** 2 for item in vector
+        ]), sp.Rational(1, length - 1)])
+
+    return numerical.numericize(reduce_list(values, reduction, name))
+
+
+def standard_deviation(values, numerical, name='StandardDeviation'):
+    result = variance(values, numerical, name)
+
+    if isinstance(result, list):
+        return [square_root(item) for item in result]
+
+    return square_root(result)
+
+
+def square_root(value):
+    if isinstance(value, (float, complex)):
+        return to_native(np.sqrt(value))
+
+    result = sp.sqrt(value)
+    return int(result) if isinstance(result, sp.Integer) else result
+
+
+def median(values, numerical, name='Median'):
+    def reduction(vector):
+        length = len(vector)
+        if not length:
+            raise Exception('{}: list is empty'.format(name))
+
+        if isinstance(vector, ArithmeticSequence):
+            # Symmetric around its mean
+            return numerical.add([vector.start, numerical.multiply([
+                ratio(length - 1, 2), vector.step])])
+
+        middle = length // 2
+        if isinstance(vector, np.ndarray):
+            if not is_integer_array(vector):
+                return to_native(np.median(vector))
+
+            positions = [middle - 1, middle] if length % 2 == 0 else [middle]
+            items = np.partition(vector, positions)[positions]
+            return ratio(sum(int(item) for item in items), len(items))
+
+        items = sort_numbers(vector, name)
+        if length % 2:
+            return items[middle]
+
+        return numerical.multiply([
+            numerical.add([items[middle - 1], items[middle]]),
+            sp.Rational(1, 2)])
+
+    return numerical.numericize(reduce_list(values, reduction, name))
+
+
+def quantile(values, quantiles, numerical, name='Quantile'):
+    """
+    Return:
+        - Item at position `Ceiling[n q]` of sorted values (first item for
+        q = 0), for each quantile q.
+    """
+    single = not is_list(quantiles)
+    if single:
+        quantiles = [quantiles]
+
+    def get_position(length, value):
+        if not sp.S(value).is_number or not 0 <= value <= 1:
+            raise Exception('{}: `{}` is not a quantile between 0 and 1'.format(
+                name, value))
+
+        return max(int(sp.ceiling(length * sp.nsimplify(value))), 1) - 1
+
+    def reduction(vector):
+        length = len(vector)
+        if not length:
+            raise Exception('{}: list is empty'.format(name))
+
+        positions = [get_position(length, value) for value in quantiles]
+
+        if isinstance(vector, ArithmeticSequence):
+            if vector.step < 0:
+                positions = [length - 1 - position for position in positions]
+            items = [vector[position] for position in positions]
+        elif isinstance(vector, np.ndarray):
+            items = np.partition(vector, positions)[positions].tolist()
+        else:
+            items = sort_numbers(vector, name)
+            items = [items[position] for position in positions]
+
+        return items[0] if single else items
+
+    return reduce_list(values, reduction, name)
+
+
+def sort_numbers(values, name):
+    try:
+        return sorted(values)
+    except TypeError:
+        raise Exception('{}: `{}` is not a list of real numbers'.format(
+            name, values))
+
+
+def accumulate(values, numerical, name='Accumulate'):
+    """
+    Return:
+        - Running sums of values (of rows, for matrices).
+    """
+    values = get_vector(values, name)
+
+    array = pack(values)
+    if array is not None:
+        if array.dtype.kind in 'biu' and array.size:
+            bound = max(int(array.max()), -int(array.min()))
+            if bound * len(array) >= INT64_LIMIT:
+                return np.cumsum(array, axis=0, dtype=object).tolist()
+
+        return np.cumsum(array, axis=0)
+
+    results = []
+    current = None
+    for item in values:
+        if current is None:
+            current = item
+        elif is_list(item) and is_list(current) and len(item) == len(current):
+            current = [numerical.add([a, b]) for a, b in zip(current, item)]
+        elif is_list(item) or is_list(current):
+            raise Exception('{}: `{}` is not a vector or matrix'.format(
+                name, values))
+        else:
+            current = numerical.add([current, item])
+        results.append(current)
+
+    return results
+
+
+def extremum(arguments, largest):
+    """
+    Return:
+        - Largest (or smallest) item of all arguments, lists are flattened.
+    """
+    candidates = []
+    for argument in arguments:
+        collect_candidates(argument, largest, candidates)
+
+    if not candidates:
+        return -sp.oo if largest else sp.oo
+
+    try:
+        return max(candidates) if largest else min(candidates)
+    except TypeError:
+        # Symbolic values
+        result = (sp.Max if largest else sp.Min)(*candidates)
+        return int(result) if isinstance(result, sp.Integer) else result
+
+
+def collect_candidates(value, largest, candidates):
+    """
+    Append to candidates the items of value that can be the largest (or
+    smallest): ends of ranges, extremum of packed arrays, all other items.
+    """
+    if isinstance(value, Association):
+        value = value.values()
+
+    if isinstance(value, ArithmeticSequence):
+        if len(value):
+            candidates.extend((value[0], value[-1]))
+        return
+
+    if not is_list(value):
+        candidates.append(value)
+        return
+
+    array = pack(value)
+    if array is None or array.dtype.kind not in 'biuf':
+        for item in value:
+            collect_candidates(item, largest, candidates)
+    elif array.size:
+        candidates.append(to_native(array.max() if largest else array.min()))
@@ -0,0 +1,237 @@
+"""
+Summation backends for `Sum` and `NSum`.
+
+Sums are computed with the cheapest method that fits them:
+
+| Method        | Used for                                                  |
+|---------------|-----------------------------------------------------------|
+| Closed form   | Exact summands, Sympy `summation` with symbolic bounds    |
+| Direct        | Exact summands without closed form, few terms             |
+| Vectorized    | Numeric bounds, one lambdified Numpy reduction per chunk  |
+| Accelerated   | Infinite numeric sums, `mpmath.nsum` (Richardson, Shanks, |
+|               | Euler-Maclaurin...)                                       |
+
+Closed forms are found with dummy upper bounds and numeric bounds are
+substituted afterwards, so Sympy never adds millions of terms one by one.
+"""
+import math
+import mpmath
+import numpy as np
+import sympy as sp
+
+DIRECT_SUM_LIMIT = 1000
+""" Maximum number of terms added exactly when there is no closed form """
+
+VECTORIZED_SUM_CHUNK = 2 ** 20
+""" Terms evaluated at once by vectorized sums """
+
+CLOSED_FORM_TIME_CONSTRAINT = 5
+""" Maximum seconds spent looking for a closed form """
+
+
+def to_limits(iterators, name):
+    """
+    Convert iterators (`{i, imax}`, `{i, imin, imax}` or
+    `{i, imin, imax, di}`) to Sympy limits with unit step.
+
+    Return:
+        - Tuple with summand changes (dictionary) and list of limits
+        `(variable, min, max)`, outermost first.
+    """
+    changes = {}
+    limits = []
+
+    for iterator in iterators:
+        if not isinstance(iterator, list) or not 2 <= len(iterator) <= 4 \
+                or not isinstance(iterator[0], sp.Symbol):
+            raise Exception(
+                '{}: `{}` is not a valid iterator'.format(name, iterator))
+
+        variable = iterator[0]
+        bounds = [sp.sympify(bound) for bound in iterator[1:]]
+        if len(bounds) == 1:
+            bounds.insert(0, sp.Integer(1))
+
+        low, high = bounds[:2]
+        step = bounds[2] if len(bounds) == 3 else sp.Integer(1)
+
+        if step == 1 and not (low.is_number and not low.is_integer):
+            limits.append((variable, low, high))
+            continue
+
+        # i = imin + k di, k = 0, 1, ...
+        k = sp.Dummy(str(variable), integer=True, nonnegative=True)
+        changes[variable] = low + step * k
+        limits.append((k, sp.Integer(0), sp.floor((high - low) / step)))
+
+    return changes, limits
+
+
+def evaluate_summand(context, fn, iterators, changes):
+    """
+    Evaluate a held summand with iterator variables as symbols.
+    """
+    context.set_local_context(True)
+
+    for iterator in iterators:
+        context.set_user_variable(str(iterator[0]), iterator[0])
+
+    try:
+        summand = fn(context)
+    finally:
+        context.set_local_context(False)
+
+    if hasattr(summand, 'get_sympy'):
+        summand = summand.get_sympy()
+
+    return sp.sympify(summand).xreplace(changes)
+
+
+def is_finite(limits):
+    """
+    Return:
+        - True if all limits are finite numbers.
+    """
+    return all(
+        bound.is_number and bound.is_finite
+        for _, low, high in limits for bound in (low, high)
+    )
+
+
+def count_terms(limits):
+    return math.prod(max(0, int(high - low) + 1) for _, low, high in limits)
+
+
+def substitute(expr, mapping):
+    """
+    Substitute symbols without evaluating special functions, so
+    `harmonic(n, 2)` with `n = 10^7` isn't computed term by term.
+    """
+    if expr in mapping:
+        return mapping[expr]
+    if not expr.args:
+        return expr
+
+    args = [substitute(arg, mapping) for arg in expr.args]
+
+    if isinstance(expr, (sp.Add, sp.Mul, sp.Pow)):
+        return expr.func(*args)
+
+    try:
+        return expr.func(*args, evaluate=False)
+    except TypeError:
+        # Piecewise pairs and others don't have `evaluate` option.
+        return expr.func(*args)
+
+
+def closed_form(summand, limits):
+    """
+    Return:
+        - Sum in closed form or None.
+    """
+    bounds = {}
+    symbolic_limits = []
+
+    for variable, low, high in limits:
+        if high.is_Integer:
+            dummy = sp.Dummy('n', integer=True)
+            bounds[dummy] = high
+            high = dummy
+        symbolic_limits.append((variable, low, high))
+
+    # Sympy sums first limit first, it's the innermost one.
+    result = sp.summation(summand, *reversed(symbolic_limits))
+    if result.has(sp.Sum):
+        return None
+
+    return substitute(result, bounds)
+
+
+def direct_sum(summand, limits):
+    """
+    Add all terms exactly.
+    """
+    if not limits:
+        return summand
+
+    variable, low, high = limits[0]
+    terms = (
+        direct_sum(summand.xreplace({variable: value}), [
+            (inner, inner_low.xreplace({variable: value}),
+             inner_high.xreplace({variable: value}))
+            for inner, inner_low, inner_high in limits[1:]
+        ])
+        for value in range(int(low), int(high) + 1)
+    )
+
+    return sp.Add(*terms)
+
+
+def vectorized_sum(summand, limits):
+    """
+    Add all terms numerically, evaluating the lambdified summand over index
+    arrays. Bounds must be finite numbers.
+    """
+    variables = [variable for variable, _, _ in limits]
+    free_symbols = summand.free_symbols - set(variables)
+    if free_symbols:
+        raise Exception('Summand has non numeric symbols {}'.format(
+            free_symbols))
+
+    function = sp.lambdify(variables, summand, 'numpy')
+
+    ranges = [
+        np.arange(int(low), int(high) + 1, dtype=float)
+        for _, low, high in limits
+    ]
+    if any(len(indices) == 0 for indices in ranges):
+        return 0
+
+    # Outermost indices are chunked, inner indices are broadcasted.
+    inner = np.meshgrid(*ranges[1:], indexing='ij', sparse=True)
+    inner_size = math.prod(len(indices) for indices in ranges[1:])
+    chunk = max(1, VECTORIZED_SUM_CHUNK // inner_size)
+    shape_tail = tuple(len(indices) for indices in ranges[1:])
+
+    partials = []
+    for start in range(0, len(ranges[0]), chunk):
+        outer = ranges[0][start:start + chunk]
+        outer = outer.reshape((-1, ) + (1, ) * len(inner))
+        values = np.broadcast_to(
+            function(outer, *inner), (len(outer), ) + shape_tail)
+        partials.append(np.sum(values))
+
+    if any(np.iscomplexobj(partial) for partial in partials):
+        total = complex(np.sum(partials))
+        return total.real if total.imag == 0 else total
+
+    return math.fsum(partials)
+
+
+def accelerated_sum(summand, limits):
+    """
+    Add an infinite series numerically, with convergence acceleration.
+    """
+    def to_mpmath(bound):
+        if bound == sp.oo:
+            return mpmath.inf
+        if bound == -sp.oo:
+            return -mpmath.inf
+        return mpmath.mpf(float(bound))
+
+    variables = [variable for variable, _, _ in limits]
+    if summand.free_symbols - set(variables) or not all(
+        bound.is_number for _, low, high in limits for bound in (low, high)
+    ):
+        # Dependent bounds, Sympy handles them.
+        return sp.Sum(summand, *reversed(limits)).evalf()
+
+    function = sp.lambdify(variables, summand, 'mpmath')
+    result = mpmath.nsum(function, *[
+        [to_mpmath(low), to_mpmath(high)] for _, low, high in limits
+    ])
+
+    if isinstance(result, mpmath.mpc):
+        return complex(result)
+
+    return float(result)
@@ -6,7 +6,7 @@ class Node:
 
     def __init__(self, head, *childrens):
         self.head = head
-        self.childrens = childrens
+        self.childrens = list(childrens)
 
     def __repr__(self):
         if len(self.childrens) > 0:
@@ -48,7 +48,9 @@ class IdentifierTokenParser(BaseParser):
                 pos = pos + 1
                 continue
             elif ntok.get_type() == token_list.TOKEN_RIGHTSQUARE_BRACKETS:
-                arguments.append(arg[0] if len(arg) == 1 else arg)
+                if arg or arguments:
+                    # `f[]` has no arguments
+                    arguments.append(arg[0] if len(arg) == 1 else arg)
                 pos = pos + 1
                 break
 
@@ -133,6 +135,26 @@ class ListTokenParser(BaseParser):
         raise Exception()
 
 
+class AssociationTokenParser(BaseParser):
+    def read(self, tokens, toklen, pos, parser):
+        pos = pos + 1
+        arguments = []
+
+        while pos < toklen:
+            ntok = tokens[pos]
+
+            if ntok.get_type() == token_list.TOKEN_COMMA_SEPARATOR:
+                pos = pos + 1
+                continue
+            elif ntok.get_type() == token_list.TOKEN_RIGHTASSOCIATION:
+                pos = pos + 1
+                break
+            expr, pos = parser.compute_expr(tokens, toklen, pos)
+            arguments.append(expr)
+
+        return Node('Association', *arguments), pos
+
+
 class ParensParser(BaseParser):
     def read(self, tokens, toklen, pos, parser):
         expr, pos = parser.compute_expr(tokens, toklen, pos + 1)
@@ -150,8 +172,8 @@ class ParensParser(BaseParser):
 OpInfo = namedtuple('OpInfo', 'prec assoc function')
 
 BIN_OPINFO_MAP = {
-    '=': OpInfo(0, 'LEFT', 'Set'),
-    ':=': OpInfo(0, 'LEFT', 'Set'),
+    '=': OpInfo(0, 'RIGHT', 'Set'),
+    ':=': OpInfo(0, 'RIGHT', 'SetDelayed'),
     '<': OpInfo(0, 'LEFT', 'LessThan'),
     '<=': OpInfo(0, 'LEFT', 'LessEqual'),
     '>': OpInfo(0, 'LEFT', 'GreaterThan'),
@@ -162,6 +184,7 @@ BIN_OPINFO_MAP = {
 
 
     '/.': OpInfo(1, 'LEFT', 'ReplaceAll'),
+    '//.': OpInfo(1, 'LEFT', 'ReplaceRepeated'),
     '+': OpInfo(1, 'LEFT', 'Plus'),
     '-': OpInfo(1, 'LEFT', 'Minus'),
 
@@ -173,6 +196,9 @@ BIN_OPINFO_MAP = {
 
 }
 
+FLAT_OPERATORS = frozenset(('Plus', 'Product'))
+""" Associative operators, chains are flattened into one n-ary node """
+
 UNARY_OPINFO_MAP = {
     '++': OpInfo(None, None, 'Increment'),
     '--': OpInfo(None, None, 'Decrement'),
@@ -182,7 +208,8 @@ UNARY_OPINFO_MAP = {
 CLOSURE_TOKENS = [
     token_list.TOKEN_CLOSE_EXPR, token_list.TOKEN_NEWLINE,
     token_list.TOKEN_COMMA_SEPARATOR, token_list.TOKEN_RIGHTSQUARE_BRACKETS,
-    token_list.TOKEN_RIGHTLIST, token_list.TOKEN_RIGHTPAREN
+    token_list.TOKEN_RIGHTLIST, token_list.TOKEN_RIGHTPAREN,
+    token_list.TOKEN_RIGHTASSOCIATION
 ]
 
 
@@ -199,16 +226,25 @@ class Parser:
             token_list.TOKEN_LEFTPAREN: ParensParser(),
             token_list.TOKEN_IDENTIFIER: IdentifierTokenParser(),
             token_list.TOKEN_LEFTLIST: ListTokenParser(),
+            token_list.TOKEN_LEFTASSOCIATION: AssociationTokenParser(),
         }
 
     def compute_op(self, token, pos, toklen, tokens, minprec, atom_lhs):
         op = token.get_value()
 
-        if pos + 1 < toklen and \
-                tokens[pos + 1].get_type() == token_list.TOKEN_OP:
-            double_op = "".join([op, tokens[pos + 1].get_value()])
-            if double_op in BIN_OPINFO_MAP:
-                op = double_op
+        # Longest operator first, `//.` before `/.`
+        for length in (3, 2):
+            if pos + length > toklen or any(
+                tokens[index].get_type() != token_list.TOKEN_OP
+                for index in range(pos + 1, pos + length)
+            ):
+                continue
+
+            multiple_op = "".join(
+                tokens[index].get_value() for index in range(pos, pos + length))
+            if multiple_op in BIN_OPINFO_MAP:
+                op = multiple_op
+                break
 
         prec, assoc, node = BIN_OPINFO_MAP[op]
         if prec < minprec:
@@ -312,8 +348,26 @@ class Parser:
         return Node('Part', *arguments), pos
 
     def compute_binop(self, node, lhs, rhs):
+        if node in FLAT_OPERATORS:
+            return self.compute_flat_binop(node, lhs, rhs)
+
         return Node(node, lhs, rhs)
 
+    def compute_flat_binop(self, node, lhs, rhs):
+        # Left operand is extended in place, so a chain of n operands is
+        # built in linear time as a single n-ary node.
+        if isinstance(lhs, Node) and lhs.head == node:
+            flat_node = lhs
+        else:
+            flat_node = Node(node, lhs)
+
+        if isinstance(rhs, Node) and rhs.head == node:
+            flat_node.childrens.extend(rhs.childrens)
+        else:
+            flat_node.childrens.append(rhs)
+
+        return flat_node
+
     def compute_unary(self, node, lhs):
         return Node(node, lhs)
 
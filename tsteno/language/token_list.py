@@ -14,3 +14,5 @@ TOKEN_IDENTIFIER = 12
 TOKEN_NEWLINE = 13
 TOKEN_CLOSE_EXPR = 14
 TOKEN_DERIV = 15
+TOKEN_LEFTASSOCIATION = 16
+TOKEN_RIGHTASSOCIATION = 17
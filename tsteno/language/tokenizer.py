@@ -140,14 +140,31 @@ class MiscTokenReader(BaseTokenReader):
         ";": token_list.TOKEN_CLOSE_EXPR,
     }
 
+    DOUBLE_TOKEN_REFERENCES = {
+        # Associations
+        '<|': token_list.TOKEN_LEFTASSOCIATION,
+        '|>': token_list.TOKEN_RIGHTASSOCIATION,
+    }
+
     def __init__(self):
         super().__init__()
-        self.character_list = MiscTokenReader.TOKEN_REFERENCES.keys()
+        self.character_list = set(MiscTokenReader.TOKEN_REFERENCES) | set(
+            token[0] for token in MiscTokenReader.DOUBLE_TOKEN_REFERENCES)
 
     def match(self, character):
         return character in self.character_list
 
     def calculate(self, code, pos, max_len):
+        double_token = code[pos:pos + 2]
+        if double_token in MiscTokenReader.DOUBLE_TOKEN_REFERENCES:
+            return Token(
+                MiscTokenReader.DOUBLE_TOKEN_REFERENCES[double_token],
+                double_token, pos
+            ), pos + 2
+
+        if code[pos] not in MiscTokenReader.TOKEN_REFERENCES:
+            raise TokenError('Unknown character', code, pos, max_len)
+
         return Token(
             MiscTokenReader.TOKEN_REFERENCES[code[pos]], code[pos], pos
         ), pos + 1